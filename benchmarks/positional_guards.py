@@ -0,0 +1,127 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Compares the dict calling convention of guard with the positional one of
+check, on warm statements: the throughput, and the memory allocated per call
+as measured by tracemalloc.
+
+The values pass the statements, so both conventions return the shared OK
+result. The allocations are measured over batches, with the GuardArguments of
+a batch built before it is checked, as when validating rows: one call at a
+time, the dict is recycled by the CPython free lists and never reaches the
+allocator tracemalloc observes.
+
+Usage:
+
+    python -m benchmarks.positional_guards [count]
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, NoReturn, Tuple
+
+from olympus.monads.guards import check, guard
+
+"""
+The statements and the values checked against them.
+"""
+CASES: List[Tuple[str, str, object]] = [
+    ('age', 'required|ge[18]|le[120]', 42),
+    ('quantity', 'required|positive|lt[1000]', 7),
+    ('name', 'required|!empty|between[2, 20]', 'higor'),
+    ('code', 'required|in[BR, US, PT]', 'BR'),
+]
+
+
+def by_dict(name: str, statement: str, value: object) -> object:
+    return guard({'name': name, 'value': value}, statement)
+
+
+def by_position(name: str, statement: str, value: object) -> object:
+    return check(value, name, statement)
+
+
+def batch_by_dict(name: str, statement: str, values: List[object]) -> List[object]:
+    arguments = [{'name': name, 'value': value} for value in values]
+
+    return [guard(argument, statement) for argument in arguments]
+
+
+def batch_by_position(name: str, statement: str, values: List[object]) -> List[object]:
+    return [check(value, name, statement) for value in values]
+
+
+def measure(label: str, f: Callable[[str, str, object], object], count: int) -> float:
+    """
+    Runs a calling convention over the cases and prints its throughput.
+
+    :param label: The measure label.
+    :param f: The calling convention.
+    :param count: The number of rounds over the cases.
+
+    :return: Returns the calls per second.
+    """
+    start = time.perf_counter()
+
+    for _ in range(count):
+        for name, statement, value in CASES:
+            f(name, statement, value)
+
+    rate = count * len(CASES) / (time.perf_counter() - start)
+    print(f'{label:<32} {rate:>12,.0f} calls/s')
+
+    return rate
+
+
+def allocated(label: str, batch: Callable[[str, str, List[object]], object], count: int) -> float:
+    """
+    Measures the memory allocated by the calls of a batch, as the traced peak
+    during the batch over the traced memory before it, and prints its
+    average per call.
+
+    :param label: The measure label.
+    :param batch: The calling convention, over a batch of values.
+    :param count: The number of values of each batch.
+
+    :return: Returns the average bytes per call.
+    """
+    total = 0
+
+    tracemalloc.start()
+
+    try:
+        for name, statement, value in CASES:
+            values = [value] * count
+
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            batch(name, statement, values)
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+    average = total / (count * len(CASES))
+    print(f'{label:<32} {average:>12,.1f} bytes/call')
+
+    return average
+
+
+def main(count: int = 100000) -> NoReturn:
+    for name, statement, value in CASES:
+        # warms the statements cache
+        assert by_dict(name, statement, value) and by_position(name, statement, value), statement
+
+    legacy = measure('guard (dict)', by_dict, count)
+    current = measure('check (positional)', by_position, count)
+    print(f'{"speedup":<32} {current / legacy:>12.2f}x')
+
+    legacy = allocated('guard (dict)', batch_by_dict, count)
+    current = allocated('check (positional)', batch_by_position, count)
+    print(f'{"saved":<32} {legacy - current:>12,.1f} bytes/call')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,309 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Compares the cold-resolve throughput of the single pass StatementParser with
+the previous character by character parser, kept below as a reference.
+
+Every statement is distinct, as after a deploy when the statements cache is
+empty. The outputs of both parsers are checked to be identical.
+
+Usage:
+
+    python -m benchmarks.statement_parser [count]
+"""
+
+import re
+import sys
+import time
+from typing import Callable, List, NoReturn, Tuple, Union
+
+from olympus.monads.guards import Guards, StatementParser, registry
+from olympus.monads.guards.base import RawArg, ComplexArg
+from olympus.monads.guards.parser import InvalidPunctuatorError, ExpectedPunctuatorError
+
+
+class LegacyStatementParser:
+    def __init__(self, value: str):
+        self.value = value
+        self.pos = 0
+        self.length = len(value)
+
+    def _next(self, salt: int = 1) -> str:
+        if self.pos + salt - 1 < self.length:
+            return self.value[self.pos: self.pos + salt]
+        return ''
+
+    def _skip(self, n: int = 1) -> NoReturn:
+        self.pos += n
+
+    def _skip_whitespace(self) -> NoReturn:
+        while self._next().isspace():
+            self._skip()
+
+    def _skip_comma(self) -> NoReturn:
+        if self._next() == ',':
+            self._skip()
+
+    def _find(self, char: str) -> int:
+        return self.value.find(char, self.pos)
+
+    def _parse_escape(self) -> str:
+        if self._next() == '\\':
+            self._skip()
+            return self._next()
+        return ''
+
+    def _is_escape(self) -> bool:
+        return self._next() == '\\'
+
+    def _is_punctuator(self) -> bool:
+        return self._next() in ['(', ',', ')', '[', ']', '"', '|']
+
+    def _end(self) -> bool:
+        return self.pos >= self.length
+
+    def _parse_token(self) -> Union[RawArg, ComplexArg]:
+        token = ''
+
+        self._skip_whitespace()
+
+        while not self._end() and not self._is_punctuator():
+            if self._next() == '\\':
+                self._skip()
+                token += self._next()
+            elif self._next() == '"':
+                self._skip()
+                break
+            else:
+                token += self._next()
+            self._skip()
+
+        if token == '':
+            raise InvalidPunctuatorError(self.value, self.pos)
+
+        match token.strip().lower():
+            case 'true':
+                return True
+            case 'false':
+                return False
+            case 'none':
+                return None
+            case _:
+                if token.isnumeric():
+                    return int(token)
+                elif re.match(r'^\d+\.\d+$', token):
+                    return float(token)
+                else:
+                    return token
+
+    def _expect_args_punctuator(self, punctuator: str, message: str) -> bool:
+        self._skip_whitespace()
+
+        if self._end():
+            raise ExpectedPunctuatorError(self.value, self.pos, message or ' or '.join(punctuator))
+
+        if self._next() in punctuator:
+            return True
+
+        return False
+
+    def _parse_list(self) -> List[Union[RawArg, ComplexArg]] | None:
+        if self._next() == '[':
+            self._skip()
+
+            items = []
+
+            while True:
+                if self._expect_args_punctuator('][(r', 'Expected closing bracket ]'):
+                    self._skip()
+                    break
+
+                if self._next() == ',':
+                    self._skip()
+
+                items = self._parse_args()
+
+            return items
+
+        return None
+
+    def _parse_tuple(self) -> Tuple[Union[RawArg, ComplexArg], ...] | None:
+        if self._next() == '(':
+            self._skip()
+
+            items = []
+
+            while True:
+                if self._expect_args_punctuator(')[(r', 'Expected closing parenthesis.'):
+                    self._skip()
+                    break
+
+                if self._next() == ',':
+                    self._skip()
+
+                items.append(self._parse_args())
+
+            return tuple(*items)
+
+        return None
+
+    def _parse_regex(self) -> str | None:
+        regex = ''
+
+        if self._next(2) == 'r"':
+            self._skip(2)
+
+            while True:
+                if self._end():
+                    raise ExpectedPunctuatorError(self.value, self.pos, '"')
+
+                _next = self._next()
+
+                if _next == '\\':
+                    regex += self._parse_escape()
+                elif _next == '"':
+                    self._skip()
+                    break
+                else:
+                    regex += _next
+
+                self._skip()
+
+        return regex
+
+    def _parse_args(self) -> List[Union[RawArg, ComplexArg]]:
+        args = []
+
+        while True:
+            if self._expect_args_punctuator('])', 'Expected closing ] or )'):
+                break
+
+            if self._next() == ',':
+                self._skip()
+                self._skip_whitespace()
+
+            match self._next():
+                case '[':
+                    args.append(self._parse_list())
+                case '(':
+                    args.append(self._parse_tuple())
+                case 'r':
+                    args.append(self._parse_regex())
+                case _:
+                    args.append(self._parse_token())
+
+        return args
+
+    def _parse_guard(self) -> Tuple[bool, str, List[Union[RawArg, ComplexArg]]]:
+        negate = False
+        args = []
+
+        if self._next() == '!':
+            negate = True
+            self._skip()
+
+        name = self._parse_token().strip()
+
+        # the next punctuator must be [ ot (
+        if self._next() in ['[', '(']:
+            self._skip()
+            args = self._parse_args()
+            self._skip()
+
+        return negate, name, args
+
+    def parse(self) -> List[Tuple[bool, str, List[Union[RawArg, ComplexArg]]]]:
+        guards = []
+
+        while True:
+            self._skip_whitespace()
+
+            if self._end():
+                break
+
+            if self._next() == '|':
+                self._skip()
+                self._skip_whitespace()
+
+            guards.append(self._parse_guard())
+
+        return guards
+
+
+def statements(count: int) -> List[str]:
+    """
+    Builds distinct statements shaped like the ones generated from schemas.
+
+    :param count: The number of statements.
+
+    :return: Returns the statements.
+    """
+    return [
+        f'required|!empty|between[{i}, {i + 10}]|regex[r"^[a-z]{{{i % 9 + 1}}}\\\\d*$", i]|in[a{i}, b{i}, c{i}]'
+        if i % 2 else
+        f'  !required |  length({i}) | eq[(x{i}, {i}.5)]|ge[{i}]|le[{i * 2}]'
+        for i in range(count)
+    ]
+
+
+def measure(label: str, f: Callable[[str], object], items: List[str]) -> float:
+    """
+    Runs a function over every statement and prints its throughput.
+
+    :param label: The measure label.
+    :param f: The function.
+    :param items: The statements.
+
+    :return: Returns the statements per second.
+    """
+    start = time.perf_counter()
+
+    for item in items:
+        f(item)
+
+    rate = len(items) / (time.perf_counter() - start)
+    print(f'{label:<32} {rate:>12,.0f} statements/s')
+
+    return rate
+
+
+def cold_compile(parser: type) -> Callable[[str], object]:
+    """
+    Builds a cold resolve and compile function using a given parser.
+
+    :param parser: The parser class.
+
+    :return: Returns the function.
+    """
+
+    def compile_statement(statement: str) -> object:
+        previous = registry.StatementParser
+        registry.StatementParser = parser
+
+        try:
+            return Guards.compile(statement)
+        finally:
+            registry.StatementParser = previous
+
+    return compile_statement
+
+
+def main(count: int = 5000) -> NoReturn:
+    items = statements(count)
+
+    for item in items:
+        assert LegacyStatementParser(item).parse() == StatementParser(item).parse(), item
+
+    legacy = measure('parse (legacy)', lambda s: LegacyStatementParser(s).parse(), items)
+    current = measure('parse (single pass)', lambda s: StatementParser(s).parse(), items)
+    print(f'{"speedup":<32} {current / legacy:>12.2f}x')
+
+    legacy = measure('cold compile (legacy)', cold_compile(LegacyStatementParser), items)
+    current = measure('cold compile (single pass)', cold_compile(StatementParser), items)
+    print(f'{"speedup":<32} {current / legacy:>12.2f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
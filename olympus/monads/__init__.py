@@ -3,7 +3,7 @@
 # -----------------------------------------------------------------------------
 
 from .either import Either, left, right
-from .guards import Guards, guard, combine, guard_all
+from .guards import Guards, guard, combine, guard_all, compile_schema
 from .maybe import Maybe
 from .result import Result, W
 
@@ -19,6 +19,7 @@ __all__ = [
     'W',
     'guard',
     'guard_all',
+    'compile_schema',
     'combine',
     'left',
     'right',
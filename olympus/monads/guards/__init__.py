@@ -0,0 +1,172 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+The Guard pattern ir a monad which helps improve code readability and
+maintainability by avoiding nested if statements. Other advantages include:
+
+- It is easy to add new conditions.
+- It is easy to add new actions.
+- It helps to avoid code duplication.
+- It helps to avoid the use of exceptions for control flow.
+- It helps standardize messages and error handling.
+
+Example:
+
+    >>> Guards.guard({
+    ... 'name': 'age',
+    ... 'value': 18,
+    ... }, '!empty|lt[18]')
+    fail('age must be greater than 18')
+
+    >>> Guards.guard({
+    ... 'name': 'age',
+    ... 'value': 18,
+    ... }, '!empty|le[18]')
+    ok()
+
+In the example above, the guard method receives a dictionary with the name and
+value of the argument to be validated, and a string with the conditions to be
+checked. The conditions are separated by the pipe character (|). The first
+character of the condition is the operator. The rest of the condition is the
+argument of the operator. The operators are:
+
+- !: Negates the condition.
+- between: Checks if the length of the value is between the arguments.
+- empty: Checks if the value is empty.
+- eq: Checks if the value is equal to the argument.
+- even: Checks if the value is even.
+- ge: Checks if the value is greater than or equal to the argument.
+- gt: Checks if the value is greater than the argument.
+- in: Checks if the value is in the list of arguments.
+- length: Checks if the length of the value is equal to the argument.
+- le: Checks if the value is less than or equal to the argument.
+- lt: Checks if the value is less than the argument.
+- negative: Checks if the value is negative.
+- odd: Checks if the value is odd.
+- positive: Checks if the value is positive.
+- regex: Checks if the value matches the regular expression.
+- required: Checks if the value is not None.
+
+The operators can be combined using the pipe character (|). The conditions are
+evaluated in order. If a condition fails, the evaluation stops and the error
+message is returned. If all conditions pass, the evaluation stops and an empty
+string is returned.
+
+Argments can be passed to the operators using square brackets ([]). The
+arguments are separated by semicolons (;). The arguments are evaluated in order.
+If an argument is invalid, the evaluation stops and an error message is returned.
+Are supported the following types of arguments:
+
+- int: Integer.
+- float: Floating point number.
+- str: String.
+- list: List of strings.
+"""
+
+from .adaptive import AdaptiveGuard
+from .aot import compile_statements
+from .asynchronous import AsyncGuard, guard_async, guard_all_async
+from .base import GuardArgument, GuardResult, OK, RawArg, ComplexArg, IGuarder, AbstractGuard, InvalidArgumentError
+from .builders import Composed
+from .builtins import (
+    Required,
+    Empty,
+    Length,
+    Between,
+    Regex,
+    In,
+    LessThanOrEqual,
+    LessThan,
+    GreaterThanOrEqual,
+    GreaterThan,
+    Odd,
+    Even,
+    Positive,
+    Negative,
+    Equal,
+)
+from .cache import CacheInfo, StatementCache
+from .columns import ColumnResult, guard_column, vectorizer
+from .compiler import CompoundedGuard, compile_guards, compile_field
+from .members import MemberSet
+from .memo import Memo, MemoInfo
+from .optimizer import ContradictionError, Range, optimize
+from .parallel import guard_many
+from .parser import InvalidPunctuatorError, ExpectedPunctuatorError, StatementParser
+from .profiler import Profile, ProfileInfo, Profiler
+from .registry import Guards, CompiledModuleError, EvaluationErrorResult, InvalidStatementError, InvalidStatementResult, guard, check, guard_all, combine, guarder
+from .schema import Schema, compile_schema
+from .stream import guard_stream, guard_file, read_records
+from .templates import Bound, Template
+
+__all__ = [
+    'GuardArgument',
+    'GuardResult',
+    'OK',
+    'RawArg',
+    'ComplexArg',
+    'IGuarder',
+    'AbstractGuard',
+    'InvalidArgumentError',
+    'CompoundedGuard',
+    'AdaptiveGuard',
+    'compile_statements',
+    'AsyncGuard',
+    'Composed',
+    'guard_async',
+    'guard_all_async',
+    'ColumnResult',
+    'guard_column',
+    'vectorizer',
+    'CacheInfo',
+    'StatementCache',
+    'compile_guards',
+    'compile_field',
+    'MemberSet',
+    'Memo',
+    'MemoInfo',
+    'ContradictionError',
+    'Range',
+    'optimize',
+    'guard_many',
+    'InvalidPunctuatorError',
+    'ExpectedPunctuatorError',
+    'StatementParser',
+    'Profile',
+    'ProfileInfo',
+    'Profiler',
+    'Guards',
+    'CompiledModuleError',
+    'EvaluationErrorResult',
+    'InvalidStatementError',
+    'InvalidStatementResult',
+    'guard',
+    'check',
+    'guard_all',
+    'combine',
+    'guarder',
+    'Schema',
+    'compile_schema',
+    'guard_stream',
+    'guard_file',
+    'read_records',
+    'Bound',
+    'Template',
+    'Required',
+    'Empty',
+    'Length',
+    'Between',
+    'Regex',
+    'In',
+    'LessThanOrEqual',
+    'LessThan',
+    'GreaterThanOrEqual',
+    'GreaterThan',
+    'Odd',
+    'Even',
+    'Positive',
+    'Negative',
+    'Equal',
+]
@@ -0,0 +1,10 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import sys
+
+from .cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
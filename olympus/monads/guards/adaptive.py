@@ -0,0 +1,175 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Adaptive guard ordering. An adaptive statement samples its calls to measure
+the cost and the rejection rate of each guard, and periodically reorders its
+guards so the cheap guards that reject the most run first: 'required|regex[...]|
+in[...]' runs the in check before the regex when it rejects more traffic for
+less time.
+
+Only the leading run of pure guards is reordered; the guards from the first
+impure one on keep their position. Reordering never changes whether a value
+passes, but it may change which failure message is returned when a value
+fails several guards. Statements whose message precedence matters can be
+pinned; see Guards.pin.
+
+Example:
+
+    >>> Guards.adaptive()
+    >>> for value in traffic:
+    ...     guard({'name': 'code', 'value': value}, 'required|regex[r"^[A-Z]{3}$"]|in[@file:codes.txt]')
+
+    >>> Guards.pin('required|regex[r"^[A-Z]{3}$"]|in[@file:codes.txt]')
+
+Adaptive mode is off by default.
+"""
+
+from time import perf_counter_ns
+from typing import Any, Dict, List
+
+from .base import GuardArgument, GuardResult, IGuarder, OK
+from .compiler import CompoundedGuard, compile_guards
+from .optimizer import is_pure
+
+
+class AdaptiveGuard(CompoundedGuard):
+    """
+    A compound guard that reorders its leading pure guards from runtime
+    statistics. One call out of `sample` is observed: every guard of the
+    reordered run is evaluated and timed. After `period` observations the run
+    is sorted by expected cost, the mean cost divided by the rejection rate,
+    recompiled, and the statistics decay by half.
+
+    When a reordered guard raises, e.g. a comparison moved before the required
+    guard that rejected None, the run is evaluated again in statement order.
+    The run is pure, so the second evaluation has no side effects.
+    """
+
+    def __init__(self, guards: List[IGuarder], statement: str = '<guard>', sample: int = 64, period: int = 256):
+        super().__init__(guards, statement)
+
+        split = next((i for i, g in enumerate(guards) if not is_pure(g)), len(guards))
+
+        self.statement = statement
+        self.sample = sample
+        self.period = period
+        self.calls = 0
+        self.observed = 0
+        self.order = list(range(split))
+        self.costs = [0] * split
+        self.seen = [0] * split
+        self.rejected = [0] * split
+
+        if split < 2:
+            # nothing to reorder: the statement runs as a CompoundedGuard
+            return
+
+        self.pinned = self.ordered = compile_guards(guards[:split], statement).check
+        self.tail = compile_guards(guards[split:], statement).check if split < len(guards) else None
+        self.check = self._adaptive
+        self.is_satisfied_by = self._unpack
+
+    def _unpack(self, argument: GuardArgument) -> GuardResult:
+        return self._adaptive(argument['value'], argument['name'])
+
+    def _adaptive(self, value: Any, name: Any) -> GuardResult:
+        self.calls += 1
+
+        if self.calls % self.sample == 0:
+            r = self._observe(value, name)
+        else:
+            try:
+                r = self.ordered(value, name)
+            except Exception:
+                if self.ordered is self.pinned:
+                    raise
+                r = self.pinned(value, name)
+
+        if not r or self.tail is None:
+            return r
+
+        return self.tail(value, name)
+
+    def _observe(self, value: Any, name: Any) -> GuardResult:
+        """
+        Evaluates and times every guard of the reordered run.
+
+        :param value: The value.
+        :param name: The argument name.
+
+        :return: Returns the first failure in the current order, or OK.
+        """
+        failure = None
+
+        for i in self.order:
+            start = perf_counter_ns()
+
+            try:
+                r = self.guards[i].check(value, name)
+            except Exception:
+                if failure is None:
+                    # raises or fails as the statement order does
+                    failure = self.pinned(value, name)
+                r = None
+
+            self.costs[i] += perf_counter_ns() - start
+            self.seen[i] += 1
+
+            if not r:
+                self.rejected[i] += 1
+
+                if failure is None:
+                    failure = r
+
+        self.observed += 1
+
+        if self.observed >= self.period:
+            self._reorder()
+
+        return OK if failure is None else failure
+
+    def _reorder(self) -> None:
+        """
+        Sorts the run by expected cost and recompiles it. Guards that never
+        rejected go last, in statement order.
+        """
+
+        def rank(i: int) -> float:
+            return self.costs[i] / self.rejected[i] if self.rejected[i] else float('inf')
+
+        order = sorted(range(len(self.order)), key=lambda i: (rank(i), i))
+
+        if order != self.order:
+            self.order = order
+
+            if order == sorted(order):
+                self.ordered = self.pinned
+            else:
+                self.ordered = compile_guards([self.guards[i] for i in order], self.statement).check
+
+        self.observed = 0
+        self.costs = [cost // 2 for cost in self.costs]
+        self.seen = [seen // 2 for seen in self.seen]
+        self.rejected = [rejected // 2 for rejected in self.rejected]
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Gets the statistics of the reordered run, in the current order.
+
+        :return: Returns, for each guard, the guard, the observed calls, the
+        rejection rate and the mean cost in nanoseconds.
+        """
+        return [
+            {
+                'guard': self.guards[i],
+                'seen': self.seen[i],
+                'rejection': self.rejected[i] / self.seen[i] if self.seen[i] else 0.0,
+                'cost': self.costs[i] / self.seen[i] if self.seen[i] else 0.0,
+            }
+            for i in self.order
+        ]
+
+    def __repr__(self):
+        return f"AdaptiveGuard({self.statement}, {[self.guards[i] for i in self.order]})"
@@ -0,0 +1,181 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Ahead-of-time compilation. compile_statements writes the statements used by a
+service as a Python module: the parsed statements, the guarders they use, with
+their versions, and the compiled functions of the statements. Loading the
+module with Guards.load_compiled fills the statements cache without parsing,
+generating or compiling any statement.
+
+Example:
+
+    >>> compile_statements(['required|between[1, 10]', '!empty|lt[18]'], out='guards_compiled.py')
+
+    >>> import guards_compiled
+    >>> Guards.load_compiled(guards_compiled)
+
+The arguments of the guards are not part of the compiled functions, which read
+them from the guards, so statements differing only by their arguments, such
+as between[1, 10] and between[2, 20], share one function in the module. Each
+function is emitted as a factory that binds the guards of a statement,
+created from its parsed arguments when the module is loaded.
+
+The module is checked against the live registry when loaded: every guarder
+must be the same class, at the same version. A module compiled against other
+guarders, or another version of them, is rejected with a CompiledModuleError;
+compile it again. Bump the version of a guard whenever its arguments or its
+behavior change; see AbstractGuard.version.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .base import IGuarder
+from .compiler import FORMAT, _namespace, statement_source
+from .optimizer import Range
+from .parser import StatementParser, canonical
+from .registry import Guards
+
+"""
+The package imported by compiled modules.
+"""
+_PACKAGE = __name__.rpartition('.')[0]
+
+"""
+A name of the namespace of a compiled statement: a guard, one of its
+constants, or its message parameters.
+"""
+_NAME = re.compile(r'^_(g|p)(\d+)(?:_(\w+))?$')
+
+
+def _accessor(name: str, guards: List[IGuarder]) -> str:
+    """
+    Gets the expression reading a name of the namespace of a compiled
+    statement from its guards. See the compiler module for the names.
+
+    Raises:
+
+        ValueError: If the name is not bound by the compiler.
+
+    :param name: The namespace name.
+    :param guards: The resolved guards.
+
+    :return: Returns the expression, reading the guards from `guards`.
+    """
+    match = _NAME.match(name)
+
+    if match is None:
+        raise ValueError(f"Cannot bind {name} of a compiled statement")
+
+    kind, i, attr = match.group(1), int(match.group(2)), match.group(3)
+    g = f'guards[{i}]'
+
+    if kind == 'p':
+        return f'{g}.params()'
+
+    if attr is None:
+        return g
+
+    if isinstance(guards[i], Range) and attr in ('lower', 'upper'):
+        return f'{g}.{attr} and {g}.{attr}[0]'
+
+    if attr.isdigit():
+        return f'{g}.args[{attr}]'
+
+    if attr == 'args':
+        return f'{g}.args'
+
+    return f'{g}.constants()[{attr!r}]'
+
+
+def _factory(name: str, source: str, bindings: Sequence[str]) -> List[str]:
+    """
+    Emits the factory of a compiled statement: a function receiving the
+    resolved guards of a statement and returning its compiled function, with
+    the namespace bound as closure variables.
+    """
+    return [
+        f'def {name}(guards):',
+        *(f'    {binding}' for binding in bindings),
+        *(f'    {line}' for line in source.splitlines()),
+        '    return compiled',
+    ]
+
+
+def compile_statements(statements: Iterable[str], out: Optional[str] = None) -> str:
+    """
+    Compiles statements ahead of time into the source of a Python module; see
+    the module docs.
+
+    Raises:
+
+        InvalidStatementError: If a statement is invalid.
+
+    :param statements: The guard statements.
+    :param out: The path the module is written to, if any.
+
+    :return: Returns the module source.
+    """
+    helpers = _namespace()
+    guarders = {}
+    factories: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+    code = []
+    entries = []
+
+    for statement in dict.fromkeys(statements):
+        guards = Guards.resolve(statement)
+        raw = StatementParser(statement).parse()
+
+        for _, name, _ in raw:
+            cls = Guards.get(name)
+            guarders[name] = (f'{cls.__module__}:{cls.__qualname__}', getattr(cls, 'version', None))
+
+        source, namespace = statement_source(guards)
+        bindings = tuple(
+            f'{name} = {_accessor(name, guards)}'
+            for name in namespace if name not in helpers and re.search(rf'\b{name}\b', source)
+        )
+
+        # statements differing only by their arguments share their factory
+        factory = factories.get((source, bindings))
+
+        if factory is None:
+            factory = factories[source, bindings] = f'_f{len(factories)}'
+            code += [*_factory(factory, source, bindings), '', '']
+
+        entries.append(f'    ({statement!r}, {canonical(raw)!r}, {raw!r}, {len(guards)}, {factory}),')
+
+    lines = [
+        '"""',
+        'Guard statements compiled ahead of time. Generated by',
+        f'{_PACKAGE}.compile_statements; do not edit.',
+        '"""',
+        '',
+        'import re',
+        '',
+        f'from {_PACKAGE} import GuardResult, OK',
+        f'from {_PACKAGE}.base import SIZED',
+        '',
+        f'FORMAT = {FORMAT}',
+        '',
+        'GUARDERS = {',
+        *(f'    {name!r}: {guarder!r},' for name, guarder in sorted(guarders.items())),
+        '}',
+        '',
+        '',
+        *code,
+        'STATEMENTS = [',
+        *entries,
+        ']',
+        '',
+    ]
+
+    module = '\n'.join(lines)
+
+    if out is not None:
+        with open(out, 'w', encoding='utf-8') as f:
+            f.write(module)
+
+    return module
@@ -0,0 +1,266 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Async guards. A guard that must wait on I/O, such as a uniqueness check
+against a database, extends AsyncGuard and implements is_satisfied_by_async.
+Statements using async guards are evaluated with guard_async and
+guard_all_async: the synchronous guards run inline, compiled as usual, and
+the async guards are awaited in statement order.
+
+Example:
+
+    >>> @guarder('unique_email')
+    ... class UniqueEmail(AsyncGuard):
+    ...     message = '{name} is already taken'
+    ...     timeout = 0.5
+    ...
+    ...     async def is_satisfied_by_async(self, argument):
+    ...         taken = await db.exists('users', email=argument['value'])
+    ...         return self.fail(argument) if taken != self.negate else OK
+
+    >>> await guard_all_async(
+    ...     {'email': 'joe@mail.com', 'login': 'joe'},
+    ...     {'email': 'required|unique_email', 'login': 'required|unique_login'},
+    ...     limit=8
+    ... )
+    ok()
+
+The fields of guard_all_async are evaluated concurrently with asyncio.gather;
+the limit bounds the async guards running at once and a timeout bounds each
+async guard call. A guard that times out fails with its timeout_message, and
+a guard that raises with an EvaluationErrorResult, unless in strict mode.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .base import AbstractGuard, GuardArgument, GuardResult, IGuarder, OK
+from .cache import StatementCache
+from .compiler import compile_guards
+from .registry import EvaluationErrorResult, Guards, InvalidStatementError, InvalidStatementResult
+
+
+class AsyncGuard(AbstractGuard):
+    """
+    An abstract class for guards evaluated asynchronously. Async guards cannot
+    be evaluated by the synchronous guard functions.
+    """
+
+    """
+    The maximum time, in seconds, of a call; None defers to the timeout of
+    the guard_async or guard_all_async call.
+    """
+    timeout: Optional[float] = None
+
+    """
+    The error message of a call that timed out.
+    """
+    timeout_message: str = '{name} could not be validated in {timeout} seconds'
+
+    async def is_satisfied_by_async(self, argument: GuardArgument) -> GuardResult:
+        """
+        Validates an argument. Async guards must implement it.
+
+        Raises:
+
+            NotImplementedError: If the guard does not implement it.
+
+        :param argument: The argument.
+
+        :return: Returns a GuardResult.
+        """
+        raise NotImplementedError(f"Guard {self.name} does not implement is_satisfied_by_async")
+
+    def is_satisfied_by(self, argument: GuardArgument) -> GuardResult:
+        raise TypeError(f"Guard {self.name} is asynchronous, use guard_async or guard_all_async")
+
+
+"""
+A type alias for the steps of an async statement: a compiled run of
+synchronous guards or an async guard.
+"""
+Step = Union[Callable[[GuardArgument], GuardResult], AsyncGuard]
+
+"""
+The steps of async statements, by statement. Statements without async
+guards have no steps.
+"""
+__plans__: StatementCache[List[Step]] = StatementCache()
+
+Guards.__dependents__.append(__plans__)
+
+
+def _plan(statement: str) -> List[Step]:
+    """
+    Splits a resolved statement into steps, compiling each run of synchronous
+    guards into a single function.
+
+    :param statement: The guard statement.
+
+    :return: Returns the steps, or an empty list when the statement has no
+    async guard.
+    """
+    guards = Guards.resolve(statement)
+
+    if not any(isinstance(g, AsyncGuard) for g in guards):
+        return []
+
+    steps: List[Step] = []
+    run: List[IGuarder] = []
+
+    for g in guards:
+        if not isinstance(g, AsyncGuard):
+            run.append(g)
+            continue
+
+        if run:
+            steps.append(compile_guards(run, statement))
+            run = []
+
+        steps.append(g)
+
+    if run:
+        steps.append(compile_guards(run, statement))
+
+    return steps
+
+
+async def _call(
+        g: AsyncGuard,
+        statement: str,
+        argument: GuardArgument,
+        semaphore: Optional[asyncio.Semaphore],
+        timeout: Optional[float]
+) -> GuardResult:
+    """
+    Awaits an async guard, within the concurrency limit and the timeout. A
+    guard that raises fails with an EvaluationErrorResult, unless in strict
+    mode.
+    """
+    timeout = g.timeout if g.timeout is not None else timeout
+
+    try:
+        if semaphore is None:
+            return await asyncio.wait_for(g.is_satisfied_by_async(argument), timeout)
+
+        async with semaphore:
+            return await asyncio.wait_for(g.is_satisfied_by_async(argument), timeout)
+    except asyncio.TimeoutError:
+        return GuardResult(False, g.timeout_message.format(name=argument['name'], timeout=timeout))
+    except Exception as e:
+        if Guards.__strict__:
+            raise
+
+        return EvaluationErrorResult(statement, argument['name'], e)
+
+
+async def _evaluate(
+        statement: str,
+        argument: GuardArgument,
+        message: Optional[str],
+        semaphore: Optional[asyncio.Semaphore],
+        timeout: Optional[float]
+) -> GuardResult:
+    """
+    Evaluates a statement, awaiting its async guards in statement order.
+    """
+    steps = __plans__.get(statement)
+
+    if steps is None:
+        try:
+            steps = __plans__.get_or_create(statement, _plan, counted=True)
+        except InvalidStatementError as e:
+            if Guards.__strict__:
+                raise
+
+            return InvalidStatementResult(e)
+
+    if not steps:
+        return Guards.guard(argument, statement, message)
+
+    for step in steps:
+        if isinstance(step, AsyncGuard):
+            r = await _call(step, statement, argument, semaphore, timeout)
+        else:
+            try:
+                r = step(argument)
+            except Exception as e:
+                if Guards.__strict__:
+                    raise
+
+                return EvaluationErrorResult(statement, argument['name'], e)
+
+        if not r:
+            return GuardResult(False, message) if message else r
+
+    return OK
+
+
+async def guard_async(
+        arg: GuardArgument,
+        statement: str,
+        message: Optional[str] = None,
+        timeout: Optional[float] = None
+) -> GuardResult:
+    """
+    Validates an argument against a statement that may use async guards. See
+    the guard function for the statement format.
+
+    Invalid statements fail with an InvalidStatementResult, and guards
+    raising while evaluating a value with an EvaluationErrorResult; both
+    raise in strict mode, see the Guards.strict method.
+
+    Raises:
+
+        InvalidStatementError: If the statement is invalid, in strict mode.
+        Exception: The error of a guard raising, in strict mode.
+
+    :param arg: The guard argument.
+    :param statement: Guard string.
+    :param message: A personalized message in case of an error.
+    :param timeout: The maximum time, in seconds, of each async guard call.
+
+    :return: Returns a GuardResult.
+    """
+    return await _evaluate(statement, arg, message, None, timeout)
+
+
+async def guard_all_async(
+        values: Dict[str, Any],
+        guards: Dict[str, str],
+        messages: Dict[str, str] = None,
+        limit: Optional[int] = None,
+        timeout: Optional[float] = None
+) -> GuardResult:
+    """
+    Guards all arguments in a dictionary, evaluating the fields concurrently.
+    Equivalent to guard_all, awaiting the async guards. See the guard_async
+    function.
+
+    :param values: the dict containing values
+    :param guards: the dict containing guards
+    :param messages: the dict containing custom messages
+    :param limit: The maximum number of async guard calls running at once.
+    :param timeout: The maximum time, in seconds, of each async guard call.
+
+    :return: A combination of guard results
+    """
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    results = await asyncio.gather(*(
+        _evaluate(
+            guards[key],
+            {
+                'name': key,
+                'value': value
+            },
+            messages[key] if messages and key in messages else None,
+            semaphore,
+            timeout
+        )
+        for key, value in values.items() if key in guards
+    ))
+
+    return Guards.combine(results)
@@ -0,0 +1,345 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+The base types shared by every guard: the argument and result wrappers, the
+argument type aliases and the guarder interfaces.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, List, Union, Optional, TypedDict, Tuple, Dict
+
+class GuardArgument(TypedDict):
+    """
+    A wrapper for guard arguments.
+    """
+    name: str
+    value: Any
+
+
+@dataclass(frozen=True, eq=True)
+class GuardResult:
+    """
+    A wrapper for guard results. A GuardResult is frozen and immutable.
+
+    The message of a failure can be rendered lazily: a failure created with
+    the failing guard, the argument name and the message parameters renders
+    its message when it is first read, by the message attribute or
+    get_message, and keeps it. Failures that are only tested with bool never
+    format their message.
+    """
+
+    def __init__(
+            self,
+            success: bool,
+            message: Optional[str] = None,
+            guard: Optional['IGuarder'] = None,
+            name: Any = None,
+            params: Optional[Dict[str, Any]] = None
+    ):
+        object.__setattr__(self, 'success', success)
+        object.__setattr__(self, '_message', message)
+        object.__setattr__(self, 'guard', guard)
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'params', params)
+
+    def is_satisfied(self):
+        return object.__getattribute__(self, 'success')
+
+    @property
+    def message(self) -> Optional[str]:
+        """
+        The message, rendered on first access.
+        """
+        message = object.__getattribute__(self, '_message')
+
+        if message is None and self.guard is not None:
+            message = self.guard.parse(name=self.name, **(self.params or {}))
+            object.__setattr__(self, '_message', message)
+
+        return message
+
+    def get_message(self):
+        return self.message
+
+    def __bool__(self):
+        return self.is_satisfied()
+
+    def __repr__(self):
+        if self.is_satisfied():
+            return f'ok()'
+        return f'fail({self.get_message()})'
+
+
+"""
+The successful result, shared by every guard.
+"""
+OK = GuardResult(True, None)
+
+
+class InvalidArgumentError(ValueError):
+    """
+    An exception for guard arguments rejected when the statement is resolved.
+    """
+
+    def __init__(self, guard: str, reason: str):
+        super().__init__(f"Invalid arguments for guard {guard}: {reason}")
+        self.guard = guard
+        self.reason = reason
+
+
+"""
+A type alias for raw arguments.
+"""
+RawArg = Union[bool, int, float, str, None]
+
+"""
+A type alias for complex arguments.
+"""
+ComplexArg = Union[List[RawArg], Tuple[RawArg, ...]]
+
+"""
+The types whose emptiness is measured by their length.
+"""
+SIZED = frozenset((str, list, tuple, dict))
+
+
+class IGuarder(ABC):
+    """
+    An interface for rules.
+    """
+
+    @abstractmethod
+    def is_satisfied_by(self, *args) -> GuardResult:
+        """
+        Validates an argument.
+        """
+        ...
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        """
+        Validates a value, given with its argument name. By default, the
+        argument is built and given to is_satisfied_by.
+        """
+        return self.is_satisfied_by({'name': name, 'value': value})
+
+    @classmethod
+    def new(cls, *args) -> 'IGuarder':
+        """
+        Creates a new instance of the rule.
+
+        :param args: The rule arguments.
+
+        :return: Returns a new instance of the rule.
+        """
+        ...
+
+    def parse(self, **kwargs) -> str:
+        """
+        Parses the rule to string.
+
+        :return: Returns a string.
+        """
+        ...
+
+
+class AbstractGuard(IGuarder):
+    """
+    An abstract class for rules.
+    """
+
+    """
+    The error message.
+    """
+    message: str = ''
+
+    """
+    The guard arguments.
+    """
+    args: List[Union[RawArg, ComplexArg]]
+
+    """
+    The guard name.
+    """
+    name: str = ''
+
+    """
+    The guard negation.
+    """
+    negation: str = 'not'
+
+    """
+    The guard condition as a Python expression, used by the compiler to inline
+    the guard into the compiled statement. The expression reads the checked
+    value from `value`; the placeholders {0}, {1}, ... are bound to the guard
+    arguments, {args} to the whole argument list and named placeholders to
+    the guard constants. Guards without an expression are called through
+    is_satisfied_by.
+    """
+    expression: Optional[str] = None
+
+    """
+    The guard condition specialized by the kind of the checked value, used by
+    the compiler in the branches of the statements for the types of
+    SPECIALIZED (see the compiler module): 'sized' for the types of SIZED and
+    'scalar' for the others, None excluded. A specialized condition drops the
+    type tests of the expression, and may be the constant True or False.
+    Guards without a specialization use the expression for every type.
+    """
+    expressions: Dict[str, str] = {}
+
+    """
+    Whether the guard has no side effects and its result depends only on the
+    value and the arguments. The optimizer only rewrites pure guards.
+    """
+    pure: bool = False
+
+    """
+    The side ('lower' or 'upper') and strictness of numeric bound guards, which
+    the optimizer merges into a single range check.
+    """
+    bound: Optional[Tuple[str, bool]] = None
+
+    """
+    The guard version, part of the registry fingerprint. Bump it when the
+    arguments or the behavior of the guard change, to invalidate the persisted
+    statements; see the Guards.persist method.
+    """
+    version: int = 1
+
+    def __init__(self, negate: bool, name: str, args: List[Union[RawArg, ComplexArg]] = None):
+        self.negate = negate
+        self.name = name
+        self.args = args or []
+
+    def is_satisfied_by(self, argument: GuardArgument) -> GuardResult:
+        """
+        Validates an argument. Guards implement either is_satisfied_by or
+        check; by default, the argument is unpacked and given to check.
+        """
+        return self.check(argument['value'], argument['name'])
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        """
+        Validates a value, given with its argument name. The positional
+        calling convention of the compiled statements, which saves building a
+        GuardArgument per call; see the check function. By default, the
+        argument is built and given to is_satisfied_by.
+
+        Raises:
+
+            NotImplementedError: If the guard implements neither check nor
+            is_satisfied_by.
+
+        :param value: The value.
+        :param name: The argument name.
+
+        :return: Returns a GuardResult.
+        """
+        if type(self).is_satisfied_by is AbstractGuard.is_satisfied_by:
+            raise NotImplementedError(f"Guard {self.name} implements neither check nor is_satisfied_by")
+
+        return self.is_satisfied_by({'name': name, 'value': value})
+
+    def parse(self, **kwargs) -> str:
+        """
+        Parses the arguments to a string.
+
+        Injections:
+
+            negation: Inject the negation (not) if the guard is negated.
+            custom: Inject custom arguments in key-value format.
+
+        Example:
+
+            >>> Required(True, 'name').parse()
+            'name not is required'
+
+            >>> Length(False, 'name', [1]).parse({'length': 10})
+            'name must be of length 10'
+
+        :param kwargs: Custom injections.
+
+        :return: Returns a string.
+        """
+
+        cls = type(self)
+
+        injections = {
+            'name': self.name,
+            'not': ' ' + cls.negation + ' ' if self.negate else ' ',
+            **kwargs
+        }
+
+        return self.message.format(**injections)
+
+    def fail(self, argument: GuardArgument, **kwargs) -> GuardResult:
+        """
+        Creates the failure of an argument. See the reject method.
+
+        :param argument: The failing argument.
+        :param kwargs: Custom injections.
+
+        :return: Returns a failing GuardResult.
+        """
+        return self.reject(argument['name'], **kwargs)
+
+    def reject(self, name: Any, **kwargs) -> GuardResult:
+        """
+        Creates the failure of a value, by its argument name. The message is
+        rendered by parse, with the argument name and the custom injections,
+        when it is first read.
+
+        :param name: The argument name.
+        :param kwargs: Custom injections.
+
+        :return: Returns a failing GuardResult.
+        """
+        return GuardResult(False, None, self, name, kwargs)
+
+    def params(self) -> Dict[str, Any]:
+        """
+        Gets the custom injections of the error message, except the argument
+        name.
+
+        Example:
+
+            >>> Length(False, 'length', [10]).params()
+            {'length': 10}
+
+        :return: Returns a dict of injections.
+        """
+        return {}
+
+    def predicate(self) -> Tuple[Any, bool]:
+        """
+        Gets the identity of the tested condition and whether the condition
+        must hold. Two pure guards with the same identity test the same
+        condition, so the optimizer drops the second one when the expected
+        outcomes match and reports a contradiction otherwise.
+
+        :return: Returns the condition identity and its expected outcome.
+        """
+        return (type(self), repr(self.args)), not self.negate
+
+    def constants(self) -> Dict[str, Any]:
+        """
+        Gets the values prepared at resolve time that the expression refers
+        to by name, e.g. a compiled regular expression.
+
+        :return: Returns a dict of constants.
+        """
+        return {}
+
+    @classmethod
+    def new(cls, *args) -> 'IGuarder':
+        """
+        Creates a new instance of the rule.
+
+        :param args: The rule arguments.
+
+        :return: Returns a new instance of the rule.
+        """
+        return cls(*args)
@@ -0,0 +1,273 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Guard objects. The builders compose guards with Python operators instead of
+the statement language: & chains guards and ~ negates a guard.
+
+Example:
+
+    >>> name = Required() & ~Empty() & Between(3, 20) & Regex(r'^\\w+$')
+    >>> guard({'name': 'login', 'value': 'jo'}, name)
+    fail(login must be between 3 and 20)
+
+    >>> guard_all(user, {'login': name, 'age': Required() & GreaterThanOrEqual(18)})
+    ok()
+
+A guard object is usable wherever a statement is: guard, guard_all, Schema
+and the results they return to Result.from_guard. It is compiled on its first
+call, never parsed, into the compiled guard of the equivalent statement, which
+it then keeps, so the later calls skip the statements cache. Custom guarders
+are composed with Composed.of:
+
+    >>> Required() & Composed.of('unique_email')
+
+The builders have the names of the builtin guard classes but live in this
+module only; import them from olympus.monads.guards.builders.
+"""
+
+from typing import Any, List, Tuple, Union
+
+from .base import ComplexArg, GuardArgument, GuardResult, IGuarder, RawArg
+from .compiler import CompoundedGuard
+from .parser import canonical
+from .registry import Guards
+
+"""
+A type alias for parsed guards: the negation, the name and the arguments.
+"""
+RawGuard = Tuple[bool, str, List[Union[RawArg, ComplexArg]]]
+
+
+class Composed(IGuarder):
+    """
+    A chain of guards, evaluated in order like the guards of a statement.
+    """
+
+    def __init__(self, *guards: RawGuard):
+        self.guards = guards
+
+    @classmethod
+    def of(cls, name: str, *args: Union[RawArg, ComplexArg]) -> 'Composed':
+        """
+        Builds a guard by its registered name.
+
+        :param name: The guard name.
+        :param args: The guard arguments.
+
+        :return: Returns a guard object.
+        """
+        return Composed((False, name, list(args)))
+
+    @property
+    def statement(self) -> str:
+        """
+        The canonical key of the equivalent statement.
+        """
+        return canonical(list(self.guards))
+
+    def __and__(self, other: Union['Composed', str]) -> 'Composed':
+        if isinstance(other, str):
+            return Composed(*self.guards, *Guards.parse(other))
+
+        if not isinstance(other, Composed):
+            return NotImplemented
+
+        return Composed(*self.guards, *other.guards)
+
+    def __rand__(self, other: str) -> 'Composed':
+        if not isinstance(other, str):
+            return NotImplemented
+
+        return Composed(*Guards.parse(other), *self.guards)
+
+    def __invert__(self) -> 'Composed':
+        if len(self.guards) != 1:
+            raise TypeError('Only single guards can be negated')
+
+        negate, name, args = self.guards[0]
+
+        return Composed((not negate, name, args))
+
+    def resolve(self) -> List[IGuarder]:
+        """
+        Resolves the guards. See the Guards.resolve method.
+
+        Raises:
+
+            InvalidStatementError: If the guards cannot be resolved.
+
+        :return: Returns the resolved guards.
+        """
+        return Guards.resolve_parsed(list(self.guards), self.statement)
+
+    def compile(self) -> CompoundedGuard:
+        """
+        Compiles the guards, sharing the compiled guard of the equivalent
+        statement. See the Guards.build method.
+
+        Raises:
+
+            InvalidStatementError: If the guards cannot be resolved.
+
+        :return: Returns the compiled guard.
+        """
+        return Guards.build(list(self.guards))
+
+    def _bind(self) -> None:
+        """
+        Compiles the guards; the compiled functions then shadow the
+        is_satisfied_by and check methods.
+        """
+        g = self.compile()
+
+        self.is_satisfied_by = g.is_satisfied_by
+        self.check = g.check
+
+    def is_satisfied_by(self, argument: GuardArgument) -> GuardResult:
+        """
+        Validates an argument. The first call compiles the guards.
+
+        Raises:
+
+            InvalidStatementError: If the guards cannot be resolved.
+        """
+        self._bind()
+
+        return self.is_satisfied_by(argument)
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        """
+        Validates a value, given with its argument name. The first call
+        compiles the guards.
+
+        Raises:
+
+            InvalidStatementError: If the guards cannot be resolved.
+        """
+        self._bind()
+
+        return self.check(value, name)
+
+    def __getstate__(self):
+        # the compiled function is not pickled, e.g. to worker processes
+        return {'guards': self.guards}
+
+    def __eq__(self, other):
+        return isinstance(other, Composed) and self.guards == other.guards
+
+    def __hash__(self):
+        return hash(self.statement)
+
+    def __repr__(self):
+        return ' & '.join(f"{'~' if negate else ''}Composed.of({', '.join(map(repr, [name, *args]))})"
+                          for negate, name, args in self.guards)
+
+    def __str__(self):
+        return self.statement
+
+
+def Required() -> Composed:
+    """
+    The required guard.
+    """
+    return Composed.of('required')
+
+
+def Empty() -> Composed:
+    """
+    The empty guard.
+    """
+    return Composed.of('empty')
+
+
+def Length(length: int) -> Composed:
+    """
+    The length guard.
+    """
+    return Composed.of('length', length)
+
+
+def Between(min: RawArg, max: RawArg) -> Composed:
+    """
+    The between guard.
+    """
+    return Composed.of('between', min, max)
+
+
+def Regex(pattern: str, *options: str) -> Composed:
+    """
+    The regex guard, with its flags and match mode; see the Regex guard.
+    """
+    return Composed.of('regex', pattern, *options)
+
+
+def In(*members: RawArg) -> Composed:
+    """
+    The in guard. The members are the arguments, or a single list.
+    """
+    return Composed.of('in', *members)
+
+
+def LessThanOrEqual(max: RawArg) -> Composed:
+    """
+    The le guard.
+    """
+    return Composed.of('le', max)
+
+
+def LessThan(max: RawArg) -> Composed:
+    """
+    The lt guard.
+    """
+    return Composed.of('lt', max)
+
+
+def GreaterThanOrEqual(min: RawArg) -> Composed:
+    """
+    The ge guard.
+    """
+    return Composed.of('ge', min)
+
+
+def GreaterThan(min: RawArg) -> Composed:
+    """
+    The gt guard.
+    """
+    return Composed.of('gt', min)
+
+
+def Odd() -> Composed:
+    """
+    The odd guard.
+    """
+    return Composed.of('odd')
+
+
+def Even() -> Composed:
+    """
+    The even guard.
+    """
+    return Composed.of('even')
+
+
+def Positive() -> Composed:
+    """
+    The positive guard.
+    """
+    return Composed.of('positive')
+
+
+def Negative() -> Composed:
+    """
+    The negative guard.
+    """
+    return Composed.of('negative')
+
+
+def Equal(expected: Union[RawArg, ComplexArg]) -> Composed:
+    """
+    The eq guard.
+    """
+    return Composed.of('eq', expected)
@@ -0,0 +1,535 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+The default guarders. They are registered in the Guards registry as soon as
+the guards package is imported.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple, Union
+
+from .base import AbstractGuard, GuardResult, InvalidArgumentError, RawArg, ComplexArg, OK, SIZED
+from .members import MemberSet
+from .registry import guarder
+
+
+@guarder(name='required')
+class Required(AbstractGuard):
+    """
+    Validates that the argument is not None.
+    """
+
+    message = '{name}{not}is required'
+    expression = '(len(value) != 0) if type(value) in SIZED else (value is not None)'
+    expressions = {'sized': 'len(value) != 0', 'scalar': 'True'}
+    pure = True
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+
+        if type(value) in SIZED:
+            is_present = len(value) != 0
+        else:
+            is_present = value is not None
+
+        if (self.negate and is_present) or (not self.negate and not is_present):
+            return self.reject(name)
+
+        return OK
+
+    def predicate(self) -> Tuple[Any, bool]:
+        return 'present', not self.negate
+
+    def __repr__(self):
+        return f"Required({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='empty')
+class Empty(AbstractGuard):
+    """
+    Validates that the argument is empty.
+    """
+
+    message = '{name} must{not}be empty'
+    expression = '(len(value) == 0) if type(value) in SIZED else (value is None)'
+    expressions = {'sized': 'len(value) == 0', 'scalar': 'False'}
+    pure = True
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+
+        if type(value) in SIZED:
+            is_empty = len(value) == 0
+        else:
+            is_empty = value is None
+
+        if (self.negate and is_empty) or (not self.negate and not is_empty):
+            return self.reject(name)
+
+        return OK
+
+    def predicate(self) -> Tuple[Any, bool]:
+        return 'present', self.negate
+
+    def __repr__(self):
+        return f"Empty({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='length')
+class Length(AbstractGuard):
+    """
+    Validates that the argument has a specific length.
+    """
+
+    message = '{name} must{not}have of length {length}'
+    expression = 'len(value) == {0}'
+    pure = True
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        is_length = len(value) == self.args[0]
+
+        if (self.negate and is_length) or (not self.negate and not is_length):
+            return self.reject(name, length=self.args[0])
+
+        return OK
+
+    def params(self) -> Dict[str, Any]:
+        return {'length': self.args[0]}
+
+    def __repr__(self):
+        return f"Length({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='between')
+class Between(AbstractGuard):
+    """
+    Validates that the argument has a length between two values.
+    """
+
+    message = '{name} must{not}be between {min} and {max}'
+    expression = '{0} <= (len(value) if type(value) in SIZED else value) <= {1}'
+    expressions = {'sized': '{0} <= len(value) <= {1}', 'scalar': '{0} <= value <= {1}'}
+    pure = True
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+
+        if type(value) in SIZED:
+            value = len(value)
+
+        is_between = self.args[0] <= value <= self.args[1]
+
+        if (self.negate and is_between) or (not self.negate and not is_between):
+            return self.reject(name, min=self.args[0], max=self.args[1])
+
+        return OK
+
+    def params(self) -> Dict[str, Any]:
+        return {'min': self.args[0], 'max': self.args[1]}
+
+    def __repr__(self):
+        return f"Between({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='regex')
+class Regex(AbstractGuard):
+    """
+    Validates that the argument matches the regular expression. The pattern is
+    compiled once, when the statement is resolved.
+
+    The arguments after the pattern are flags (i/ignorecase, m/multiline,
+    s/dotall, x/verbose, a/ascii) and the match mode (match, fullmatch or
+    search). The default mode is match.
+
+    Example:
+
+        >>> guard({'name': 'code', 'value': 'ab1'}, 'regex[r"^[a-z]+$", i, fullmatch]')
+        fail(code must match the regular expression ^[a-z]+$)
+    """
+
+    message = '{name} must{not}match the regular expression {regex}'
+    expression = '{matcher}(value)'
+    pure = True
+
+    """
+    The supported flags by name.
+    """
+    flags = {
+        'i': re.IGNORECASE,
+        'ignorecase': re.IGNORECASE,
+        'm': re.MULTILINE,
+        'multiline': re.MULTILINE,
+        's': re.DOTALL,
+        'dotall': re.DOTALL,
+        'x': re.VERBOSE,
+        'verbose': re.VERBOSE,
+        'a': re.ASCII,
+        'ascii': re.ASCII,
+    }
+
+    """
+    The supported match modes.
+    """
+    modes = ('match', 'fullmatch', 'search')
+
+    def __init__(self, negate: bool, name: str, args: List[Union[RawArg, ComplexArg]] = None):
+        super().__init__(negate, name, args)
+
+        if not self.args or not isinstance(self.args[0], str):
+            raise InvalidArgumentError(name, 'expected a regular expression')
+
+        flags = 0
+        mode = 'match'
+
+        for option in self.args[1:]:
+            option = str(option).strip().lower()
+
+            if option in self.modes:
+                mode = option
+            elif option in self.flags:
+                flags |= self.flags[option]
+            else:
+                raise InvalidArgumentError(name, f'unknown regular expression option {option}')
+
+        try:
+            self.pattern = re.compile(self.args[0], flags)
+        except re.error as e:
+            raise InvalidArgumentError(name, f'invalid regular expression {self.args[0]} ({e})') from e
+
+        self.matcher = getattr(self.pattern, mode)
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        is_match = self.matcher(value)
+
+        if (self.negate and is_match) or (not self.negate and not is_match):
+            return self.reject(name, regex=self.args[0])
+
+        return OK
+
+    def params(self) -> Dict[str, Any]:
+        return {'regex': self.args[0]}
+
+    def constants(self) -> Dict[str, Any]:
+        return {'matcher': self.matcher}
+
+    def __repr__(self):
+        return f"Regex({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='in')
+class In(AbstractGuard):
+    """
+    Validates that the argument is in the list. The members are the guard
+    arguments (in[a, b, c]) or a single list argument (in[[a, b, c]]). A
+    single @file:path argument loads the members from a text file, one per
+    line; see MemberSet.from_file.
+
+    The members are indexed in a MemberSet when the statement is resolved.
+    """
+
+    message = '{name} must{not}be in the list {list}'
+    expression = '{contains}(value)'
+    pure = True
+
+    """
+    The prefix of file references.
+    """
+    file_prefix = '@file:'
+
+    def __init__(self, negate: bool, name: str, args: List[Union[RawArg, ComplexArg]] = None):
+        super().__init__(negate, name, args)
+
+        members = self.args
+
+        if len(members) == 1 and isinstance(members[0], list):
+            members = members[0]
+
+        if len(members) == 1 and isinstance(members[0], str) and members[0].startswith(self.file_prefix):
+            try:
+                self.members = MemberSet.from_file(members[0][len(self.file_prefix):])
+            except OSError as e:
+                raise InvalidArgumentError(name, f'cannot read {members[0]} ({e})') from e
+        else:
+            self.members = MemberSet(members)
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        is_in = self.members.contains(value)
+
+        if (self.negate and is_in) or (not self.negate and not is_in):
+            return self.reject(name, list=self.members)
+
+        return OK
+
+    def params(self) -> Dict[str, Any]:
+        return {'list': self.members}
+
+    def constants(self) -> Dict[str, Any]:
+        return {'contains': self.members.contains}
+
+    def __repr__(self):
+        return f"In({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='le')
+class LessThanOrEqual(AbstractGuard):
+    """
+    Validates that the argument is less than or equal to the value.
+    """
+
+    message = '{name} must{not}be less than or equal to {max}'
+    expression = 'value <= {0}'
+    pure = True
+    bound = ('upper', False)
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        is_less_or_equal = value <= self.args[0]
+
+        if (self.negate and is_less_or_equal) or (not self.negate and not is_less_or_equal):
+            return self.reject(name, max=self.args[0])
+
+        return OK
+
+    def params(self) -> Dict[str, Any]:
+        return {'max': self.args[0]}
+
+    def __repr__(self):
+        return f"LessThanOrEqual({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='lt')
+class LessThan(AbstractGuard):
+    """
+    Validates that the argument is less than the value.
+    """
+
+    message = '{name} must{not}be less than {max}'
+    expression = 'value < {0}'
+    pure = True
+    bound = ('upper', True)
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        is_less = value < self.args[0]
+
+        if (self.negate and is_less) or (not self.negate and not is_less):
+            return self.reject(name, max=self.args[0])
+
+        return OK
+
+    def params(self) -> Dict[str, Any]:
+        return {'max': self.args[0]}
+
+    def __repr__(self):
+        return f"LessThan({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='ge')
+class GreaterThanOrEqual(AbstractGuard):
+    """
+    Validates that the argument is greater than or equal to the value.
+    """
+
+    message = '{name} must{not}be greater than or equal to {min}'
+    expression = 'value >= {0}'
+    pure = True
+    bound = ('lower', False)
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        is_greater = value >= self.args[0]
+
+        if (self.negate and is_greater) or (not self.negate and not is_greater):
+            return self.reject(name, min=self.args[0])
+
+        return OK
+
+    def params(self) -> Dict[str, Any]:
+        return {'min': self.args[0]}
+
+    def __repr__(self):
+        return f"GreaterThenOrEqual({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='gt')
+class GreaterThan(AbstractGuard):
+    """
+    Validates that the argument is greater than the value.
+    """
+
+    message = '{name} must{not}be greater than {min}'
+    expression = 'value > {0}'
+    pure = True
+    bound = ('lower', True)
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        is_greater = value > self.args[0]
+
+        if (self.negate and is_greater) or (not self.negate and not is_greater):
+            return self.reject(name, min=self.args[0])
+
+        return OK
+
+    def params(self) -> Dict[str, Any]:
+        return {'min': self.args[0]}
+
+    def __repr__(self):
+        return f"GreaterThan({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='odd')
+class Odd(AbstractGuard):
+    """
+    Validates that the argument is odd.
+    """
+
+    message = '{name} must{not}be odd'
+    expression = 'value % 2 != 0'
+    pure = True
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        is_odd = value % 2 != 0
+
+        if (self.negate and is_odd) or (not self.negate and not is_odd):
+            return self.reject(name)
+
+        return OK
+
+    def __repr__(self):
+        return f"Odd({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='even')
+class Even(AbstractGuard):
+    """
+    Validates that the argument is even.
+    """
+
+    message = '{name} must{not}be even'
+    expression = 'value % 2 == 0'
+    pure = True
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        is_even = value % 2 == 0
+
+        if (self.negate and is_even) or (not self.negate and not is_even):
+            return self.reject(name)
+
+        return OK
+
+    def __repr__(self):
+        return f"Even({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='positive')
+class Positive(AbstractGuard):
+    """
+    Validates that the argument is positive.
+    """
+
+    message = '{name} must{not}be positive'
+    expression = 'value >= 0'
+    pure = True
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        is_positive = value >= 0
+
+        if (self.negate and is_positive) or (not self.negate and not is_positive):
+            return self.reject(name)
+
+        return OK
+
+    def __repr__(self):
+        return f"Positive({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='negative')
+class Negative(AbstractGuard):
+    """
+    Validates that the argument is negative.
+    """
+
+    message = '{name} must{not}be negative'
+    expression = 'value < 0'
+    pure = True
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        is_negative = value < 0
+
+        if (self.negate and is_negative) or (not self.negate and not is_negative):
+            return self.reject(name)
+
+        return OK
+
+    def __repr__(self):
+        return f"Negative({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@guarder(name='eq')
+class Equal(AbstractGuard):
+    """
+    Validates that the argument is equal to the value.
+    """
+
+    message = '{name} must{not}be equal to {value}'
+    expression = 'value == {0}'
+    pure = True
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+
+        try:
+            is_equal = value == self.args[0]
+        except IndexError:
+            is_equal = False
+
+        if (self.negate and is_equal) or (not self.negate and not is_equal):
+            return self.reject(name, value=self.args[0])
+
+        return OK
+
+    def params(self) -> Dict[str, Any]:
+        return {'value': self.args[0]}
+
+    def __repr__(self):
+        return f"Equal({self.negate}, {self.args})"
+
+    def __str__(self):
+        return self.__repr__()
@@ -0,0 +1,229 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+A bounded, least recently used cache for compiled guard statements. Statements
+built at runtime (e.g. f'between[{lo}, {hi}]') would otherwise leave one
+compiled guard per distinct string in memory for the lifetime of the process.
+
+Example:
+
+    >>> cache = StatementCache(2)
+    >>> cache['required'] = Guards.compile('required')
+    >>> cache['odd'] = Guards.compile('odd')
+    >>> cache.get('required')
+    CompoundedGuard(False, CompoundedGuard, [Required(False, [])])
+    >>> cache['even'] = Guards.compile('even')
+    >>> cache.info()
+    CacheInfo(hits=1, misses=0, evictions=1, maxsize=2, currsize=2)
+
+The cache is safe to share between threads. Reads take no lock; writes are
+serialized, and get_or_create computes a missing value once however many
+threads ask for it at the same time. The statistics are not locked and may
+lose increments under contention.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Generic, NamedTuple, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of a StatementCache.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class StatementCache(Generic[T]):
+    """
+    A mapping from statement to compiled guard with LRU eviction. A maxsize of
+    None disables the bound.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1024):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('The cache maxsize must be a positive integer or None')
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: 'OrderedDict[str, T]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+
+    def get(self, statement: str) -> Optional[T]:
+        """
+        Gets a cached value and marks it as recently used.
+
+        :param statement: The statement.
+
+        :return: Returns the cached value or None.
+        """
+        value = self._data.get(statement)
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        try:
+            self._data.move_to_end(statement)
+        except KeyError:
+            # evicted by another thread since the lookup
+            pass
+
+        self.hits += 1
+
+        return value
+
+    def get_or_create(self, statement: str, factory: Callable[[str], T], counted: bool = False) -> T:
+        """
+        Gets a cached value, creating and caching it when missing. Concurrent
+        calls for the same missing statement are single-flight: the first one
+        runs the factory and the others wait for its result, or its error.
+
+        The lookup counts a miss when the factory runs and a hit otherwise,
+        unless the caller has counted it already with get.
+
+        :param statement: The statement.
+        :param factory: Creates the value of the statement.
+        :param counted: Whether the lookup was counted by a previous get.
+
+        :return: Returns the cached or created value.
+        """
+        with self._lock:
+            value = self._data.get(statement)
+
+            if value is None:
+                future = self._pending.get(statement)
+                owner = future is None
+
+                if owner:
+                    future = self._pending[statement] = Future()
+
+        if not counted:
+            if value is None and owner:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if value is not None:
+            return value
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = factory(statement)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self[statement] = value
+            future.set_result(value)
+        finally:
+            with self._lock:
+                del self._pending[statement]
+
+        return value
+
+    def __getitem__(self, statement: str) -> T:
+        value = self.get(statement)
+
+        if value is None:
+            raise KeyError(statement)
+
+        return value
+
+    def __setitem__(self, statement: str, value: T) -> None:
+        if self.maxsize == 0:
+            return
+
+        with self._lock:
+            self._data[statement] = value
+            self._data.move_to_end(statement)
+            self._evict()
+
+    def __delitem__(self, statement: str) -> None:
+        with self._lock:
+            del self._data[statement]
+
+    def discard(self, statement: str) -> None:
+        """
+        Removes a statement, if cached.
+
+        :param statement: The statement.
+
+        :return: Returns nothing.
+        """
+        with self._lock:
+            self._data.pop(statement, None)
+
+    def __contains__(self, statement: str) -> bool:
+        return statement in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def resize(self, maxsize: Optional[int]) -> None:
+        """
+        Changes the cache capacity, evicting the least recently used entries
+        that no longer fit.
+
+        :param maxsize: The new capacity, or None for an unbounded cache.
+
+        :return: Returns nothing.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('The cache maxsize must be a positive integer or None')
+
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Drops the least recently used entries above the capacity. The caller
+        holds the lock.
+
+        :return: Returns nothing.
+        """
+        if self.maxsize is None:
+            return
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        """
+        Gets the cache statistics.
+
+        :return: Returns a CacheInfo.
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets the statistics.
+
+        :return: Returns nothing.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self):
+        return f"StatementCache({self.maxsize}, {list(self._data)})"
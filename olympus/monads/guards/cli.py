@@ -0,0 +1,200 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+The guards command line. The validate command runs a schema over a JSONL, JSON
+or CSV file and prints a summary: the throughput, the failure counts per field
+and guard, and the first failures.
+
+Usage:
+
+    python -m olympus.monads.guards validate --schema schema.json data.jsonl --workers 8 --fail-fast
+
+The schema file maps each field to its statement, or holds the statements
+and the personalized messages:
+
+    {"name": "required|length[3]", "age": "ge[18]"}
+
+    {"guards": {"age": "ge[18]"}, "messages": {"age": "too young"}}
+
+Custom guarders are registered by importing the modules that define them:
+--plugins myapp.guards. The exit status is 0 when every record is valid, 1
+when some record fails and 2 on usage errors.
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from .parallel import guard_many
+from .schema import compile_schema
+from .stream import read_records
+
+"""
+The conversions available to CSV columns.
+"""
+TYPES = {'int': int, 'float': float, 'str': str, 'bool': lambda value: value.lower() in ('1', 'true', 'yes')}
+
+
+class _Counted:
+    """
+    An iterable that counts the items drawn from it.
+    """
+
+    def __init__(self, items: Iterable[Any]):
+        self.items = items
+        self.count = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        for item in self.items:
+            self.count += 1
+            yield item
+
+
+def _schema(path: str) -> Tuple[Dict[str, str], Optional[Dict[str, str]]]:
+    """
+    Loads a schema file.
+
+    Raises:
+
+        ValueError: If the file is not a schema.
+
+    :param path: The schema path.
+
+    :return: Returns the statements and the messages.
+    """
+    with open(path, encoding='utf-8') as f:
+        schema = json.load(f)
+
+    if not isinstance(schema, dict):
+        raise ValueError(f"Invalid schema {path}: expected a JSON object")
+
+    if isinstance(schema.get('guards'), dict):
+        guards, messages = schema['guards'], schema.get('messages')
+    else:
+        guards, messages = schema, None
+
+    if not all(isinstance(statement, str) for statement in guards.values()):
+        raise ValueError(f"Invalid schema {path}: every field must map to a statement string")
+
+    if messages is not None and (not isinstance(messages, dict)
+                                 or not all(isinstance(message, str) for message in messages.values())):
+        raise ValueError(f"Invalid schema {path}: the messages must map fields to strings")
+
+    return guards, messages
+
+
+def _types(specs: Sequence[str]) -> Dict[str, Any]:
+    """
+    Parses FIELD=TYPE conversions.
+    """
+    types = {}
+
+    for spec in specs:
+        field, _, name = spec.partition('=')
+
+        if name not in TYPES:
+            raise ValueError(f"Unknown type {name!r} for {field}, expected one of {', '.join(TYPES)}")
+
+        types[field] = TYPES[name]
+
+    return types
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m olympus.monads.guards', description='Olympus guards.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    validate = commands.add_parser('validate', help='validate the records of a JSONL, JSON or CSV file')
+    validate.add_argument('data', help='the JSONL, JSON or CSV file')
+    validate.add_argument('--schema', required=True, help='the JSON schema file')
+    validate.add_argument('--workers', type=int, default=1, help='the number of worker processes (default: 1)')
+    validate.add_argument('--chunksize', type=int, default=256, help='the records sent to a worker at once')
+    validate.add_argument('--fail-fast', action='store_true', help='report the first failure of each record only')
+    validate.add_argument('--show', type=int, default=10, metavar='N', help='print the first N failures (default: 10)')
+    validate.add_argument('--format', choices=('jsonl', 'json', 'csv'), help='the file format, guessed from the extension')
+    validate.add_argument('--type', action='append', default=[], metavar='FIELD=TYPE',
+                          help=f"convert a CSV column ({', '.join(TYPES)})")
+    validate.add_argument('--mmap', action='store_true', help='read the file through a memory map')
+    validate.add_argument('--plugins', action='append', default=[], metavar='MODULE',
+                          help='import a module registering custom guarders; repeatable or comma separated')
+
+    return parser
+
+
+def validate(args: argparse.Namespace, out: TextIO) -> int:
+    """
+    Runs the validate command.
+
+    :param args: The parsed arguments.
+    :param out: The output stream.
+
+    :return: Returns the exit status.
+    """
+    plugins = [plugin for value in args.plugins for plugin in value.split(',') if plugin]
+
+    for plugin in plugins:
+        importlib.import_module(plugin)
+
+    guards, messages = _schema(args.schema)
+
+    # compiled here first, so schema errors are reported before any worker starts
+    schema = compile_schema(guards, messages)
+
+    records = _Counted(read_records(args.data, args.format, _types(args.type), use_mmap=args.mmap))
+    counts: Counter = Counter()
+    failed = set()
+    first: List[Tuple[int, str, Optional[str], str]] = []
+
+    start = time.perf_counter()
+
+    for failure in guard_many(records, schema, workers=args.workers, chunksize=args.chunksize,
+                              fail_fast=args.fail_fast, plugins=plugins):
+        index, field, g, _ = failure
+        counts[field, g] += 1
+        failed.add(index)
+
+        if len(first) < args.show:
+            first.append(failure)
+
+    elapsed = time.perf_counter() - start
+    throughput = records.count / elapsed if elapsed else 0.0
+
+    out.write(f"validated {records.count} records in {elapsed:.2f}s ({throughput:,.0f} records/s)\n")
+    out.write(f"failed records: {len(failed)}\n")
+
+    if counts:
+        out.write('failures by field and guard:\n')
+
+        for (field, g), count in counts.most_common():
+            out.write(f"  {field:<20} {g or '?':<12} {count}\n")
+
+        out.write(f"first {len(first)} failures:\n")
+
+        for index, field, g, message in first:
+            out.write(f"  #{index} {field}: {message}\n")
+
+    return 1 if failed else 0
+
+
+def main(argv: Optional[Sequence[str]] = None, out: TextIO = sys.stdout) -> int:
+    """
+    Runs the command line.
+
+    :param argv: The arguments, sys.argv by default.
+    :param out: The output stream.
+
+    :return: Returns the exit status.
+    """
+    args = _parser().parse_args(argv)
+
+    try:
+        return validate(args, out)
+    except (OSError, ValueError, TypeError, SyntaxError, KeyError, ImportError) as e:
+        sys.stderr.write(f"error: {e}\n")
+        return 2
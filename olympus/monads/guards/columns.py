@@ -0,0 +1,295 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Column validation. A statement is checked against a whole column of values at
+once: over a numeric NumPy array, the builtin numeric guards run as array
+operations and only the failing values are materialized into GuardResults.
+
+Example:
+
+    >>> mask, indices, failures = guard_column('age', numpy.array([20, 15, 30]), 'required|ge[18]')
+    >>> mask
+    array([ True, False,  True])
+    >>> indices
+    array([1])
+    >>> failures
+    [fail(age must be greater than or equal to 18)]
+
+Guards without a vectorizer, such as custom guarders, are evaluated element by
+element, on the values still passing only. Columns that are not numeric, and
+every column when NumPy is not installed, go through the per-element path.
+
+NumPy is an optional dependency: pip install olympus[numpy].
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Type
+
+from .base import GuardResult, IGuarder
+from .builtins import (
+    Required,
+    Empty,
+    Between,
+    In,
+    LessThanOrEqual,
+    LessThan,
+    GreaterThanOrEqual,
+    GreaterThan,
+    Odd,
+    Even,
+    Positive,
+    Negative,
+    Equal,
+)
+from .compiler import compile_field
+from .optimizer import Range
+from .registry import Guards
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+"""
+A type alias for vectorizers: receives the guard and the column, and returns a
+boolean array telling which values hold the guard, ignoring its negation, or
+None when the guard cannot be vectorized with its arguments.
+"""
+Vectorizer = Callable[[IGuarder, Any], Optional[Any]]
+
+"""
+The vectorizers by guard class.
+"""
+__vectorizers__: Dict[Type[IGuarder], Vectorizer] = {}
+
+"""
+The dtype kinds vectorized: booleans, signed and unsigned integers and floats.
+"""
+_NUMERIC = 'biuf'
+
+
+class ColumnResult(NamedTuple):
+    """
+    The result of a column: the boolean mask of passing values, the indices of
+    the failing values and their failures, in the same order.
+    """
+    mask: Any
+    indices: Any
+    failures: List[GuardResult]
+
+    def is_satisfied(self) -> bool:
+        return len(self.failures) == 0
+
+
+def vectorizer(cls: Type[IGuarder]):
+    """
+    A decorator for registering the vectorizer of a guard class. Vectorizers
+    apply to the exact class only, since subclasses may override check or
+    is_satisfied_by.
+    """
+
+    def decorator(f: Vectorizer) -> Vectorizer:
+        __vectorizers__[cls] = f
+        return f
+
+    return decorator
+
+
+def _numbers(values) -> bool:
+    """
+    Checks if guard arguments are numbers, and so comparable with a numeric
+    column the same way they compare with its elements.
+    """
+    return all(type(value) in (int, float, bool) for value in values)
+
+
+def _number(g: IGuarder) -> bool:
+    """
+    Checks if the first argument of a guard is a number.
+    """
+    return len(g.args) > 0 and _numbers(g.args[:1])
+
+
+@vectorizer(Required)
+def _required(g: Required, column):
+    return numpy.ones(len(column), dtype=bool)
+
+
+@vectorizer(Empty)
+def _empty(g: Empty, column):
+    return numpy.zeros(len(column), dtype=bool)
+
+
+@vectorizer(Between)
+def _between(g: Between, column):
+    if len(g.args) < 2 or not _numbers(g.args[:2]):
+        return None
+
+    return (g.args[0] <= column) & (column <= g.args[1])
+
+
+@vectorizer(In)
+def _in(g: In, column):
+    members = list(g.members)
+
+    if not _numbers(members):
+        return None
+
+    return numpy.isin(column, members)
+
+
+@vectorizer(LessThanOrEqual)
+def _le(g: LessThanOrEqual, column):
+    return column <= g.args[0] if _number(g) else None
+
+
+@vectorizer(LessThan)
+def _lt(g: LessThan, column):
+    return column < g.args[0] if _number(g) else None
+
+
+@vectorizer(GreaterThanOrEqual)
+def _ge(g: GreaterThanOrEqual, column):
+    return column >= g.args[0] if _number(g) else None
+
+
+@vectorizer(GreaterThan)
+def _gt(g: GreaterThan, column):
+    return column > g.args[0] if _number(g) else None
+
+
+@vectorizer(Odd)
+def _odd(g: Odd, column):
+    return column % 2 != 0
+
+
+@vectorizer(Even)
+def _even(g: Even, column):
+    return column % 2 == 0
+
+
+@vectorizer(Positive)
+def _positive(g: Positive, column):
+    return column >= 0
+
+
+@vectorizer(Negative)
+def _negative(g: Negative, column):
+    return column < 0
+
+
+@vectorizer(Equal)
+def _eq(g: Equal, column):
+    return column == g.args[0] if _number(g) else None
+
+
+@vectorizer(Range)
+def _range(g: Range, column):
+    holds = numpy.ones(len(column), dtype=bool)
+
+    if g.lower is not None:
+        holds &= (g.lower[0] < column) if g.lower[1] else (g.lower[0] <= column)
+
+    if g.upper is not None:
+        holds &= (column < g.upper[0]) if g.upper[1] else (column <= g.upper[0])
+
+    return holds
+
+
+def _array(values: Sequence[Any]):
+    """
+    Converts a column into a numeric array.
+
+    Raises:
+
+        ValueError: If the column is not one-dimensional.
+
+    :param values: The column.
+
+    :return: Returns the array, or None when the column is not numeric or
+    NumPy is not installed.
+    """
+    if numpy is None:
+        return None
+
+    array = numpy.asarray(values)
+
+    if array.ndim != 1:
+        raise ValueError(f"Expected a one-dimensional column, got {array.ndim} dimensions")
+
+    return array if array.dtype.kind in _NUMERIC else None
+
+
+def guard_column(
+        name: str,
+        values: Sequence[Any],
+        statement: str,
+        message: Optional[str] = None
+) -> ColumnResult:
+    """
+    Validates every value of a column against a statement. Equivalent to
+    calling the guard function for each value, with the same messages.
+
+    The mask and the indices are NumPy arrays when NumPy is installed, and
+    lists otherwise.
+
+    Raises:
+
+        InvalidStatementError: If the statement is invalid.
+        ValueError: If the column is not one-dimensional.
+
+    :param name: The argument name.
+    :param values: The column, a NumPy array or any sequence.
+    :param statement: Guard string.
+    :param message: A personalized message in case of an error.
+
+    :return: Returns a ColumnResult.
+    """
+    guards = Guards.resolve(statement)
+
+    check = compile_field(guards, name, message, statement)
+    array = _array(values)
+
+    if array is None:
+        results = [check(value) for value in values]
+        mask = [bool(r) for r in results]
+        indices = [i for i, holds in enumerate(mask) if not holds]
+        failures = [results[i] for i in indices]
+
+        if numpy is not None:
+            return ColumnResult(numpy.array(mask, dtype=bool), numpy.array(indices, dtype=numpy.intp), failures)
+
+        return ColumnResult(mask, indices, failures)
+
+    mask = numpy.ones(len(array), dtype=bool)
+
+    for g in guards:
+        vectorize = __vectorizers__.get(type(g))
+        holds = vectorize(g, array) if vectorize is not None else None
+
+        if holds is not None:
+            mask &= holds != g.negate
+            continue
+
+        # per-element fallback, on the values that passed the previous guards
+        single = compile_field([g], name, statement=statement)
+        pending = numpy.flatnonzero(mask)
+        mask[pending] = numpy.fromiter(
+            (bool(single(value)) for value in array[pending].tolist()),
+            dtype=bool,
+            count=len(pending)
+        )
+
+    indices = numpy.flatnonzero(~mask)
+
+    # the failing values are checked again to render the message of their
+    # first failing guard, as the per-element path does
+    if isinstance(values, numpy.ndarray):
+        failing = array[indices].tolist()
+    else:
+        failing = [values[i] for i in indices.tolist()]
+
+    failures = [check(value) for value in failing]
+
+    return ColumnResult(mask, indices, failures)
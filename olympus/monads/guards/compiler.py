@@ -0,0 +1,513 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+
+"""
+The guard compiler. A statement is resolved once into a list of guards and then
+compiled into a single Python function: the condition of each builtin guard is
+inlined, with its negation and arguments baked in as constants. The compiled
+function avoids the per-guard method calls and the argument lookups of the
+interpreted CompoundedGuard; failure messages are rendered lazily, see
+GuardResult.
+
+The body of a statement is compiled twice: as check(value, name), the
+positional calling convention that needs no GuardArgument, and as
+compiled(argument), which unpacks the argument. The guards that are not
+inlined are called through check, unless they implement is_satisfied_by
+only.
+
+Statements are specialized by the type of the checked value: a value of a
+type of SPECIALIZED, ints and strings, takes a branch where the guards use
+their condition for that kind of type (see AbstractGuard.expressions), so
+required, empty and between skip their SIZED tests, and a guard known to pass
+for the type is dropped. Values of other types take the generic branch. The
+branch is only emitted when it differs from the generic one.
+
+Example:
+
+    >>> compiled = compile_guards(Guards.resolve('!empty|lt[18]'), '!empty|lt[18]')
+    >>> print(compiled.source)
+    def check(value, name):
+        if (len(value) == 0) if type(value) in SIZED else (value is None):
+            return GuardResult(False, None, _g0, name, _p0)
+        if not (value < _g1_0):
+            return GuardResult(False, None, _g1, name, _p1)
+        return OK
+
+    def compiled(argument):
+        value = argument['value']
+        name = argument['name']
+        ...
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .base import GuardArgument, GuardResult, IGuarder, AbstractGuard, OK, SIZED
+from .memo import Memo, MemoInfo
+from .optimizer import Range
+from .profiler import Profile, Profiler
+
+"""
+A type alias for compiled statements.
+"""
+CompiledGuard = Callable[[GuardArgument], GuardResult]
+
+"""
+The version of the modules of statements compiled ahead of time; see the aot
+module. Bump it when the generated functions, or the nodes the optimizer
+resolves statements to, change.
+"""
+FORMAT = 3
+
+"""
+The types the compiled statements are specialized for.
+"""
+SPECIALIZED = (int, str)
+
+
+@lru_cache(maxsize=512)
+def _code(source: str):
+    """
+    Compiles the source of a statement. Statements of the same shape, such as
+    between[1, 10] and between[2, 20], share the source and so the code object;
+    only the constants of their namespaces differ.
+
+    :param source: The function source.
+
+    :return: Returns a code object.
+    """
+    return compile(source, '<guard>', 'exec')
+
+
+def _owner(cls: type, attr: str) -> Optional[type]:
+    """
+    Finds the class that defines an attribute in the MRO of a class.
+
+    :param cls: The class to inspect.
+    :param attr: The attribute name.
+
+    :return: Returns the defining class or None.
+    """
+    for klass in cls.__mro__:
+        if attr in klass.__dict__:
+            return klass
+    return None
+
+
+def _behavior(cls: type) -> Optional[type]:
+    """
+    Finds the class that defines the behavior of a guard class: the first
+    class in its MRO that defines check or is_satisfied_by.
+
+    :param cls: The guard class.
+
+    :return: Returns the defining class or None.
+    """
+    for klass in cls.__mro__:
+        if 'check' in klass.__dict__ or 'is_satisfied_by' in klass.__dict__:
+            return klass
+    return None
+
+
+def call(cls: type, target: str, name: str) -> str:
+    """
+    Builds the call of a guard that is not inlined, through check when its
+    behavior class defines it, otherwise through is_satisfied_by.
+
+    :param cls: The guard class.
+    :param target: The expression of the guard.
+    :param name: The expression of the argument name.
+
+    :return: Returns a Python expression reading the value from `value`.
+    """
+    if 'check' in (_behavior(cls) or object).__dict__:
+        return f'{target}.check(value, {name})'
+
+    return f"{target}.is_satisfied_by({{'name': {name}, 'value': value}})"
+
+
+def _inline(g: IGuarder, i: int, namespace: Dict[str, Any], kind: Optional[str] = None) \
+        -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Builds the inlined condition and the message parameters of a guard. A guard is
+    inlined only when the class declaring its expression also declares its
+    behavior (check or is_satisfied_by), so subclasses overriding the behavior
+    are never bypassed; the same holds for its specialized conditions.
+
+    :param g: The guard.
+    :param i: The guard position in the statement.
+    :param namespace: The namespace of the compiled function.
+    :param kind: The kind of the checked value ('sized' or 'scalar'), when
+    specialized.
+
+    :return: Returns the condition and the message parameters, or None when
+    the guard must be called through is_satisfied_by.
+    """
+    cls = type(g)
+
+    if getattr(cls, 'expression', None) is None or _owner(cls, 'expression') is not _behavior(cls):
+        return None
+
+    expression = cls.expression
+
+    if kind is not None and _owner(cls, 'expressions') is _behavior(cls):
+        expression = cls.expressions.get(kind, expression)
+
+    constants = {f'_g{i}_{j}': arg for j, arg in enumerate(g.args)}
+    named = {'args': g.args, **g.constants()}
+
+    try:
+        expression = expression.format(*constants, **{key: f'_g{i}_{key}' for key in named})
+        params = g.params()
+        g.parse(name='', **params)
+    except (IndexError, KeyError, ValueError):
+        # missing arguments are reported by the guard itself at call time
+        return None
+
+    namespace.update(constants)
+    namespace.update((f'_g{i}_{key}', value) for key, value in named.items())
+
+    return expression, params
+
+
+def _body(
+        guards: List[IGuarder],
+        namespace: Dict[str, Any],
+        name: Any = None,
+        message: Optional[str] = None,
+        kind: Optional[str] = None
+) -> List[str]:
+    """
+    Emits the evaluation of a list of guards, as the body of a function that
+    returns the first failure. The checked value is read from `value`.
+
+    In statement mode (no name) the argument name is only known at call time
+    and read from `name`, so failures are created with the guard, the name
+    and the message parameters. In field mode the name is a constant, so
+    failures are prebuilt GuardResults.
+
+    :param guards: The resolved guards, in evaluation order.
+    :param namespace: The namespace of the compiled function.
+    :param name: The argument name, in field mode.
+    :param message: A personalized message in case of an error, in field
+    mode.
+    :param kind: The kind of the checked value ('sized' or 'scalar'), when
+    specialized.
+
+    :return: Returns the body lines.
+    """
+    field = name is not None
+    body = []
+    argument = '_name' if field else 'name'
+
+    if field and message:
+        namespace['_message'] = message
+
+    def failure(i: int, g: IGuarder, params: Dict[str, Any]) -> str:
+        if not field:
+            return f"return GuardResult(False, None, _g{i}, name, _p{i})"
+
+        namespace[f'_r{i}'] = GuardResult(False, message, g, name, params)
+        return f'return _r{i}'
+
+    # with a personalized message, the failure keeps the failing guard
+    delegate = 'return GuardResult(False, _message, r.guard, _name)' if field and message else 'return r'
+
+    for i, g in enumerate(guards):
+        if isinstance(g, Range):
+            # the chained comparison is a fast path; the bounds are evaluated
+            # in order only when it fails, to return the first failure
+            namespace[f'_g{i}'] = g
+            namespace[f'_g{i}_lower'] = g.lower and g.lower[0]
+            namespace[f'_g{i}_upper'] = g.upper and g.upper[0]
+
+            body += [
+                f'    if not ({g.condition(f"_g{i}_lower", f"_g{i}_upper")}):',
+                f'        r = _g{i}.check(value, {argument})',
+                f'        if not r:',
+                f'            {delegate}',
+            ]
+            continue
+
+        emit = getattr(g, 'emit', None)
+
+        if emit is not None:
+            # guards emitting their own evaluation, e.g. template guards
+            namespace[f'_g{i}'] = g
+
+            body += emit(i, namespace, argument, delegate)
+            continue
+
+        inline = _inline(g, i, namespace, kind)
+
+        if inline is None:
+            namespace[f'_g{i}'] = g
+
+            body += [
+                f'    r = {call(type(g), f"_g{i}", argument)}',
+                f'    if not r:',
+                f'        {delegate}',
+            ]
+            continue
+
+        expression, namespace[f'_p{i}'] = inline
+        namespace[f'_g{i}'] = g
+
+        if expression in ('True', 'False'):
+            # the condition is known for the kind of the value: the guard
+            # is dropped, or always fails and ends the body
+            if (expression == 'True') != g.negate:
+                continue
+
+            body.append(f'    {failure(i, g, namespace[f"_p{i}"])}')
+            break
+
+        body += [
+            f'    if {expression if g.negate else f"not ({expression})"}:',
+            f'        {failure(i, g, namespace[f"_p{i}"])}',
+        ]
+
+    return body
+
+
+def _dispatch(guards: List[IGuarder], namespace: Dict[str, Any], name: Any = None, message: Optional[str] = None) \
+        -> List[str]:
+    """
+    Emits the evaluation of a list of guards specialized by the type of the
+    checked value: a branch for each type of SPECIALIZED whose evaluation
+    differs from the generic one, followed by the generic evaluation. See the
+    _body function.
+
+    :param guards: The resolved guards, in evaluation order.
+    :param namespace: The namespace of the compiled function.
+    :param name: The argument name, in field mode.
+    :param message: A personalized message in case of an error, in field
+    mode.
+
+    :return: Returns the body lines, returning OK at the end.
+    """
+    generic = _body(guards, namespace, name, message)
+    branches = []
+
+    for t in SPECIALIZED:
+        body = _body(guards, namespace, name, message, 'sized' if t in SIZED else 'scalar')
+
+        if body != generic:
+            branches += [f'    if t is {t.__name__}:', *(f'    {line}' for line in body)]
+
+            # unless the body ends failing, e.g. !required on ints
+            if not body or not body[-1].startswith('    return'):
+                branches.append('        return OK')
+
+    if branches:
+        branches.insert(0, '    t = type(value)')
+
+    return [*branches, *generic, '    return OK']
+
+
+def _namespace() -> Dict[str, Any]:
+    """
+    Creates the namespace of a compiled function.
+
+    :return: Returns the namespace with the shared helpers.
+    """
+    return {
+        're': re,
+        'SIZED': SIZED,
+        'GuardResult': GuardResult,
+        'OK': OK,
+    }
+
+
+def _build(source: str, namespace: Dict[str, Any], statement: str) -> Callable:
+    """
+    Executes the source of a compiled function in its namespace.
+
+    :param source: The function source.
+    :param namespace: The namespace.
+    :param statement: The statement.
+
+    :return: Returns the function.
+    """
+    exec(_code(source), namespace)
+
+    compiled = namespace['compiled']
+    compiled.source = source
+    compiled.statement = statement
+
+    return compiled
+
+
+def statement_source(guards: List[IGuarder]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Generates the function of a list of resolved guards, without compiling
+    it. See the compile_guards function.
+
+    :param guards: The resolved guards, in evaluation order.
+
+    :return: Returns the function source and its namespace.
+    """
+    namespace = _namespace()
+    body = _dispatch(guards, namespace)
+
+    source = '\n'.join([
+        'def check(value, name):',
+        *body,
+        '',
+        'def compiled(argument):',
+        "    value = argument['value']",
+        "    name = argument['name']",
+        *body,
+        '',
+        'compiled.check = check',
+    ])
+
+    return source, namespace
+
+
+def compile_guards(guards: List[IGuarder], statement: str = '<guard>') -> CompiledGuard:
+    """
+    Compiles a list of resolved guards into a single function. The compiled
+    function receives a GuardArgument and returns a GuardResult, exactly as
+    CompoundedGuard.is_satisfied_by does; its `check` attribute is the same
+    function with the positional calling convention, check(value, name). Its
+    source is kept in the `source` attribute of the function.
+
+    :param guards: The resolved guards, in evaluation order.
+    :param statement: The statement, kept in the `statement` attribute of the
+    function.
+
+    :return: Returns the compiled function.
+    """
+    source, namespace = statement_source(guards)
+
+    return _build(source, namespace, statement)
+
+
+def compile_field(
+        guards: List[IGuarder],
+        name: Any,
+        message: Optional[str] = None,
+        statement: str = '<guard>'
+) -> Callable[[Any], GuardResult]:
+    """
+    Compiles a list of resolved guards for a known argument name. The compiled
+    function receives the value only; failures are prebuilt, with the name or
+    the personalized message baked in.
+
+    Example:
+
+        >>> check = compile_field(Guards.resolve('required|lt[18]'), 'age')
+        >>> check(20)
+        fail(age must be less than 18)
+
+    :param guards: The resolved guards, in evaluation order.
+    :param name: The argument name.
+    :param message: A personalized message in case of an error.
+    :param statement: The statement, kept in the `statement` attribute of the
+    function.
+
+    :return: Returns the compiled function.
+    """
+    namespace = _namespace()
+    namespace['_name'] = name
+    body = _dispatch(guards, namespace, name, message)
+
+    source = '\n'.join([
+        'def compiled(value):',
+        *body,
+    ])
+
+    return _build(source, namespace, statement)
+
+
+class CompoundedGuard(AbstractGuard):
+    """
+    A compound guard. A compound guard is a guard that contains other guards.
+    The main purpose of this class is to combine guards into a unique guard to
+    be used in cache.
+
+    The guards are compiled on creation, unless their compiled function is
+    given; the compiled function and its check shadow the interpreted
+    is_satisfied_by and check of the instance.
+    """
+
+    """
+    The result memo, when memoized.
+    """
+    memo: Optional[Memo] = None
+
+    """
+    The statement profile, when profiled.
+    """
+    profiled: Optional[Profile] = None
+
+    """
+    The guard list.
+    """
+    guards: List[IGuarder]
+
+    def __init__(self, guards: List[IGuarder], statement: str = '<guard>', compiled: Optional[CompiledGuard] = None):
+        super().__init__(False, 'CompoundedGuard', None)
+        self.guards = guards
+        self.is_satisfied_by = compiled or compile_guards(guards, statement)
+        self.check = self.is_satisfied_by.check
+
+    def memoize(self, maxsize: int = 256) -> 'CompoundedGuard':
+        """
+        Memoizes the results of the guard for values of immutable builtin
+        types; see the memo module.
+
+        :param maxsize: The maximum number of memoized results.
+
+        :return: Returns the guard itself.
+        """
+        if self.memo is None:
+            self.memo = Memo(self.check, maxsize)
+            self.check = self.memo.check
+            self.is_satisfied_by = self.memo
+
+        return self
+
+    def profile(self, profiler: Profiler, key: str) -> 'CompoundedGuard':
+        """
+        Profiles the guard, memo included; see the profiler module.
+
+        :param profiler: The profiler collecting the statistics.
+        :param key: The canonical key of the statement.
+
+        :return: Returns the guard itself.
+        """
+        if self.profiled is None:
+            self.profiled = profiler.profile(self.check, self.guards, key)
+            self.check = self.profiled.check
+            self.is_satisfied_by = self.profiled
+
+        return self
+
+    def memo_info(self) -> Optional[MemoInfo]:
+        """
+        Gets the memo statistics.
+
+        :return: Returns a MemoInfo, or None when the guard is not memoized.
+        """
+        return self.memo.info() if self.memo is not None else None
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+
+        for obj in self.guards:
+            r = obj.check(value, name)
+
+            if not r:
+                return r
+
+        return OK
+
+    def __repr__(self):
+        return f"CompoundedGuard({self.negate}, {self.name}, {self.guards})"
+
+    def __str__(self):
+        return self.__repr__()
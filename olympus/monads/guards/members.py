@@ -0,0 +1,146 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Hash indexed collections of allowed values, used by the `in` guard. Hashable
+members are looked up in a frozenset; unhashable members, if any, are kept in
+a list and scanned.
+
+Large allow-lists can be loaded from text files, one member per line. A file
+is read once and the same MemberSet is shared by every statement that
+references it.
+
+Example:
+
+    >>> members = MemberSet(['BRL', 'USD', 'EUR'])
+    >>> members.contains('USD')
+    True
+    >>> members.contains(['USD'])
+    False
+"""
+
+import os
+from typing import Any, Callable, Dict, Iterable, List, NoReturn, Optional
+
+
+class MemberSet:
+    """
+    An immutable collection of allowed values with a precomputed membership
+    test.
+    """
+
+    """
+    The member sets loaded from files, by absolute path.
+    """
+    __files__: Dict[str, 'MemberSet'] = {}
+
+    """
+    The membership test. Receives a value and returns True if it is a member.
+    """
+    contains: Callable[[Any], bool]
+
+    def __init__(self, items: Iterable[Any], source: Optional[str] = None):
+        self.items = list(items)
+        self.source = source
+
+        hashable = []
+        unhashable = []
+
+        for item in self.items:
+            try:
+                hash(item)
+                hashable.append(item)
+            except TypeError:
+                unhashable.append(item)
+
+        self.index = frozenset(hashable)
+        self.unhashable = unhashable
+        self.contains = self._contains(self.index, unhashable)
+
+    @staticmethod
+    def _contains(index: frozenset, unhashable: List[Any]) -> Callable[[Any], bool]:
+        """
+        Builds the membership test. Unhashable values are never members of the
+        index, so they are only compared against the unhashable members.
+
+        :param index: The hashable members.
+        :param unhashable: The unhashable members.
+
+        :return: Returns the membership test.
+        """
+        if unhashable:
+            def contains(value: Any) -> bool:
+                try:
+                    return value in index or value in unhashable
+                except TypeError:
+                    return value in unhashable
+        else:
+            def contains(value: Any) -> bool:
+                try:
+                    return value in index
+                except TypeError:
+                    return False
+
+        return contains
+
+    @classmethod
+    def from_file(cls, path: str) -> 'MemberSet':
+        """
+        Loads a member set from a text file with one member per line. Blank
+        lines and lines starting with # are ignored. The members are strings.
+        The file is read once per process; later calls return the same set.
+
+        Raises:
+
+            OSError: If the file cannot be read.
+
+        :param path: The file path, absolute or relative to the working
+        directory.
+
+        :return: Returns the shared member set.
+        """
+        key = os.path.abspath(path)
+        members = cls.__files__.get(key)
+
+        if members is None:
+            with open(key, encoding='utf-8') as file:
+                lines = (line.strip() for line in file)
+                members = cls(
+                    (line for line in lines if line and not line.startswith('#')),
+                    path
+                )
+
+            members = cls.__files__.setdefault(key, members)
+
+        return members
+
+    @classmethod
+    def forget(cls, path: Optional[str] = None) -> NoReturn:
+        """
+        Drops a loaded file, or every loaded file, so it is read again by the
+        next statement that references it. Statements already compiled keep
+        the previous members.
+
+        :param path: The file path or None for every file.
+
+        :return: Returns nothing.
+        """
+        if path is None:
+            cls.__files__.clear()
+        else:
+            cls.__files__.pop(os.path.abspath(path), None)
+
+    def __contains__(self, value: Any) -> bool:
+        return self.contains(value)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __repr__(self):
+        if self.source is not None:
+            return f"@file:{self.source}"
+        return repr(self.items)
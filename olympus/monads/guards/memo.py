@@ -0,0 +1,132 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Result memoization. A memoized statement keeps the results of recent values,
+so the repeated values of a field (status codes, country codes, booleans,
+small ints) skip the evaluation of the statement.
+
+Example:
+
+    >>> Guards.memoize(maxsize=512)
+    >>> guard({'name': 'status', 'value': 'active'}, 'in[active, blocked]')
+    ok()
+    >>> guard({'name': 'status', 'value': 'active'}, 'in[active, blocked]')
+    ok()
+    >>> Guards.memo_info('in[active, blocked]')
+    MemoInfo(hits=1, misses=1, bypasses=0, evictions=0, maxsize=512, currsize=1)
+
+Only values of immutable builtin types are memoized, keyed by their type,
+value and argument name; any other value, such as a list or an instance of a
+custom class, bypasses the memo. Memoization assumes the statement result
+depends only on the value and the name, so only the statements whose guards
+are all pure are memoized; see the optimizer.is_pure function. Custom guards
+are impure unless they set pure = True.
+"""
+
+from typing import Any, Callable, Dict, NamedTuple, Tuple
+
+from .base import GuardArgument, GuardResult
+
+"""
+The types of memoized values. Subclasses are excluded, since they may be
+mutable or redefine equality.
+"""
+MEMOIZABLE = frozenset((str, int, float, bool, bytes, complex, type(None)))
+
+
+class MemoInfo(NamedTuple):
+    """
+    The statistics of a Memo.
+    """
+    hits: int
+    misses: int
+    bypasses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses + self.bypasses
+        return self.hits / calls if calls else 0.0
+
+
+class Memo:
+    """
+    A bounded memo of the results of a compiled statement. When full, the
+    oldest result is evicted. The memo wraps the positional check of the
+    statement; calling it with a GuardArgument unpacks the argument.
+    """
+
+    def __init__(self, compiled: Callable[[Any, Any], GuardResult], maxsize: int = 256):
+        if maxsize < 1:
+            raise ValueError('The memo maxsize must be a positive integer')
+
+        self.compiled = compiled
+        self.maxsize = maxsize
+        self.results: Dict[Tuple[type, Any, Any], GuardResult] = {}
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.evictions = 0
+
+    def __call__(self, argument: GuardArgument) -> GuardResult:
+        return self.check(argument['value'], argument['name'])
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        """
+        Validates a value, given with its argument name, through the memo.
+
+        :param value: The value.
+        :param name: The argument name.
+
+        :return: Returns a GuardResult.
+        """
+        if type(value) not in MEMOIZABLE:
+            self.bypasses += 1
+            return self.compiled(value, name)
+
+        key = (type(value), value, name)
+        r = self.results.get(key)
+
+        if r is not None:
+            self.hits += 1
+            return r
+
+        r = self.compiled(value, name)
+        self.misses += 1
+
+        if len(self.results) >= self.maxsize:
+            try:
+                del self.results[next(iter(self.results))]
+            except (KeyError, RuntimeError, StopIteration):
+                # another thread changed the memo meanwhile
+                pass
+            else:
+                self.evictions += 1
+
+        self.results[key] = r
+
+        return r
+
+    def info(self) -> MemoInfo:
+        """
+        Gets the memo statistics.
+
+        :return: Returns a MemoInfo.
+        """
+        return MemoInfo(self.hits, self.misses, self.bypasses, self.evictions, self.maxsize, len(self.results))
+
+    def clear(self) -> None:
+        """
+        Removes every result and resets the statistics.
+
+        :return: Returns nothing.
+        """
+        self.results.clear()
+        self.hits = self.misses = self.bypasses = self.evictions = 0
+
+    def __repr__(self):
+        return f"Memo({self.maxsize}, {self.compiled})"
@@ -0,0 +1,263 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+The statement optimizer. A resolved statement is a list of nodes, the guards,
+rewritten before being compiled:
+
+- Duplicated conditions are dropped: in 'required|!empty' the second guard
+  tests the same condition as the first one and can never fail after it.
+- Adjacent numeric bounds are merged into a Range node, checked with a single
+  chained comparison: 'ge[1]|le[10]' runs as 1 <= value <= 10.
+- Contradictions are reported: 'gt[10]|lt[5]' or 'required|!required' can
+  never be satisfied and raise a ContradictionError.
+
+Only pure guards are rewritten, and the failure messages are the ones the
+original statement would return. A guard is pure when its class, or the
+class defining its check, declares it; see the is_pure function.
+
+Example:
+
+    >>> optimize(Guards.resolve('required|!empty|ge[1]|le[10]'))
+    [Required(False, []), Range(ge[1], le[10])]
+"""
+
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+from .base import AbstractGuard, GuardResult, IGuarder, OK
+
+
+class ContradictionError(ValueError):
+    """
+    An exception for statements that no value can satisfy.
+    """
+
+    def __init__(self, statement: str, reason: str):
+        super().__init__(f"Contradictory statement {statement}: {reason}")
+        self.statement = statement
+        self.reason = reason
+
+
+"""
+A type alias for bounds: the limit and whether it is strict.
+"""
+Bound = Tuple[Any, bool]
+
+
+class Range(AbstractGuard):
+    """
+    A run of adjacent numeric bounds (ge, gt, le, lt). The value is checked
+    against the strictest lower and upper limits at once; only when that check
+    fails the bounds are evaluated in order, to return the message of the first
+    failing one.
+    """
+
+    pure = True
+
+    def __init__(self, bounds: List[AbstractGuard], lower: Optional[Bound], upper: Optional[Bound]):
+        super().__init__(False, 'range', [])
+        self.bounds = bounds
+        self.lower = lower
+        self.upper = upper
+
+    def condition(self, lower: str, upper: str) -> str:
+        """
+        Builds the chained comparison of the range.
+
+        :param lower: The name of the lower limit.
+        :param upper: The name of the upper limit.
+
+        :return: Returns a Python expression reading the value from `value`.
+        """
+        expression = 'value'
+
+        if self.lower is not None:
+            expression = f"{lower} {'<' if self.lower[1] else '<='} {expression}"
+
+        if self.upper is not None:
+            expression = f"{expression} {'<' if self.upper[1] else '<='} {upper}"
+
+        return expression
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        for bound in self.bounds:
+            r = bound.check(value, name)
+
+            if not r:
+                return r
+
+        return OK
+
+    def __repr__(self):
+        return f"Range({', '.join(f'{b.name}[{b.args[0]}]' for b in self.bounds)})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@lru_cache(maxsize=None)
+def _declarer(cls: type, *attrs: str) -> Optional[type]:
+    """
+    Finds the first class in the MRO of a class that defines one of the
+    attributes. Guard classes are not changed once defined, so the lookups
+    are cached.
+    """
+    for klass in cls.__mro__:
+        if any(attr in klass.__dict__ for attr in attrs):
+            return klass
+    return None
+
+
+def is_pure(g: IGuarder) -> bool:
+    """
+    Tells whether a guard is pure. The pure flag is only trusted when it is
+    declared by the class that defines the check of the guard, or by one of
+    its subclasses: a subclass overriding check or is_satisfied_by does not
+    inherit the purity of its parent.
+
+    :param g: The guard.
+
+    :return: Returns whether the optimizer may rewrite the guard.
+    """
+    if not getattr(g, 'pure', False):
+        return False
+
+    behavior = _declarer(type(g), 'check', 'is_satisfied_by')
+    owner = _declarer(type(g), 'pure')
+
+    return behavior is not None and owner is not None and issubclass(owner, behavior)
+
+
+def _predicate(g: AbstractGuard) -> Tuple[Any, bool]:
+    """
+    Gets the predicate of a pure guard. A predicate inherited from a class
+    with a different check tells nothing about the guard, so its identity is
+    qualified by the guard class.
+
+    :param g: The pure guard.
+
+    :return: Returns the condition identity and its expected outcome.
+    """
+    identity, outcome = g.predicate()
+
+    if not issubclass(_declarer(type(g), 'predicate'), _declarer(type(g), 'check', 'is_satisfied_by')):
+        identity = type(g), identity
+
+    return identity, outcome
+
+
+def _bound(g: IGuarder) -> Optional[Tuple[str, Bound]]:
+    """
+    Gets the limit of a numeric bound guard. Subclasses of the bound guards
+    are not merged, since they may override is_satisfied_by.
+
+    :param g: The guard.
+
+    :return: Returns 'lower' or 'upper' and the bound, or None when the guard
+    is not a mergeable bound.
+    """
+    kind = type(g).__dict__.get('bound')
+
+    if kind is None or g.negate or len(g.args) != 1 or type(g.args[0]) not in (int, float):
+        return None
+
+    side, strict = kind
+
+    return side, (g.args[0], strict)
+
+
+def _stricter(side: str, a: Optional[Bound], b: Bound) -> Bound:
+    """
+    Gets the stricter of two bounds of the same side.
+
+    :param side: 'lower' or 'upper'.
+    :param a: The current bound, if any.
+    :param b: The new bound.
+
+    :return: Returns the stricter bound.
+    """
+    if a is None or a[0] == b[0]:
+        return b if a is None or b[1] else a
+
+    if side == 'lower':
+        return a if a[0] > b[0] else b
+
+    return a if a[0] < b[0] else b
+
+
+def _merge(run: List[AbstractGuard], statement: str) -> IGuarder:
+    """
+    Merges a run of adjacent bounds into a Range.
+
+    Raises:
+
+        ContradictionError: If the bounds exclude every value.
+
+    :param run: The bound guards.
+    :param statement: The statement, used in errors.
+
+    :return: Returns the range, or the single guard of a run of one.
+    """
+    if len(run) == 1:
+        return run[0]
+
+    limits = {'lower': None, 'upper': None}
+
+    for g in run:
+        side, bound = _bound(g)
+        limits[side] = _stricter(side, limits[side], bound)
+
+    lower, upper = limits['lower'], limits['upper']
+
+    if lower is not None and upper is not None:
+        if lower[0] > upper[0] or (lower[0] == upper[0] and (lower[1] or upper[1])):
+            raise ContradictionError(statement, f'no value is within the bounds {Range(run, lower, upper)}')
+
+    return Range(run, lower, upper)
+
+
+def optimize(guards: List[IGuarder], statement: str = '<guard>') -> List[IGuarder]:
+    """
+    Optimizes a resolved statement. See the module documentation for the
+    applied rewrites.
+
+    Raises:
+
+        ContradictionError: If no value can satisfy the statement.
+
+    :param guards: The resolved guards, in evaluation order.
+    :param statement: The statement, used in errors.
+
+    :return: Returns the optimized nodes, in evaluation order.
+    """
+    seen = {}
+    nodes = []
+    run = []
+
+    for g in guards:
+        if is_pure(g):
+            identity, outcome = _predicate(g)
+
+            if identity in seen:
+                if seen[identity] != outcome:
+                    raise ContradictionError(statement, f'{g.name} is required to both hold and fail')
+                continue
+
+            seen[identity] = outcome
+
+        if _bound(g) is not None:
+            run.append(g)
+            continue
+
+        if run:
+            nodes.append(_merge(run, statement))
+            run = []
+
+        nodes.append(g)
+
+    if run:
+        nodes.append(_merge(run, statement))
+
+    return nodes
@@ -0,0 +1,210 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Parallel bulk validation. Records are validated against a schema by a pool of
+worker processes, each compiling the schema once, and the failures stream
+back in record order as compact (index, field, guard, message) tuples, where
+guard is the name of the failing guard, or None when unknown.
+
+Example:
+
+    >>> schema = {'name': 'required|length[3]', 'age': 'ge[18]'}
+    >>> records = [{'name': 'Joe', 'age': 20}, {'name': 'Al', 'age': 17}]
+    >>> list(guard_many(records, schema, workers=2))
+    [(1, 'name', 'length', 'name must have of length 3'), (1, 'age', 'ge', 'age must be greater than or equal to 18')]
+
+Records are sent to the workers in chunks, with a bounded number of chunks in
+flight, so arbitrarily large iterables are validated in constant memory.
+
+Custom guarders must be importable by the workers: pass the modules that
+register them as plugins, e.g. plugins=['myapp.guards']. Workers started by
+fork already inherit the parent registry.
+"""
+
+import importlib
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .base import GuardResult
+from .schema import Schema, compile_schema
+
+"""
+A type alias for failures: the record index, the field, the guard name and
+the message.
+"""
+Failure = Tuple[int, str, Optional[str], str]
+
+"""
+The schema of the current worker process.
+"""
+_schema: Optional[Schema] = None
+
+"""
+Whether the workers report the first failure of each record only.
+"""
+_fail_fast: bool = False
+
+
+def _import(plugins: Sequence[str]):
+    """
+    Imports the plugin modules.
+    """
+    for plugin in plugins:
+        importlib.import_module(plugin)
+
+
+def _init(guards: Dict[str, str], messages: Optional[Dict[str, str]], fail_fast: bool, plugins: Sequence[str]):
+    """
+    Initializes a worker: imports the plugins and compiles the schema.
+    """
+    global _schema, _fail_fast
+
+    _import(plugins)
+    _schema = compile_schema(guards, messages)
+    _fail_fast = fail_fast
+
+
+def _failures(schema: Schema, fail_fast: bool, chunk: Tuple[int, List[Dict[str, Any]]]) -> List[Failure]:
+    """
+    Validates a chunk of records.
+
+    :param schema: The compiled schema.
+    :param fail_fast: Whether to report the first failure of each record only.
+    :param chunk: The index of the first record and the records.
+
+    :return: Returns the failures of the chunk.
+    """
+    start, records = chunk
+    failures = []
+
+    if fail_fast:
+        validate = schema.validate
+        fields = schema.guards
+
+        for index, record in enumerate(records, start):
+            result = validate(record)
+
+            if not result:
+                # the failures of fields carry the field name, unless returned
+                # by custom guarders; the record is then collected
+                field = result.name if result.name in fields else next(iter(schema.collect(record)))
+                failures.append((index, field, _guard(result), result.get_message()))
+
+        return failures
+
+    for index, record in enumerate(records, start):
+        for field, result in schema.collect(record).items():
+            failures.append((index, field, _guard(result), result.get_message()))
+
+    return failures
+
+
+def _guard(result: GuardResult) -> Optional[str]:
+    """
+    Gets the name of the guard of a failure, or None when unknown.
+    """
+    return result.guard.name if result.guard is not None else None
+
+
+def _validate(chunk: Tuple[int, List[Dict[str, Any]]]) -> List[Failure]:
+    """
+    Validates a chunk of records in a worker, with the worker schema.
+    """
+    return _failures(_schema, _fail_fast, chunk)
+
+
+def _chunks(records: Iterable[Dict[str, Any]], chunksize: int) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    Splits records into numbered chunks.
+    """
+    iterator = iter(records)
+    start = 0
+
+    while True:
+        chunk = list(islice(iterator, chunksize))
+
+        if not chunk:
+            return
+
+        yield start, chunk
+        start += len(chunk)
+
+
+def guard_many(
+        records: Iterable[Dict[str, Any]],
+        schema: Union[Schema, Dict[str, str]],
+        messages: Optional[Dict[str, str]] = None,
+        workers: Optional[int] = None,
+        chunksize: int = 256,
+        fail_fast: bool = False,
+        plugins: Sequence[str] = ()
+) -> Iterator[Failure]:
+    """
+    Validates records in parallel. Equivalent to calling collect on the
+    compiled schema for each record, in a pool of worker processes.
+
+    Raises:
+
+        ValueError: If chunksize is not positive.
+
+    :param records: The records, any iterable of dicts.
+    :param schema: A Schema, or the statement of each field.
+    :param messages: The personalized message of each field, if any. Ignored
+    when schema is a Schema.
+    :param workers: The number of worker processes; the CPU count by default.
+    With a single worker the records are validated in this process.
+    :param chunksize: The number of records sent to a worker at once.
+    :param fail_fast: Whether to report the first failure of each record only.
+    :param plugins: The modules imported by each worker, e.g. to register
+    custom guarders.
+
+    :return: Returns an iterator of (index, field, guard, message) failures,
+    in record order.
+    """
+    if chunksize < 1:
+        raise ValueError('The chunksize must be a positive integer')
+
+    if isinstance(schema, Schema):
+        schema, messages = schema.guards, schema.messages
+
+    return _stream(records, schema, messages, workers or os.cpu_count() or 1, chunksize, fail_fast, tuple(plugins))
+
+
+def _stream(
+        records: Iterable[Dict[str, Any]],
+        schema: Dict[str, str],
+        messages: Optional[Dict[str, str]],
+        workers: int,
+        chunksize: int,
+        fail_fast: bool,
+        plugins: Tuple[str, ...]
+) -> Iterator[Failure]:
+    """
+    Streams the failures of guard_many.
+    """
+    if workers == 1:
+        _import(plugins)
+        compiled = compile_schema(schema, messages)
+
+        for chunk in _chunks(records, chunksize):
+            yield from _failures(compiled, fail_fast, chunk)
+        return
+
+    initargs = (schema, messages, fail_fast, plugins)
+
+    with ProcessPoolExecutor(workers, initializer=_init, initargs=initargs) as executor:
+        pending = deque()
+
+        for chunk in _chunks(records, chunksize):
+            pending.append(executor.submit(_validate, chunk))
+
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,380 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+The statement parser. Turns a guard statement such as '!empty|lt[18]' into a
+list of (negate, name, args) tuples consumed by the Guards registry, and
+formats parsed statements as canonical keys.
+"""
+
+import re
+from typing import List, Union, Tuple
+
+from .base import RawArg, ComplexArg
+
+"""
+The version of the parser output. Bump it when the parsed tuples of a
+statement change, to invalidate the persisted statements.
+"""
+VERSION = 1
+
+
+class InvalidPunctuatorError(SyntaxError):
+    """
+    An exception for empty statements.
+    """
+
+    def __init__(self, statement: str, pos: int):
+        self.statement = statement
+        self.pos = pos
+
+    def __str__(self):
+        return f"Invalid statement at position {self.pos}:\n{self.statement}\n{' ' * (self.pos - 1)}^"
+
+
+class ExpectedPunctuatorError(SyntaxError):
+    """
+    An exception for empty statements.
+    """
+
+    def __init__(self, statement: str, pos: int, expected: str):
+        self.statement = statement
+        self.pos = pos
+        self.expected = expected
+
+    def __str__(self):
+        return f"Expected {self.expected} at position {self.pos}:\n{self.statement}\n{' ' * self.pos}^"
+
+
+class StatementParser:
+    """
+    A wrapper for parsing statements.
+
+    Sintax:
+
+        - digit: [0-9]
+        - nonzerodigit: [1-9]
+        - nondigit: [a-zA-Z_]
+        - integer: digit+
+        - float: integer . integer
+        - string: ".*?"
+        - punctuator: [ ( , ) ] " |
+        - escape: \\[ \\' \\" \\]
+        - token: nondigit | nonzerodigit | integer | float | string |
+            escape | punctuator | list | tuple | regex | token
+        - list: [token, ...]
+        - tuple: (token, ...)
+        - regex: r"token"
+        - guard: !token | token | token[token, ...] | token | guard
+
+    Example:
+
+        interger: 1
+        >>> StatementParser().parse('1')
+        1
+
+        float: 1.0
+        >>> StatementParser().parse('1.0')
+        1.0
+
+        string: 'hello'
+        >>> StatementParser().parse('hello')
+        'hello'
+
+        list: [1, 2, 3]
+        >>> StatementParser().parse('[1, 2, 3]')
+        [1, 2, 3]
+
+        tuple: (1, 2, 3)
+        >>> StatementParser().parse('(1, 2, 3)')
+        (1, 2, 3)
+
+        regex: ^\\d+$
+        >>> StatementParser().parse('^\\d+$')
+        '^\\d+$'
+
+        regex: r"^\\d+$, ^\\w+$"
+        >>> StatementParser().parse('r"^\\d+$, ^\\w+$"')
+        '^\\d+$, ^\\w+$'
+
+        regex in lists:
+        >>> StatementParser().parse('[r"^\\d+$", r"^\\w+$]"')
+        ['^\\d+$', '^\\w+$']
+
+    The statement is split in a single pass by a precompiled master pattern
+    (see TOKENS) and the token list is then read by a small recursive descent
+    parser. An argument starting with r is a regex only when followed by a
+    quote; otherwise it is a plain token.
+    """
+
+    """
+    The master pattern of the scanner. Words are sequences of characters other
+    than punctuators, with backslash escapes; they never start with whitespace
+    but keep the inner and trailing one.
+    """
+    TOKENS = re.compile(r"""
+        \s*
+        (?:
+            (?P<regex>r"(?P<body>[^"\\]*(?:\\.?[^"\\]*)*)(?P<close>"?))
+          | (?P<punctuator>[()\[\],|"])
+          | (?P<word>(?:[^\s()\[\],"|\\]|\\.?)[^()\[\],"|\\]*(?:\\.?[^()\[\],"|\\]*)*)
+        )
+    """, re.VERBOSE | re.DOTALL)
+
+    """
+    The escape sequences of words and regexes.
+    """
+    ESCAPE = re.compile(r'\\(.?)', re.DOTALL)
+
+    """
+    The float literal.
+    """
+    FLOAT = re.compile(r'^\d+\.\d+$')
+
+    def __init__(self, value: str):
+        self.value = value
+        self.pos = 0
+        self.length = len(value)
+
+        """
+        The token kinds: 'word', 'regex' or the punctuator itself. The list
+        ends with an empty kind.
+        """
+        self.kinds: List[str] = []
+
+        """
+        The token texts, with escapes resolved.
+        """
+        self.texts: List[str] = []
+
+        """
+        The token positions in the statement.
+        """
+        self.starts: List[int] = []
+
+    def _scan(self) -> None:
+        """
+        Splits the statement into tokens, in a single pass. Whitespace between
+        tokens is dropped and escapes are resolved.
+
+        Raises:
+
+            ExpectedPunctuatorError: If a regex is not closed.
+            InvalidPunctuatorError: If a word is only an escape.
+
+        :return: Returns nothing.
+        """
+        kinds = self.kinds
+        texts = self.texts
+        starts = self.starts
+        escape = self.ESCAPE
+
+        for match in self.TOKENS.finditer(self.value):
+            kind = match.lastgroup
+            start = match.start(kind)
+
+            if kind == 'punctuator':
+                text = kind = match.group(kind)
+            else:
+                if kind == 'regex':
+                    if not match.group('close'):
+                        raise ExpectedPunctuatorError(self.value, self.length, '"')
+                    text = match.group('body')
+                else:
+                    text = match.group(kind)
+
+                if '\\' in text:
+                    text = escape.sub(r'\1', text)
+
+                    if not text and kind == 'word':
+                        raise InvalidPunctuatorError(self.value, start)
+
+            kinds.append(kind)
+            texts.append(text)
+            starts.append(start)
+
+        kinds.append('')
+        texts.append('')
+        starts.append(self.length)
+
+    def _literal(self, token: str) -> Union[RawArg, ComplexArg]:
+        """
+        Converts a word to its value.
+
+        :param token: The word.
+
+        :return: Returns a bool, None, an int, a float or the word itself.
+        """
+        match token.strip().lower():
+            case 'true':
+                return True
+            case 'false':
+                return False
+            case 'none':
+                return None
+            case _:
+                if token.isnumeric():
+                    return int(token)
+                elif self.FLOAT.match(token):
+                    return float(token)
+                else:
+                    return token
+
+    def _parse_args(self) -> List[Union[RawArg, ComplexArg]]:
+        """
+        Parses a list of arguments, up to the closing ] or ). The closing
+        punctuator is not consumed.
+
+        Raises:
+
+            ExpectedPunctuatorError: If the arguments are not closed.
+            InvalidPunctuatorError: If an argument is missing.
+
+        :return: Returns a list of arguments.
+        """
+        kinds = self.kinds
+        texts = self.texts
+        args = []
+
+        while True:
+            kind = kinds[self.pos]
+
+            if kind == ']' or kind == ')':
+                return args
+
+            if kind == '':
+                raise ExpectedPunctuatorError(self.value, self.length, 'Expected closing ] or )')
+
+            if kind == ',':
+                self.pos += 1
+                kind = kinds[self.pos]
+
+            if kind == 'word':
+                args.append(self._literal(texts[self.pos]))
+                self.pos += 1
+            elif kind == 'regex':
+                args.append(texts[self.pos])
+                self.pos += 1
+            elif kind == '[':
+                self.pos += 1
+                args.append(self._parse_group(']'))
+            elif kind == '(':
+                self.pos += 1
+                args.append(tuple(self._parse_group(')')))
+            else:
+                raise InvalidPunctuatorError(self.value, self.starts[self.pos])
+
+    def _parse_group(self, closing: str) -> List[Union[RawArg, ComplexArg]]:
+        """
+        Parses the items of a list or tuple and its closing punctuator.
+
+        Raises:
+
+            ExpectedPunctuatorError: If the group is not closed by the
+            expected punctuator.
+
+        :param closing: The expected closing punctuator.
+
+        :return: Returns the items.
+        """
+        items = self._parse_args()
+
+        if self.kinds[self.pos] != closing:
+            raise ExpectedPunctuatorError(self.value, self.starts[self.pos], closing)
+
+        self.pos += 1
+
+        return items
+
+    def _parse_guard(self) -> Tuple[bool, str, List[Union[RawArg, ComplexArg]]]:
+        """
+        Parses a guard.
+
+        Guard syntax:
+
+            - !: Negates the guard.
+            - name: The guard name.
+            - args: The guard arguments.
+
+        Format:
+
+            - !?([a-zA-Z0-9_]*)(?:\\[(.*?)])?
+
+            The args are optional. If the args are not provided, the guard
+            arguments will be an empty list. The args can be a list of arguments
+            separated by commas (,). The args punctuators are '[' ot '('.
+
+        :return: Returns a guard.
+        """
+        negate = False
+        args = []
+
+        if self.kinds[self.pos] != 'word':
+            raise InvalidPunctuatorError(self.value, self.starts[self.pos])
+
+        name = self.texts[self.pos]
+        start = self.starts[self.pos]
+
+        if name[0] == '!' and self.value[start] == '!':
+            negate = True
+            name = name[1:].lstrip()
+
+            if not name:
+                raise InvalidPunctuatorError(self.value, start + 1)
+
+        self.pos += 1
+        name = self._literal(name).strip()
+
+        # the next punctuator must be [ ot (
+        if self.kinds[self.pos] in ('[', '('):
+            self.pos += 1
+            args = self._parse_args()
+            self.pos += 1
+
+        return negate, name, args
+
+    def parse(self) -> List[Tuple[bool, str, List[Union[RawArg, ComplexArg]]]]:
+        """
+        Parses a string to guard list. The guard string are separated by pipe
+        character (|)
+
+        Syntax:
+
+            - guard: !?([a-zA-Z0-9_]*)(?:\\[(.*?)])?
+            - guards: guard(?:\\|guard)*
+
+        :return: Returns a guard list.
+        """
+
+        self._scan()
+
+        kinds = self.kinds
+        guards = []
+
+        while kinds[self.pos]:
+            if kinds[self.pos] == '|':
+                self.pos += 1
+
+            guards.append(self._parse_guard())
+
+        return guards
+
+
+def canonical(guards: List[Tuple[bool, str, List[Union[RawArg, ComplexArg]]]]) -> str:
+    """
+    Formats a parsed statement as its canonical key. Statements that parse to
+    the same guards have the same key, whatever their spacing or brackets:
+    'required|between[1,10]', 'required | between[1, 10]' and
+    'required|between(1,10)' are all "required|between[1, 10]". Arguments are
+    formatted with repr, so the key tells 1 from '1'; it is a key, not a
+    statement to parse again.
+
+    :param guards: The parsed guards.
+
+    :return: Returns the canonical key.
+    """
+    return '|'.join(
+        f"{'!' if negate else ''}{name}{f'[{repr(args)[1:-1]}]' if args else ''}"
+        for negate, name, args in guards
+    )
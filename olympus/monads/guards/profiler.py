@@ -0,0 +1,266 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Statement profiling. A profiled statement counts its calls and failures and
+times its evaluations; the statistics are kept per statement, by canonical
+key, and per guarder, by registered name.
+
+Example:
+
+    >>> Guards.profile(sample=16)
+    >>> for record in records:
+    ...     guard({'name': 'age', 'value': record['age']}, 'required|ge[18]')
+    >>> Guards.stats()['statements']['required|ge[18]']
+    ProfileInfo(calls=10000, failures=1204, time=0.00121, p50=1.1e-07, p99=3.4e-07)
+
+    >>> print(Guards.stats('prometheus'))
+    # HELP olympus_guard_statement_calls_total The calls of statements.
+    ...
+
+The statements run their compiled function, timed as a whole. One call out of
+`sample` is observed instead: its guards are evaluated and timed one by one,
+in statement order, which gives the statistics of the guarders. So the
+guarder statistics count the observed calls only, and the statement timings
+of the observed calls include the overhead of the guard by guard evaluation.
+The percentiles are computed over the last `window` timings.
+
+Profiling is off by default. When it is disabled the statements are compiled
+without the profile, so it costs nothing. The statements compiled for a known
+argument name, such as the fields of a Schema, and templates are not
+profiled.
+"""
+
+from collections import deque
+from time import perf_counter_ns
+from typing import Any, Callable, Deque, Dict, List, NamedTuple
+
+from .base import GuardArgument, GuardResult, IGuarder, OK
+from .optimizer import Range
+
+
+class ProfileInfo(NamedTuple):
+    """
+    The statistics of a statement or a guarder. The times are in seconds.
+    """
+    calls: int
+    failures: int
+    time: float
+    p50: float
+    p99: float
+
+
+class Stats:
+    """
+    The statistics collected for a statement or a guarder.
+    """
+
+    def __init__(self, window: int = 1024):
+        self.calls = 0
+        self.failures = 0
+        self.time = 0
+        self.times: Deque[int] = deque(maxlen=window)
+
+    def record(self, elapsed: int, failed: bool) -> None:
+        """
+        Records an evaluation.
+
+        :param elapsed: The evaluation time, in nanoseconds.
+        :param failed: Whether the evaluation failed.
+
+        :return: Returns nothing.
+        """
+        self.calls += 1
+        self.failures += failed
+        self.time += elapsed
+        self.times.append(elapsed)
+
+    def info(self) -> ProfileInfo:
+        """
+        Gets the statistics.
+
+        :return: Returns a ProfileInfo.
+        """
+        times = sorted(self.times)
+
+        def percentile(q: float) -> float:
+            return times[min(int(q * len(times)), len(times) - 1)] / 1e9 if times else 0.0
+
+        return ProfileInfo(self.calls, self.failures, self.time / 1e9, percentile(0.5), percentile(0.99))
+
+
+class Profile:
+    """
+    The profile of a compiled statement. It wraps the positional check of the
+    statement; calling it with a GuardArgument unpacks the argument.
+    """
+
+    def __init__(self, compiled: Callable[[Any, Any], GuardResult], guards: List[IGuarder], key: str,
+                 profiler: 'Profiler'):
+        self.compiled = compiled
+        self.profiler = profiler
+        self.calls = 0
+        self.stats = profiler.statement(key)
+
+        # the bounds of ranges are evaluated, and profiled, one by one
+        self.guards = [(g, profiler.guarder(getattr(g, 'name', type(g).__name__)))
+                       for node in guards for g in (node.bounds if isinstance(node, Range) else [node])]
+
+    def __call__(self, argument: GuardArgument) -> GuardResult:
+        return self.check(argument['value'], argument['name'])
+
+    def check(self, value: Any, name: Any) -> GuardResult:
+        """
+        Validates a value, given with its argument name, and records the
+        evaluation.
+
+        :param value: The value.
+        :param name: The argument name.
+
+        :return: Returns a GuardResult.
+        """
+        self.calls += 1
+
+        if self.calls % self.profiler.sample == 0:
+            return self._observe(value, name)
+
+        start = perf_counter_ns()
+        r = self.compiled(value, name)
+        self.stats.record(perf_counter_ns() - start, not r)
+
+        return r
+
+    def _observe(self, value: Any, name: Any) -> GuardResult:
+        """
+        Evaluates and times the guards one by one, in statement order.
+
+        :param value: The value.
+        :param name: The argument name.
+
+        :return: Returns the first failure, or OK.
+        """
+        total = 0
+
+        for g, stats in self.guards:
+            start = perf_counter_ns()
+            r = g.check(value, name)
+            elapsed = perf_counter_ns() - start
+
+            stats.record(elapsed, not r)
+            total += elapsed
+
+            if not r:
+                self.stats.record(total, True)
+                return r
+
+        self.stats.record(total, False)
+
+        return OK
+
+    def __repr__(self):
+        return f"Profile({self.compiled})"
+
+
+class Profiler:
+    """
+    The statistics of the profiled statements and of their guarders.
+    """
+
+    def __init__(self, sample: int = 16, window: int = 1024):
+        if sample < 1 or window < 1:
+            raise ValueError('The profile sample and window must be positive integers')
+
+        self.sample = sample
+        self.window = window
+        self.statements: Dict[str, Stats] = {}
+        self.guarders: Dict[str, Stats] = {}
+
+    def statement(self, key: str) -> Stats:
+        """
+        Gets the statistics of a statement, created on first use.
+
+        :param key: The canonical key of the statement.
+
+        :return: Returns the Stats.
+        """
+        return self.statements.setdefault(key, Stats(self.window))
+
+    def guarder(self, name: str) -> Stats:
+        """
+        Gets the statistics of a guarder, created on first use.
+
+        :param name: The guarder name.
+
+        :return: Returns the Stats.
+        """
+        return self.guarders.setdefault(name, Stats(self.window))
+
+    def profile(self, compiled: Callable[[Any, Any], GuardResult], guards: List[IGuarder], key: str) -> Profile:
+        """
+        Profiles a compiled statement.
+
+        :param compiled: The positional check of the statement.
+        :param guards: The resolved guards, in statement order.
+        :param key: The canonical key of the statement.
+
+        :return: Returns the Profile.
+        """
+        return Profile(compiled, guards, key, self)
+
+    def info(self) -> Dict[str, Dict[str, ProfileInfo]]:
+        """
+        Gets the statistics of the statements and of the guarders.
+
+        :return: Returns the ProfileInfo of each statement, under
+        'statements', and of each guarder, under 'guarders'.
+        """
+        return {
+            'statements': {key: stats.info() for key, stats in list(self.statements.items())},
+            'guarders': {name: stats.info() for name, stats in list(self.guarders.items())},
+        }
+
+    def prometheus(self) -> str:
+        """
+        Formats the statistics in the Prometheus text exposition format: the
+        calls and the failures as counters, and the times as summaries with
+        the 0.5 and 0.99 quantiles.
+
+        :return: Returns the metrics.
+        """
+        info = self.info()
+        lines = []
+
+        for kind, label, infos in (('statement', 'statement', info['statements']),
+                                   ('guarder', 'guard', info['guarders'])):
+            metric = f'olympus_guard_{kind}'
+
+            lines += [
+                f'# HELP {metric}_calls_total The calls of {kind}s.',
+                f'# TYPE {metric}_calls_total counter',
+                *(f'{metric}_calls_total{{{label}="{_escape(key)}"}} {info.calls}' for key, info in infos.items()),
+                f'# HELP {metric}_failures_total The failures of {kind}s.',
+                f'# TYPE {metric}_failures_total counter',
+                *(f'{metric}_failures_total{{{label}="{_escape(key)}"}} {info.failures}' for key, info in infos.items()),
+                f'# HELP {metric}_seconds The evaluation time of {kind}s.',
+                f'# TYPE {metric}_seconds summary',
+            ]
+
+            for key, info in infos.items():
+                key = _escape(key)
+
+                lines += [
+                    f'{metric}_seconds{{{label}="{key}",quantile="0.5"}} {info.p50!r}',
+                    f'{metric}_seconds{{{label}="{key}",quantile="0.99"}} {info.p99!r}',
+                    f'{metric}_seconds_sum{{{label}="{key}"}} {info.time!r}',
+                    f'{metric}_seconds_count{{{label}="{key}"}} {info.calls}',
+                ]
+
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    """
+    Escapes a Prometheus label value.
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
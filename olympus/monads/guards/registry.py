@@ -0,0 +1,1271 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+The Guards registry and the functional helpers built on top of it.
+"""
+
+import atexit
+import hashlib
+import marshal
+import os
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any, List, Optional, NoReturn, Dict, Set, Tuple, Type, Union
+
+from .adaptive import AdaptiveGuard
+from .base import ComplexArg, GuardArgument, GuardResult, IGuarder, OK, RawArg
+from .cache import CacheInfo, StatementCache
+from .compiler import FORMAT, CompiledGuard, CompoundedGuard
+from .memo import MemoInfo
+from .optimizer import is_pure, optimize
+from .parser import VERSION, StatementParser, canonical
+from .profiler import ProfileInfo, Profiler
+from .templates import Bound, Template, placeholders
+
+
+def _same(a: type, b: type) -> bool:
+    """
+    Checks if two classes are the same definition: the same object, or the
+    same qualified name in the same module, counting the __mp_main__ module of
+    multiprocessing workers as __main__.
+    """
+
+    def module(cls: type) -> str:
+        return '__main__' if cls.__module__ == '__mp_main__' else cls.__module__
+
+    return a is b or (a.__qualname__ == b.__qualname__ and module(a) == module(b))
+
+
+class InvalidStatementError(ValueError):
+    """
+    An exception for statements that cannot be resolved: malformed statements,
+    undefined guards, rejected arguments and contradictions. The original
+    exception is kept as error.
+    """
+
+    def __init__(self, statement: str, error: Exception):
+        # the message of a KeyError is its quoted key
+        reason = error.args[0] if isinstance(error, KeyError) and error.args else error
+
+        super().__init__(f"Invalid statement {statement}: {reason}")
+        self.statement = statement
+        self.error = error
+
+
+class CompiledModuleError(ImportError):
+    """
+    An exception for compiled statement modules that do not match the live
+    registry. See the aot module.
+    """
+
+    def __init__(self, module: str, reason: str):
+        super().__init__(f"Cannot load the compiled module {module}: {reason}")
+        self.module = module
+        self.reason = reason
+
+
+class InvalidStatementResult(GuardResult):
+    """
+    The failure returned by the guard functions for a statement that cannot be
+    resolved, when errors are not raised. See the Guards.strict method.
+    """
+
+    def __init__(self, error: InvalidStatementError):
+        super().__init__(False, str(error))
+        object.__setattr__(self, 'error', error)
+
+
+class EvaluationErrorResult(GuardResult):
+    """
+    The failure returned by the guard functions when a guard raises while
+    evaluating a valid statement, e.g. lt[5] given None, when errors are not
+    raised. See the Guards.strict method.
+    """
+
+    def __init__(self, statement: Any, name: Any, error: Exception):
+        super().__init__(False, f"Cannot validate {name} against {statement}: {type(error).__name__}: {error}", None, name)
+        object.__setattr__(self, 'statement', statement)
+        object.__setattr__(self, 'error', error)
+
+
+class Guards:
+    """
+    A wrapper for guards. The Guards class is static and immutable.
+    """
+
+    """
+    A dictionary of guards. Reads take no lock; registrations are serialized by
+    the registry lock.
+    """
+    __guards__: Dict[str, Type[IGuarder]] = {}
+
+    """
+    The registry lock.
+    """
+    __lock__ = threading.Lock()
+
+    """
+    A bounded LRU cache of compiled guards statements, by canonical key, safe
+    to share between threads.
+    """
+    __cache__: StatementCache[CompoundedGuard] = StatementCache()
+
+    """
+    The compiled templates, by canonical key. See the templates module.
+    """
+    __templates__: StatementCache[Template] = StatementCache()
+
+    """
+    The caches derived from the resolved statements outside the registry,
+    such as the async plans, cleared with the statements cache and when a
+    guard is registered.
+    """
+    __dependents__: List[StatementCache] = []
+
+    """
+    The canonical keys of raw statements, the first level of the statements
+    cache: equivalent statements map to the same key and share one compiled
+    guard.
+    """
+    __aliases__: StatementCache[str] = StatementCache(4096)
+
+    """
+    The sample and period of adaptive statements, or None when adaptive
+    ordering is disabled.
+    """
+    __adaptive__: Optional[Tuple[int, int]] = None
+
+    """
+    The statements kept in statement order in adaptive mode.
+    """
+    __pinned__: Set[str] = set()
+
+    """
+    The memo size of compiled statements, or None when results are not
+    memoized.
+    """
+    __memoize__: Optional[int] = None
+
+    """
+    The profiler of compiled statements, or None when profiling is disabled.
+    """
+    __profiler__: Optional[Profiler] = None
+
+    """
+    The statements that could not be resolved, with the time their error
+    expires. Failed resolutions are not retried until then.
+    """
+    __errors__: StatementCache[Tuple[float, InvalidStatementError]] = StatementCache()
+
+    """
+    The time, in seconds, failed resolutions are cached.
+    """
+    __errors_ttl__: float = 60.0
+
+    """
+    Whether the guard functions raise the errors of invalid statements instead
+    of returning an InvalidStatementResult.
+    """
+    __strict__: bool = False
+
+    """
+    The parsed statements, by raw statement.
+    """
+    __parsed__: StatementCache[List[Tuple[bool, str, List[Union[RawArg, ComplexArg]]]]] = StatementCache(4096)
+
+    """
+    The registry fingerprint and the parsed statements restored from disk.
+    They are used only while the fingerprint matches the registry.
+    """
+    __stored__: Optional[Tuple[str, Dict[str, List[Tuple[bool, str, List[Union[RawArg, ComplexArg]]]]]]] = None
+
+    """
+    The registry fingerprint, computed on demand.
+    """
+    __fingerprint__: Optional[str] = None
+
+    def __new__(cls):
+        raise Exception("Cannot instantiate Guards class")
+
+    @classmethod
+    def register(cls, name: str, g: Type[IGuarder]) -> NoReturn:
+        """
+        Registers a guard. The guarders must be unique by name. Registering
+        the same class again is allowed, as when its module is imported twice,
+        e.g. as __main__ and by name in a worker process; the new definition
+        replaces the previous one.
+
+        Raises:
+
+            KeyError: If another guard is registered with the name.
+
+        :param name: The guard name.
+        :param g: The guard class.
+
+        :return: Returns nothing.
+        """
+        with cls.__lock__:
+            if cls.has(name) and not _same(cls.__guards__[name], g):
+                raise KeyError(f"Guard {name} is already defined")
+
+            cls.__guards__[name] = g
+            cls.__errors__.clear()
+
+            for cache in cls.__dependents__:
+                cache.clear()
+
+            cls.__fingerprint__ = None
+
+    @classmethod
+    def get(cls, name: str) -> Type[IGuarder]:
+        """
+        Gets a guard by name.
+
+        Raises:
+
+            KeyError: If the guard does not exist.
+
+        :arg name: The guard name.
+
+        :return: Returns a guard.
+        """
+        return cls.__guards__[name]
+
+    @classmethod
+    def has(cls, name: str) -> bool:
+        """
+        Checks if a guard exists.
+
+        :param name: The guard name.
+
+        :return: Returns True if the guard exists, otherwise False.
+        """
+        return name in cls.__guards__
+
+    @classmethod
+    def fingerprint(cls) -> str:
+        """
+        Gets the registry fingerprint: a digest of the registered guarders,
+        their classes and versions, the parser version and the Python
+        version. It changes whenever a guarder is registered or updated.
+
+        :return: Returns the fingerprint.
+        """
+        fingerprint = cls.__fingerprint__
+
+        if fingerprint is None:
+            guarders = sorted(
+                (name, g.__module__, g.__qualname__, getattr(g, 'version', None))
+                for name, g in cls.__guards__.items()
+            )
+            fingerprint = hashlib.sha256(repr((VERSION, sys.version_info[:2], guarders)).encode()).hexdigest()
+            cls.__fingerprint__ = fingerprint
+
+        return fingerprint
+
+    @classmethod
+    def parse(cls, statement: str) -> List[Tuple[bool, str, List[Union[RawArg, ComplexArg]]]]:
+        """
+        Parses a statement. Parsed statements are cached, and restored from
+        disk when persisted; see the persist method.
+
+        Raises:
+
+            SyntaxError: If the statement is malformed.
+
+        :param statement: The guard statement.
+
+        :return: Returns the (negate, name, args) tuples of the guards.
+        """
+        raw_guards = cls.__parsed__.get(statement)
+
+        if raw_guards is None:
+            stored = cls.__stored__
+
+            if stored is not None and stored[0] == cls.fingerprint():
+                raw_guards = stored[1].get(statement)
+
+            if raw_guards is None:
+                raw_guards = StatementParser(statement).parse()
+
+            cls.__parsed__[statement] = raw_guards
+
+        return raw_guards
+
+    @classmethod
+    def persist(cls, path: str) -> NoReturn:
+        """
+        Writes the parsed statements to a file, with the registry fingerprint,
+        so other processes skip parsing them; see the restore method. The
+        file is replaced atomically.
+
+        The file keeps the most recently parsed statements, up to the capacity
+        of the statements cache (of the parsed statements when the statements
+        cache is unbounded). The restored statements not parsed since are
+        kept after them while there is room, so the file does not grow with
+        every statement ever persisted.
+
+        Raises:
+
+            OSError: If the file cannot be written.
+
+        :param path: The file path.
+
+        :return: Returns nothing.
+        """
+        fingerprint = cls.fingerprint()
+        stored = cls.__stored__
+        statements = dict(stored[1]) if stored is not None and stored[0] == fingerprint else {}
+
+        # least recently used first, so the restored statements go first
+        for statement in cls.__parsed__:
+            raw_guards = cls.__parsed__.get(statement)
+
+            if raw_guards is not None:
+                statements.pop(statement, None)
+                statements[statement] = raw_guards
+
+        limit = cls.__cache__.maxsize if cls.__cache__.maxsize is not None else cls.__parsed__.maxsize
+
+        if limit is not None and len(statements) > limit:
+            statements = dict(list(statements.items())[len(statements) - limit:])
+
+        temp = f'{path}.{os.getpid()}.tmp'
+
+        with open(temp, 'wb') as f:
+            marshal.dump({'version': VERSION, 'fingerprint': fingerprint, 'statements': statements}, f)
+
+        os.replace(temp, path)
+
+    @classmethod
+    def restore(cls, path: str) -> bool:
+        """
+        Reads the parsed statements written by the persist method. They are
+        used while the registry fingerprint is the persisted one, so the file
+        is ignored after a guarder is added, replaced or bumped to another
+        version. Missing and unreadable files are ignored.
+
+        :param path: The file path.
+
+        :return: Returns True if the file was read, otherwise False.
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+
+        if not isinstance(data, dict) or data.get('version') != VERSION:
+            return False
+
+        cls.__stored__ = (data['fingerprint'], data['statements'])
+
+        return True
+
+    @classmethod
+    def persistent(cls, path: str) -> NoReturn:
+        """
+        Restores the parsed statements from a file and persists them there
+        again when the process exits. Enabled at import time by the
+        OLYMPUS_GUARDS_CACHE environment variable.
+
+        :param path: The file path.
+
+        :return: Returns nothing.
+        """
+
+        def persist():
+            try:
+                cls.persist(path)
+            except OSError:
+                pass
+
+        cls.restore(path)
+        atexit.register(persist)
+
+    @classmethod
+    def canonical(cls, statement: str) -> str:
+        """
+        Gets the canonical key of a statement; see the parser canonical
+        function. Keys are cached by raw statement.
+
+        Raises:
+
+            InvalidStatementError: If the statement is malformed.
+
+        :param statement: The guard statement.
+
+        :return: Returns the canonical key.
+        """
+        key = cls.__aliases__.get(statement)
+
+        if key is None:
+            cls._raise_cached(statement)
+
+            try:
+                key = cls.__aliases__[statement] = canonical(cls.parse(statement))
+            except SyntaxError as e:
+                raise cls._reject(statement, e) from e
+
+        return key
+
+    @classmethod
+    def _raise_cached(cls, statement: str) -> NoReturn:
+        """
+        Raises the cached error of a statement, if it has not expired.
+        """
+        cached = cls.__errors__.get(statement)
+
+        if cached is None:
+            return
+
+        expires, error = cached
+
+        if time.monotonic() < expires:
+            # a fresh traceback, so raising the same error does not chain them
+            raise error.with_traceback(None)
+
+        cls.__errors__.discard(statement)
+
+    @classmethod
+    def _reject(cls, statement: str, e: Exception) -> InvalidStatementError:
+        """
+        Wraps and caches the error of a statement that cannot be resolved.
+        """
+        error = InvalidStatementError(statement, e)
+
+        if cls.__errors_ttl__ > 0:
+            cls.__errors__[statement] = (time.monotonic() + cls.__errors_ttl__, error)
+
+        return error
+
+    @classmethod
+    def resolve(cls, statement: str) -> List[IGuarder]:
+        """
+        Resolves a guard by name. The resolved guards go through the optimizer,
+        which drops redundant guards and merges adjacent numeric bounds; see
+        the optimizer module. Failed resolutions are cached for a while; see
+        the errors_ttl method.
+
+        Raises:
+
+            InvalidStatementError: If the statement is malformed, uses an
+            undefined guard or rejected arguments, or no value can satisfy it.
+
+        :param statement: The guard statement, or a guard object; see the
+        builders module.
+
+        :return: Returns a guard.
+        """
+        if not isinstance(statement, str):
+            return statement.resolve()
+
+        cls._raise_cached(statement)
+
+        try:
+            raw_guards = cls.parse(statement)
+        except SyntaxError as e:
+            raise cls._reject(statement, e) from e
+
+        return cls.resolve_parsed(raw_guards, statement)
+
+    @classmethod
+    def resolve_parsed(
+            cls,
+            raw_guards: List[Tuple[bool, str, List[Union[RawArg, ComplexArg]]]],
+            statement: str
+    ) -> List[IGuarder]:
+        """
+        Resolves parsed guards. See the resolve method.
+
+        Raises:
+
+            InvalidStatementError: If a guard is undefined, its arguments are
+            rejected, or no value can satisfy the statement.
+
+        :param raw_guards: The (negate, name, args) tuples of the guards.
+        :param statement: The statement, or its canonical key.
+
+        :return: Returns the resolved guards.
+        """
+        try:
+            guards = []
+
+            for raw in raw_guards:
+                if not cls.has(raw[1]):
+                    raise KeyError(f"Guard {raw[1]} is not defined")
+
+                guards.append(cls.get(raw[1]).new(*raw))
+
+            return optimize(guards, statement)
+
+        except (KeyError, ValueError) as e:
+            raise cls._reject(statement, e) from e
+
+    @classmethod
+    def build(cls, raw_guards: List[Tuple[bool, str, List[Union[RawArg, ComplexArg]]]]) -> CompoundedGuard:
+        """
+        Compiles parsed guards, without a statement to parse. The compiled
+        guard is cached by canonical key, so it is shared with the equivalent
+        statements.
+
+        Raises:
+
+            InvalidStatementError: If the guards cannot be resolved.
+
+        :param raw_guards: The (negate, name, args) tuples of the guards.
+
+        :return: Returns a compiled guard.
+        """
+        key = canonical(raw_guards)
+        g = cls.__cache__.get(key)
+
+        if g is None:
+            cls._raise_cached(key)
+
+            g = cls.__cache__.get_or_create(
+                key, lambda _: cls._wrap(cls.resolve_parsed(raw_guards, key), key, key), counted=True)
+
+        return g
+
+    @classmethod
+    def template(cls, statement: str) -> Template:
+        """
+        Resolves and compiles a template; see the templates module. Compiled
+        templates are cached.
+
+        Raises:
+
+            InvalidStatementError: If the template is malformed or uses an
+            undefined guard.
+
+        :param statement: The template.
+
+        :return: Returns a compiled template.
+        """
+        key = cls.canonical(statement)
+        t = cls.__templates__.get(key)
+
+        if t is not None:
+            return t
+
+        cls._raise_cached(statement)
+
+        try:
+            guards = []
+
+            for raw in cls.parse(statement):
+                if not cls.has(raw[1]):
+                    raise KeyError(f"Guard {raw[1]} is not defined")
+
+                g = cls.get(raw[1])
+                guards.append(Bound(g, *raw) if placeholders(raw[2]) else g.new(*raw))
+        except (SyntaxError, KeyError, ValueError) as e:
+            raise cls._reject(statement, e) from e
+
+        return cls.__templates__.get_or_create(key, lambda _: Template(guards, statement), counted=True)
+
+    @classmethod
+    def compile(cls, statement: str) -> CompoundedGuard:
+        """
+        Resolves a statement and compiles its guards into a single guard. The
+        compiled guard is not cached; see the guard method. In adaptive mode,
+        the statements not pinned are compiled into AdaptiveGuards. When
+        memoization is enabled, the compiled guard is memoized.
+
+        Raises:
+
+            InvalidStatementError: If the statement is invalid.
+
+        :param statement: The guard statement.
+
+        :return: Returns a compiled guard.
+        """
+        return cls._wrap(cls.resolve(statement), statement, cls.canonical(statement))
+
+    @classmethod
+    def _wrap(
+            cls,
+            guards: List[IGuarder],
+            statement: str,
+            key: str,
+            compiled: Optional[CompiledGuard] = None
+    ) -> CompoundedGuard:
+        """
+        Builds the guard of a resolved statement, adaptive and memoized as
+        configured. See the compile method.
+        """
+        if cls.__adaptive__ is not None and key not in cls.__pinned__:
+            g = AdaptiveGuard(guards, statement, *cls.__adaptive__)
+        else:
+            g = CompoundedGuard(guards, statement, compiled)
+
+        # the results of impure guards may change for the same value
+        if cls.__memoize__ is not None and all(is_pure(node) for node in guards):
+            g.memoize(cls.__memoize__)
+
+        if cls.__profiler__ is not None:
+            g.profile(cls.__profiler__, key)
+
+        return g
+
+    @classmethod
+    def load_compiled(cls, module: ModuleType) -> NoReturn:
+        """
+        Loads the statements of a module generated by compile_statements into
+        the statements cache; see the aot module. The guards of each statement
+        are created from its parsed arguments and bound to its precompiled
+        function. Nothing is loaded unless the whole module matches the live
+        registry.
+
+        Raises:
+
+            CompiledModuleError: If the module was compiled against other
+            guarders, other versions of them, or in another format.
+
+        :param module: The compiled module.
+
+        :return: Returns nothing.
+        """
+        def reject(reason: str) -> CompiledModuleError:
+            return CompiledModuleError(module.__name__, reason)
+
+        if getattr(module, 'FORMAT', None) != FORMAT:
+            raise reject(f"expected format {FORMAT}, got {getattr(module, 'FORMAT', None)}")
+
+        for name, (path, version) in module.GUARDERS.items():
+            if not cls.has(name):
+                raise reject(f"guard {name} is not defined")
+
+            g = cls.get(name)
+
+            if f'{g.__module__}:{g.__qualname__}' != path:
+                raise reject(f"guard {name} is {g.__module__}:{g.__qualname__}, compiled as {path}")
+
+            if getattr(g, 'version', None) != version:
+                raise reject(f"guard {name} is at version {getattr(g, 'version', None)}, compiled at {version}")
+
+        loaded = []
+
+        for statement, key, raw_guards, nodes, factory in module.STATEMENTS:
+            guards = optimize([cls.get(raw[1]).new(*raw) for raw in raw_guards], statement)
+
+            if len(guards) != nodes:
+                raise reject(f"the guards of {statement} changed since it was compiled")
+
+            # the precompiled function is bound to the guards, not generated
+            compiled = factory(guards)
+            compiled.statement = statement
+
+            loaded.append((statement, key, cls._wrap(guards, statement, key, compiled)))
+
+        for statement, key, g in loaded:
+            cls.__aliases__[statement] = key
+            cls.__cache__[key] = g
+
+    @classmethod
+    def adaptive(cls, enabled: bool = True, sample: int = 64, period: int = 256) -> NoReturn:
+        """
+        Enables or disables adaptive guard ordering. Adaptive statements
+        observe one call out of `sample` and reorder their pure guards every
+        `period` observations; see the adaptive module. The statements cache
+        is cleared, so cached statements are compiled again.
+
+        Raises:
+
+            ValueError: If sample or period is not positive.
+
+        :param enabled: Whether adaptive ordering is enabled.
+        :param sample: The ratio of observed calls.
+        :param period: The observations between reorders.
+
+        :return: Returns nothing.
+        """
+        if sample < 1 or period < 1:
+            raise ValueError('The adaptive sample and period must be positive integers')
+
+        with cls.__lock__:
+            cls.__adaptive__ = (sample, period) if enabled else None
+            cls.__cache__.clear()
+
+    @classmethod
+    def memoize(cls, enabled: bool = True, maxsize: int = 256) -> NoReturn:
+        """
+        Enables or disables the memoization of statement results. Each
+        compiled statement keeps up to maxsize results of values of immutable
+        builtin types; see the memo module. Statements with an impure guard,
+        such as a custom guard that does not declare itself pure, are not
+        memoized. The statements cache is cleared, so cached statements are
+        compiled again.
+
+        Raises:
+
+            ValueError: If maxsize is not positive.
+
+        :param enabled: Whether results are memoized.
+        :param maxsize: The maximum number of results memoized per statement.
+
+        :return: Returns nothing.
+        """
+        if maxsize < 1:
+            raise ValueError('The memo maxsize must be a positive integer')
+
+        with cls.__lock__:
+            cls.__memoize__ = maxsize if enabled else None
+            cls.__cache__.clear()
+
+    @classmethod
+    def profile(cls, enabled: bool = True, sample: int = 16, window: int = 1024) -> NoReturn:
+        """
+        Enables or disables the profiling of statements. Profiled statements
+        record their calls, failures and evaluation times, and observe one
+        call out of `sample` guard by guard for the statistics of the
+        guarders; see the profiler module. Enabling it starts new statistics.
+        The statements cache is cleared, so cached statements are compiled
+        again, without the profile when it is disabled.
+
+        Raises:
+
+            ValueError: If sample or window is not positive.
+
+        :param enabled: Whether statements are profiled.
+        :param sample: The ratio of observed calls.
+        :param window: The number of recent timings the percentiles are
+        computed over.
+
+        :return: Returns nothing.
+        """
+        profiler = Profiler(sample, window)
+
+        with cls.__lock__:
+            cls.__profiler__ = profiler if enabled else None
+            cls.__cache__.clear()
+
+    @classmethod
+    def stats(cls, format: str = 'dict') -> Union[Dict[str, Dict[str, ProfileInfo]], str]:
+        """
+        Gets the profiling statistics of the statements, by canonical key,
+        and of the guarders, by name. See the profile method.
+
+        Example:
+
+            >>> Guards.stats()
+            {'statements': {'required|ge[18]': ProfileInfo(calls=3, ...)}, 'guarders': {...}}
+
+        Raises:
+
+            ValueError: If the format is unknown.
+
+        :param format: 'dict', or 'prometheus' for the Prometheus text
+        exposition format.
+
+        :return: Returns the statistics, empty when profiling is disabled.
+        """
+        profiler = cls.__profiler__ or Profiler()
+
+        if format == 'dict':
+            return profiler.info()
+
+        if format == 'prometheus':
+            return profiler.prometheus()
+
+        raise ValueError(f"Unknown stats format {format}, expected dict or prometheus")
+
+    @classmethod
+    def strict(cls, enabled: bool = True) -> NoReturn:
+        """
+        Sets whether the guard functions raise an InvalidStatementError for
+        invalid statements, and the errors of guards raising while evaluating
+        a value. Otherwise, they return an InvalidStatementResult or an
+        EvaluationErrorResult, failures holding the error.
+
+        :param enabled: Whether the errors are raised.
+
+        :return: Returns nothing.
+        """
+        cls.__strict__ = enabled
+
+    @classmethod
+    def errors_ttl(cls, ttl: float) -> NoReturn:
+        """
+        Changes the time failed resolutions are cached. While cached, an
+        invalid statement fails without being parsed again. Registering a
+        guard clears the cached errors. A ttl of 0 disables the cache.
+
+        :param ttl: The time, in seconds.
+
+        :return: Returns nothing.
+        """
+        cls.__errors_ttl__ = ttl
+        cls.__errors__.clear()
+
+    @classmethod
+    def memo_info(cls, statement: str) -> Optional[MemoInfo]:
+        """
+        Gets the memo statistics of a cached statement.
+
+        :param statement: The guard statement.
+
+        :return: Returns a MemoInfo, or None when the statement is not cached
+        or not memoized.
+        """
+        g = cls.__cache__.get(cls.canonical(statement))
+
+        return g.memo_info() if g is not None else None
+
+    @classmethod
+    def pin(cls, statement: str) -> NoReturn:
+        """
+        Pins the guard order of a statement: in adaptive mode, the statement is
+        always evaluated in statement order, so its first failing guard, and
+        message, are the written ones.
+
+        :param statement: The guard statement.
+
+        :return: Returns nothing.
+        """
+        key = cls.canonical(statement)
+
+        cls.__pinned__.add(key)
+        cls.__cache__.discard(key)
+
+    @classmethod
+    def unpin(cls, statement: str) -> NoReturn:
+        """
+        Unpins the guard order of a statement. See the pin method.
+
+        :param statement: The guard statement.
+
+        :return: Returns nothing.
+        """
+        key = cls.canonical(statement)
+
+        cls.__pinned__.discard(key)
+        cls.__cache__.discard(key)
+
+    @classmethod
+    def guard(
+            cls,
+            arg: GuardArgument,
+            statement: Union[str, IGuarder],
+            message: Optional[str] = None,
+            params: Optional[Dict[str, Any]] = None
+    ) -> GuardResult:
+        """
+        Validates an argument against a list of guards. This function
+        receive a string or list as guards, parses and invokes them.
+
+        guards format:
+
+        name: Must be a sequence of alphabetic characters (a-zA-Z).
+        args: Can be True, False, None or a sequence of alphanumeric
+        characters (“a-zA-Z0-9”).
+        negate: Can be an exclamation mark (!) to indicate negation.
+        separator: Can be a pipe character (|) to separate multiple guards.
+        guard: It is the combination of negate, name and args.
+
+        Usage Example: The string “!required|!empty|length[1, 10]” represents
+        three guards. The first guard is “required” with negation, the second
+        is “empty” also with negation, and the third is “length” with arguments
+        “1, 10”.
+
+        With params, the statement is a template whose $name placeholders are
+        bound to the params values; see the templates module. The statement
+        may also be a guard object, e.g. Required() & Between(1, 10), which
+        is evaluated directly; see the builders module.
+
+        The argument is unpacked and given to the check method, which saves
+        building a GuardArgument when the value and the name are at hand.
+
+        Invalid statements fail with an InvalidStatementResult, and guards
+        raising while evaluating a value with an EvaluationErrorResult; both
+        raise in strict mode, see the strict method.
+
+        Raises:
+
+            InvalidStatementError: If the statement is invalid, in strict mode.
+            Exception: The error of a guard raising, in strict mode.
+            KeyError: If a placeholder of a template has no value.
+
+        :param arg: The guard argument.
+        :param statement: Guard string or guard object.
+        :param message: A personalized message in case of an error.
+        :param params: The values of the template placeholders.
+
+        :return: Returns a GuardResult.
+        """
+        return cls.check(arg['value'], arg['name'], statement, message, params)
+
+    @classmethod
+    def check(
+            cls,
+            value: Any,
+            name: Any,
+            statement: Union[str, IGuarder],
+            message: Optional[str] = None,
+            params: Optional[Dict[str, Any]] = None
+    ) -> GuardResult:
+        """
+        Validates a value, given with its argument name, against a list of
+        guards. It is the guard method without the GuardArgument: the value
+        and the name are passed positionally down to the compiled guard.
+
+        Example:
+
+            >>> Guards.check(18, 'age', '!empty|lt[18]')
+            fail(age must be less than 18)
+
+        Raises:
+
+            InvalidStatementError: If the statement is invalid, in strict mode.
+            Exception: The error of a guard raising, in strict mode.
+            KeyError: If a placeholder of a template has no value.
+
+        :param value: The value.
+        :param name: The argument name.
+        :param statement: Guard string or guard object.
+        :param message: A personalized message in case of an error.
+        :param params: The values of the template placeholders.
+
+        :return: Returns a GuardResult.
+        """
+        if params is not None:
+            return cls._check_template(value, name, statement, message, params)
+
+        if type(statement) is str:
+            key = cls.__aliases__.get(statement)
+            g = cls.__cache__.get(key) if key is not None else None
+
+            if g is None:
+                # the lookup is counted by get when the key is known
+                counted = key is not None
+
+                try:
+                    key = cls.canonical(statement)
+
+                    # compiles and stores in cache, once for concurrent callers
+                    g = cls.__cache__.get_or_create(key, lambda _: cls.compile(statement), counted)
+                except InvalidStatementError as e:
+                    if cls.__strict__:
+                        raise
+
+                    return InvalidStatementResult(e)
+
+            try:
+                result = g.check(value, name)
+            except Exception as e:
+                if cls.__strict__:
+                    raise
+
+                return EvaluationErrorResult(statement, name, e)
+        else:
+            # guard objects hold their compiled guard; see the builders module
+            try:
+                result = statement.check(value, name)
+            except InvalidStatementError as e:
+                if cls.__strict__:
+                    raise
+
+                return InvalidStatementResult(e)
+            except Exception as e:
+                if cls.__strict__:
+                    raise
+
+                return EvaluationErrorResult(statement, name, e)
+
+        if not result and message:
+            return GuardResult(False, message)
+
+        return result
+
+    @classmethod
+    def _check_template(
+            cls,
+            value: Any,
+            name: Any,
+            statement: str,
+            message: Optional[str],
+            params: Dict[str, Any]
+    ) -> GuardResult:
+        """
+        Validates a value against a template. See the check method.
+        """
+        key = cls.__aliases__.get(statement)
+        t = cls.__templates__.get(key) if key is not None else None
+
+        if t is None:
+            try:
+                t = cls.template(statement)
+            except InvalidStatementError as e:
+                if cls.__strict__:
+                    raise
+
+                return InvalidStatementResult(e)
+
+        try:
+            result = t.check(value, name, params)
+        except KeyError:
+            # a placeholder without value is an error of the caller
+            raise
+        except Exception as e:
+            if cls.__strict__:
+                raise
+
+            return EvaluationErrorResult(statement, name, e)
+
+        if not result and message:
+            return GuardResult(False, message)
+
+        return result
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """
+        Gets the statistics of the statements cache: hits, misses, evictions,
+        capacity and current size.
+
+        :return: Returns a CacheInfo.
+        """
+        return cls.__cache__.info()
+
+    @classmethod
+    def cache_clear(cls) -> NoReturn:
+        """
+        Clears the statements cache, its canonical keys, the parsed statements,
+        the cached errors, the dependent caches and the statistics. The
+        registered guards are kept.
+
+        :return: Returns nothing.
+        """
+        cls.__errors__.clear()
+        cls.__parsed__.clear()
+        cls.__aliases__.clear()
+        cls.__templates__.clear()
+        cls.__cache__.clear()
+
+        for cache in cls.__dependents__:
+            cache.clear()
+
+    @classmethod
+    def cache_resize(cls, maxsize: Optional[int]) -> NoReturn:
+        """
+        Changes the capacity of the statements cache. The least recently used
+        statements are evicted when the cache shrinks.
+
+        :param maxsize: The new capacity, or None for an unbounded cache.
+
+        :return: Returns nothing.
+        """
+        cls.__cache__.resize(maxsize)
+
+    @staticmethod
+    def combine(results: List[GuardResult]) -> GuardResult:
+        """
+        Combines a list of GuardResults into a single GuardResult. If any
+        of the GuardResults are failures, the first failure will be returned.
+
+        :param results: The list of GuardResults.
+
+        :return: If it has failures in list, returns the first fail,
+        otherwise, returns OK.
+        """
+        for result in results:
+            if not result.is_satisfied():
+                return result
+        return OK
+
+
+def guard(
+        arg: GuardArgument,
+        guards: Union[str, IGuarder],
+        message: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None
+) -> GuardResult:
+    """
+    Validates an argument against a list of guards. This function
+    receive a string or list as guards, parses and invokes them.
+
+    Guards Format:
+
+        name: Must be a sequence of alphabetic characters (a-zA-Z).
+        args: Can be True, False, None, list, tuple, or a regex.
+        negate: Can be an exclamation mark (!) to indicate negation.
+
+        Arguments are optional. If the arguments are not provided, the guard
+        arguments will be an empty list or tuple. The arguments can be a list of arguments
+
+        Usage Example: The string “!required|!empty|between[1, 10]|regex[r"\\w+"]|length(1)” represents
+        three guards. The first guard is “required” with negation, the second
+        is “empty” also with negation, the third is “between” with arguments
+        “1, 10”, the fourth is “regex” with arguments “r"\\w+"”, and the fifth is “length” with arguments
+        "1" in tuple format.
+
+    Syntax:
+
+        - digit: [0-9]
+        - nonzero-digit: [1-9]
+        - integer: digit+
+        - float: integer . integer
+        - string: ".*?"
+        - punctuator: [ ( , ) ] " |
+        - escape: \\[ \\' \\" \\]
+        - token: nonzero-digit | integer | float | string |
+            escape | punctuator | list | tuple | regex | token
+        - list: [token, ...]
+        - tuple: (token, ...)
+        - regex: r"token"
+        - guard: !token | token | token[token, ...] | token(token, ...) | token | guard
+
+    Example:
+
+        >>> Guards.guard({
+        ... 'name': 'age',
+        ... 'value': 18,
+        ... }, '!empty|lt[18]')
+        fail('age must be greater than 18')
+
+        >>> Guards.guard({
+        ... 'name': 'age',
+        ... 'value': 18,
+        ... }, '!empty|le(18)')
+        ok()
+
+    Default guards:
+
+        format: name [ args:type, ... ]
+
+        required: Test if the value is not None.
+        empty: Test if the value is empty.
+        length[expected:int]: Test if the length of the value is equal to the expected.
+        between[min:int, max:int]: Test if the length of the value is between the min and max.
+        regex[regex:str]: Test if the value matches the regular expression.
+        le[max:int]: Test if the value is less than or equal to the max.
+        lt[max:int]: Test if the value is less than the max.
+        ge[max:int]: Test if the value is greater than or equal to the max.
+        gt[max:int]: Test if the value is greater than the max.
+        in[list:List[ComplexArg]]: Test if the value is in the list.
+        odd: Test if the value is odd.
+        even: Test if the value is even.
+        positive: Test if the value is positive.
+        negative: Test if the value is negative.
+        eq[expected:ComplexArg]: Test if the value is equal to the expected.
+
+
+    Templates:
+
+        With params, the statement is a template: its $name arguments are
+        placeholders bound to the params values on each call, and it is
+        parsed and compiled once whatever the values.
+
+        >>> guard({'name': 'amount', 'value': 120}, 'le[$limit]', params={'limit': 100})
+        fail(amount must be less than or equal to 100)
+
+    Guard objects:
+
+        Guards can be built in Python instead of parsed, see the builders
+        module; they share the compiled guard of the equivalent statement.
+
+        >>> guard({'name': 'age', 'value': 18}, Required() & ~Empty() & LessThan(18))
+        fail(age must be less than 18)
+
+    :param message: A personalized message in case of an error.
+    :param arg: The guard argument.
+    :param guards: guard string or guard list.
+    :param params: The values of the template placeholders.
+
+    :return: Returns a GuardResult.
+    """
+    return Guards.guard(arg, guards, message, params)
+
+
+def check(
+        value: Any,
+        name: Any,
+        guards: Union[str, IGuarder],
+        message: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None
+) -> GuardResult:
+    """
+    Validates a value, given with its argument name, against a list of
+    guards. Equivalent to the guard function, without building a
+    GuardArgument; see the guard function for the guards format.
+
+    Example:
+
+        >>> check(18, 'age', '!empty|lt[18]')
+        fail(age must be less than 18)
+
+    :param value: The value.
+    :param name: The argument name.
+    :param guards: guard string or guard object.
+    :param message: A personalized message in case of an error.
+    :param params: The values of the template placeholders.
+
+    :return: Returns a GuardResult.
+    """
+    return Guards.check(value, name, guards, message, params)
+
+
+def guard_all(
+        values: Dict[str, Any],
+        guards: Dict[str, Union[str, IGuarder]],
+        messages: Dict[str, str] = None
+
+) -> GuardResult:
+    """
+    Guards all arguments in a dictionary. Equivalent as calling the guard
+    function for each argument in the dictionary and combine result.
+    See the guard function for more guards information.
+
+    :param values: the dict containing values
+    :param guards: the dict containing guards
+    :param messages: the dict containing custom messages
+
+    :return: A combination of guard results
+    """
+
+    results = []
+
+    for key, value in values.items():
+        if key in guards:
+            results.append(check(
+                value,
+                key,
+                guards[key],
+                messages[key] if messages and key in messages else None
+            ))
+
+    return combine(results)
+
+
+def combine(results: List[GuardResult]) -> GuardResult:
+    """
+    Combines a list of GuardResults into a single GuardResult. If any
+    of the GuardResults are failures, the first failure will be returned.
+
+    :param results: The list of GuardResults.
+
+    :return: If it has failures in list, returns the first fail,
+    otherwise, return True.
+    """
+    return Guards.combine(results)
+
+
+def guarder(name: str):
+    """
+    A decorator for registering rules.
+    """
+
+    def decorator(cls: Type[IGuarder]):
+        Guards.register(name, cls)
+        return cls
+
+    return decorator
+
+
+if os.environ.get('OLYMPUS_GUARDS_CACHE'):
+    Guards.persistent(os.environ['OLYMPUS_GUARDS_CACHE'])
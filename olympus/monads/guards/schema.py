@@ -0,0 +1,168 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Compiled record validators. A Schema resolves the statement of every field once
+and validates a whole record with a single call, without building a
+GuardArgument per field.
+
+Example:
+
+    >>> schema = compile_schema({
+    ...     'name': 'required|regex[r"^[a-zA-Z ]+$"]',
+    ...     'age': 'ge[18]',
+    ... }, {'age': 'too young'})
+
+    >>> schema.validate({'name': 'Joe', 'age': 17})
+    fail(too young)
+
+    >>> schema.collect({'name': '', 'age': 17})
+    {'name': fail(name is required), 'age': fail(too young)}
+
+As in guard_all, the fields missing from the record are not checked. Fields are
+checked in schema order, not in record order as in guard_all, so when several
+fields fail, validate returns the failure of the first one in the schema. A field whose guard raises fails with an
+EvaluationErrorResult, unless in strict mode; see the Guards.strict method.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .base import GuardResult, OK
+from .compiler import compile_field
+from .registry import EvaluationErrorResult, Guards
+
+"""
+The marker of fields missing from a record.
+"""
+_MISSING = object()
+
+
+def _error(statement: str, key: str, e: Exception) -> GuardResult:
+    """
+    Creates the failure of a field whose guard raised, or raises the error in
+    strict mode.
+    """
+    if Guards.__strict__:
+        raise e
+
+    return EvaluationErrorResult(statement, key, e)
+
+
+class Schema:
+    """
+    A record validator. Both validators are generated on creation, unrolled
+    over the fields, and set as attributes of the instance:
+
+        validate(record) -> GuardResult: the fail-fast validator; returns the
+        first failure of the record, or OK.
+
+        collect(record) -> Dict[str, GuardResult]: the collect-all validator;
+        returns the failures by field, empty if the record is valid.
+    """
+
+    """
+    The compiled fields: the field name, its statement and its compiled check.
+    """
+    fields: List[Tuple[str, str, Callable[[Any], GuardResult]]]
+
+    def __init__(self, guards: Dict[str, str], messages: Optional[Dict[str, str]] = None):
+        """
+        Resolves and compiles every field of the schema.
+
+        Raises:
+
+            InvalidStatementError: If a statement is invalid.
+
+        :param guards: The statement of each field.
+        :param messages: The personalized message of each field, if any.
+        """
+        messages = messages or {}
+
+        self.guards = dict(guards)
+        self.messages = dict(messages)
+        self.fields = []
+
+        for key, statement in self.guards.items():
+            resolved = Guards.resolve(statement)
+
+            self.fields.append((key, statement, compile_field(resolved, key, messages.get(key), statement)))
+
+        self.validate = self._compile(
+            lambda key: [
+                'if not failure:',
+                '    return failure',
+            ],
+            result='OK',
+        )
+        self.collect = self._compile(
+            lambda key: [
+                'if not failure:',
+                f'    failures[{key}] = failure',
+            ],
+            result='failures',
+            setup='failures = {}',
+        )
+
+    def _compile(self, check: Callable[[str], List[str]], result: str, setup: Optional[str] = None) -> Callable:
+        """
+        Generates a validator unrolled over the fields. For each field present
+        in the record, the value is checked and the lines emitted by check run
+        with `failure` bound to the result.
+
+        :param check: Emits the lines run for each present field, given the
+        name of the variable holding the field name.
+        :param result: The expression returned at the end.
+        :param setup: A line run before the fields.
+
+        :return: Returns the validator.
+        """
+        namespace = {'MISSING': _MISSING, 'OK': OK, 'error': _error}
+        lines = ['def validator(record):', '    get = record.get']
+
+        if setup:
+            lines.append(f'    {setup}')
+
+        for i, (key, statement, f) in enumerate(self.fields):
+            namespace[f'_k{i}'] = key
+            namespace[f'_c{i}'] = f
+            namespace[f'_s{i}'] = statement
+
+            lines += [
+                f'    value = get(_k{i}, MISSING)',
+                f'    if value is not MISSING:',
+                f'        try:',
+                f'            failure = _c{i}(value)',
+                f'        except Exception as e:',
+                f'            failure = error(_s{i}, _k{i}, e)',
+                *(f'        {line}' for line in check(f'_k{i}')),
+            ]
+
+        lines.append(f'    return {result}')
+
+        exec(compile('\n'.join(lines), '<schema>', 'exec'), namespace)
+
+        return namespace['validator']
+
+    def __call__(self, record: Dict[str, Any]) -> GuardResult:
+        return self.validate(record)
+
+    def __repr__(self):
+        return f"Schema({self.guards})"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+def compile_schema(guards: Dict[str, str], messages: Optional[Dict[str, str]] = None) -> Schema:
+    """
+    Compiles the guards of a record. Equivalent to guard_all, resolved once,
+    except that the fields are checked in schema order rather than in record
+    order. See the Schema class.
+
+    :param guards: the dict containing guards
+    :param messages: the dict containing custom messages
+
+    :return: A compiled Schema
+    """
+    return Schema(guards, messages)
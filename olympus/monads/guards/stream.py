@@ -0,0 +1,162 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Streaming validation. guard_stream validates the records of any iterable
+lazily, one at a time, and read_records reads the records of JSONL and CSV
+files in bounded chunks, so exports of any size are validated in constant
+memory. JSON files holding an array of records are read whole.
+
+Example:
+
+    >>> schema = {'name': 'required', 'age': 'ge[18]'}
+    >>> for index, record, result in guard_file('users.jsonl', schema):
+    ...     if not result:
+    ...         print(index, result.get_message())
+    3 age must be greater than or equal to 18
+
+    >>> for index, record, result in guard_file('users.csv', schema, types={'age': int}, use_mmap=True):
+    ...     ...
+"""
+
+import csv
+import json
+import mmap
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from .base import GuardResult
+from .schema import Schema, compile_schema
+
+"""
+A type alias for the validated records: the index, the record and its result.
+"""
+Validated = Tuple[int, Dict[str, Any], GuardResult]
+
+"""
+The record formats, by file extension.
+"""
+FORMATS = {'.jsonl': 'jsonl', '.ndjson': 'jsonl', '.json': 'json', '.csv': 'csv'}
+
+
+def guard_stream(
+        records: Iterable[Dict[str, Any]],
+        schema: Union[Schema, Dict[str, str]],
+        messages: Optional[Dict[str, str]] = None
+) -> Iterator[Validated]:
+    """
+    Validates records lazily. Equivalent to calling guard_all on each record,
+    with the schema compiled once; see the Schema class.
+
+    :param records: The records, any iterable of dicts.
+    :param schema: A Schema, or the statement of each field.
+    :param messages: The personalized message of each field, if any. Ignored
+    when schema is a Schema.
+
+    :return: Returns an iterator of (index, record, GuardResult).
+    """
+    if not isinstance(schema, Schema):
+        schema = compile_schema(schema, messages)
+
+    validate = schema.validate
+
+    for index, record in enumerate(records):
+        yield index, record, validate(record)
+
+
+def _lines(path: str, chunksize: int, use_mmap: bool) -> Iterator[bytes]:
+    """
+    Reads the lines of a file, through a buffer of chunksize bytes or a
+    memory map.
+    """
+    with open(path, 'rb', buffering=chunksize) as f:
+        if not use_mmap or os.fstat(f.fileno()).st_size == 0:
+            yield from f
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            yield from iter(m.readline, b'')
+
+
+def read_records(
+        path: str,
+        format: Optional[str] = None,
+        types: Optional[Dict[str, Callable[[str], Any]]] = None,
+        chunksize: int = 1 << 16,
+        use_mmap: bool = False,
+        encoding: str = 'utf-8'
+) -> Iterator[Dict[str, Any]]:
+    """
+    Reads the records of a JSONL, JSON or CSV file lazily. JSONL files hold
+    one JSON object per line; blank lines are skipped. JSON files hold a
+    top-level array of records and are loaded whole. CSV files have a header
+    row and their values are strings, converted by the types mapping; empty
+    converted values are read as None.
+
+    Raises:
+
+        ValueError: If the format is unknown, or a JSON file does not hold an
+        array.
+
+    :param path: The file path.
+    :param format: 'jsonl', 'json' or 'csv'; guessed from the extension by
+    default.
+    :param types: The conversion of CSV columns, e.g. {'age': int}.
+    :param chunksize: The read buffer size, in bytes.
+    :param use_mmap: Whether to read the file through a memory map.
+    :param encoding: The file encoding.
+
+    :return: Returns an iterator of records.
+    """
+    format = format or FORMATS.get(os.path.splitext(path)[1].lower())
+
+    if format not in ('jsonl', 'json', 'csv'):
+        raise ValueError(f"Unknown record format of {path}, expected jsonl, json or csv")
+
+    if format == 'json':
+        with open(path, encoding=encoding) as f:
+            records = json.load(f)
+
+        if not isinstance(records, list):
+            raise ValueError(f"Invalid records in {path}: expected a JSON array")
+
+        yield from records
+        return
+
+    lines = _lines(path, chunksize, use_mmap)
+
+    if format == 'jsonl':
+        for line in lines:
+            if line.strip():
+                yield json.loads(line.decode(encoding))
+        return
+
+    types = types or {}
+
+    for row in csv.DictReader(line.decode(encoding) for line in lines):
+        for key, convert in types.items():
+            if key in row:
+                row[key] = convert(row[key]) if row[key] != '' else None
+
+        yield row
+
+
+def guard_file(
+        path: str,
+        schema: Union[Schema, Dict[str, str]],
+        messages: Optional[Dict[str, str]] = None,
+        **options
+) -> Iterator[Validated]:
+    """
+    Validates the records of a JSONL, JSON or CSV file lazily. See the guard_stream
+    and read_records functions.
+
+    :param path: The file path.
+    :param schema: A Schema, or the statement of each field.
+    :param messages: The personalized message of each field, if any.
+    :param options: The read_records options.
+
+    :return: Returns an iterator of (index, record, GuardResult).
+    """
+    return guard_stream(read_records(path, **options), schema, messages)
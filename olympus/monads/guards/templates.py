@@ -0,0 +1,329 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+"""
+Statement templates. A template is a statement whose arguments may be
+placeholders, $ followed by a name, bound to the values of a params dict on
+each call:
+
+    >>> guard({'name': 'amount', 'value': 120}, 'required|le[$limit]', params={'limit': account.limit})
+    fail(amount must be less than or equal to 100)
+
+    >>> guard({'name': 'code', 'value': 'BR'}, 'in[$allowed]', params={'allowed': codes})
+    ok()
+
+A template is parsed and compiled once, whatever the values it is bound to, so
+the statements cache holds one entry per template instead of one per runtime
+value. The conditions of builtin guards are inlined with the placeholders read
+from params; guards whose arguments are prepared when resolved, such as regex
+and in, are created with the bound arguments, and reused while the values are
+the same; see the Bound class. Templates are not optimized, since their
+bounds are only known at call time.
+
+Placeholders are bound only when params are given; without params, $limit is
+the plain word '$limit'.
+"""
+
+import re
+import string
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from .base import AbstractGuard, ComplexArg, GuardArgument, GuardResult, IGuarder, RawArg
+from .compiler import _behavior, _body, _build, _namespace, _owner, call
+
+"""
+The container types whose placeholder values are keyed by a snapshot of
+their contents in the bound guards.
+"""
+_CONTAINERS = frozenset((list, tuple, dict, set, frozenset, bytearray))
+
+"""
+A placeholder argument.
+"""
+PLACEHOLDER = re.compile(r'^\$([A-Za-z_]\w*)\s*$')
+
+
+def placeholder(arg: Any) -> Optional[str]:
+    """
+    Gets the name of a placeholder argument.
+
+    :param arg: The argument.
+
+    :return: Returns the placeholder name, or None when the argument is not
+    a placeholder.
+    """
+    if type(arg) is not str:
+        return None
+
+    match = PLACEHOLDER.match(arg)
+
+    return match.group(1) if match else None
+
+
+def placeholders(args: List[Union[RawArg, ComplexArg]]) -> List[str]:
+    """
+    Gets the names of the placeholders of a list of arguments, lists and
+    tuples included.
+
+    :param args: The arguments.
+
+    :return: Returns the placeholder names.
+    """
+    names = []
+
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            names += placeholders(arg)
+        elif placeholder(arg) is not None:
+            names.append(placeholder(arg))
+
+    return names
+
+
+def snapshot(value: Any) -> Any:
+    """
+    Gets a hashable snapshot of a placeholder value, with its type, so that
+    equal snapshots bind to equivalent guards. Containers are copied by
+    contents, so a list changed in place gets a new snapshot.
+
+    Raises:
+
+        TypeError: If the value, or an item of a container, is unhashable.
+
+    :param value: The value.
+
+    :return: Returns the snapshot.
+    """
+    cls = type(value)
+
+    if cls not in _CONTAINERS:
+        hash(value)
+        return cls, value
+
+    if cls is dict:
+        return cls, tuple([(snapshot(k), snapshot(v)) for k, v in value.items()])
+
+    if cls is bytearray:
+        return cls, bytes(value)
+
+    if cls is set or cls is frozenset:
+        return cls, frozenset([snapshot(v) for v in value])
+
+    return cls, tuple([snapshot(v) for v in value])
+
+
+def substitute(args: List[Union[RawArg, ComplexArg]], params: Dict[str, Any]) -> List[Union[RawArg, ComplexArg]]:
+    """
+    Binds the placeholders of a list of arguments.
+
+    Raises:
+
+        KeyError: If a placeholder has no value.
+
+    :param args: The arguments.
+    :param params: The values of the placeholders.
+
+    :return: Returns the bound arguments.
+    """
+    bound = []
+
+    for arg in args:
+        if isinstance(arg, list):
+            bound.append(substitute(arg, params))
+        elif isinstance(arg, tuple):
+            bound.append(tuple(substitute(list(arg), params)))
+        else:
+            name = placeholder(arg)
+            bound.append(params[name] if name is not None else arg)
+
+    return bound
+
+
+class Bound(AbstractGuard):
+    """
+    A guard of a template whose arguments have placeholders. Its condition is
+    inlined when the guard expression only refers to positional arguments;
+    otherwise the guard is created with the bound arguments, e.g. the member
+    set of in or the pattern of regex.
+
+    The created guards are kept for the `maxsize` most recently used
+    placeholder values, so a template called with the same values creates its
+    guard once. The values are keyed by a snapshot of their contents, so a
+    list of allowed values changed in place binds a new guard. Guards bound
+    to values that cannot be snapshot, such as instances of unhashable
+    classes, are not kept.
+    """
+
+    """
+    The number of created guards kept.
+    """
+    maxsize: int = 16
+
+    def __init__(self, guard: Type[IGuarder], negate: bool, name: str, args: List[Union[RawArg, ComplexArg]]):
+        super().__init__(negate, name, args)
+        self.guard = guard
+        self.names = list(dict.fromkeys(placeholders(args)))
+        self.bound: 'OrderedDict[Tuple[Any, ...], IGuarder]' = OrderedDict()
+
+    def bind(self, params: Dict[str, Any]) -> IGuarder:
+        """
+        Creates the guard with the bound arguments, or gets the guard created
+        for the same values.
+
+        Raises:
+
+            KeyError: If a placeholder has no value.
+
+        :param params: The values of the placeholders.
+
+        :return: Returns the guard.
+        """
+        try:
+            key = tuple([snapshot(params[name]) for name in self.names])
+        except TypeError:
+            # values that cannot be snapshot are bound on every call
+            return self.guard.new(self.negate, self.name, substitute(self.args, params))
+
+        g = self.bound.get(key)
+
+        if g is not None:
+            try:
+                self.bound.move_to_end(key)
+            except KeyError:
+                # another thread evicted meanwhile
+                pass
+
+            return g
+
+        g = self.guard.new(self.negate, self.name, substitute(self.args, params))
+        self.bound[key] = g
+
+        if len(self.bound) > self.maxsize:
+            try:
+                self.bound.popitem(last=False)
+            except KeyError:
+                # another thread evicted meanwhile
+                pass
+
+        return g
+
+    def failure(self, name: Any, params: Dict[str, Any]) -> GuardResult:
+        """
+        Creates the failure of a value, with the message of the bound guard.
+        """
+        g = self.bind(params)
+
+        return GuardResult(False, None, g, name, g.params())
+
+    def is_satisfied_by(self, argument: GuardArgument) -> GuardResult:
+        raise TypeError(f"Guard {self.name} has placeholders, bind its template with params")
+
+    def _expression(self, i: int, namespace: Dict[str, Any]) -> Optional[str]:
+        """
+        Builds the inlined condition, with the placeholders read from params.
+        """
+        cls = self.guard
+        expression = getattr(cls, 'expression', None)
+
+        if expression is None or _owner(cls, 'expression') is not _behavior(cls):
+            return None
+
+        fields = [field for _, field, _, _ in string.Formatter().parse(expression) if field is not None]
+
+        if not all(field.isdigit() and int(field) < len(self.args) for field in fields):
+            return None
+
+        if any(isinstance(arg, (list, tuple)) and placeholders(arg) for arg in self.args):
+            return None
+
+        constants = []
+
+        for j, arg in enumerate(self.args):
+            name = placeholder(arg)
+
+            if name is not None:
+                constants.append(f'params[{name!r}]')
+            else:
+                namespace[f'_g{i}_{j}'] = arg
+                constants.append(f'_g{i}_{j}')
+
+        return expression.format(*constants)
+
+    def emit(self, i: int, namespace: Dict[str, Any], name: str, delegate: str) -> List[str]:
+        """
+        Emits the evaluation of the guard; see the compiler module.
+
+        :return: Returns the body lines.
+        """
+        expression = self._expression(i, namespace)
+
+        if expression is None:
+            return [
+                f'    r = {call(self.guard, f"_g{i}.bind(params)", name)}',
+                f'    if not r:',
+                f'        {delegate}',
+            ]
+
+        return [
+            f'    if {expression if self.negate else f"not ({expression})"}:',
+            f'        return _g{i}.failure({name}, params)',
+        ]
+
+    def __repr__(self):
+        return f"Bound({self.guard.__name__}, {self.negate}, {self.args})"
+
+
+class Template:
+    """
+    A compiled template. Calling it validates an argument with the values of
+    the placeholders. The validators are generated on creation and set as
+    attributes of the instance:
+
+        is_satisfied_by(argument, params) -> GuardResult: validates a
+        GuardArgument.
+
+        check(value, name, params) -> GuardResult: validates a value, given
+        with its argument name.
+
+    Both raise a KeyError when a placeholder has no value.
+    """
+
+    def __init__(self, guards: List[IGuarder], statement: str = '<guard>'):
+        """
+        Compiles the guards of a template, the guards with placeholders given
+        as Bound guards.
+
+        :param guards: The guards, in evaluation order.
+        :param statement: The template.
+        """
+        self.guards = guards
+        self.statement = statement
+        self.placeholders = sorted({name for g in guards if isinstance(g, Bound) for name in placeholders(g.args)})
+
+        namespace = _namespace()
+        body = _body(guards, namespace)
+
+        source = '\n'.join([
+            'def check(value, name, params):',
+            *body,
+            '    return OK',
+            '',
+            'def compiled(argument, params):',
+            "    value = argument['value']",
+            "    name = argument['name']",
+            *body,
+            '    return OK',
+            '',
+            'compiled.check = check',
+        ])
+
+        self.is_satisfied_by = _build(source, namespace, statement)
+        self.check = self.is_satisfied_by.check
+
+    def __call__(self, argument: GuardArgument, params: Dict[str, Any]) -> GuardResult:
+        return self.is_satisfied_by(argument, params)
+
+    def __repr__(self):
+        return f"Template({self.statement!r}, {self.placeholders})"
@@ -25,4 +25,7 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License"
     ],
     python_requires='>=3.9',
+    extras_require={
+        'numpy': ['numpy'],
+    },
 )
@@ -0,0 +1,71 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import importlib.util
+
+import pytest
+
+from olympus.monads.guards import CompiledModuleError, Guards, check, compile_statements
+from olympus.monads.guards.builtins import Between
+
+STATEMENTS = [
+    'required|between[1, 10]',
+    'required|between[2, 20]',
+    '!empty|ge[1]|le[10]',
+    'in[a, b, c]',
+    'regex[r"^[a-z]{3}$"]',
+]
+
+VALUES = [None, '', 'abc', 'abcd', 'b', 0, 1, 5, 10, 15, 25]
+
+
+def load(tmp_path, statements):
+    path = tmp_path / 'guards_compiled.py'
+    compile_statements(statements, out=str(path))
+
+    spec = importlib.util.spec_from_file_location('guards_compiled', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def outcome(value, statement):
+    try:
+        r = check(value, 'x', statement)
+        return bool(r), r.get_message()
+    except Exception as e:
+        return type(e)
+
+
+def test_loaded_statements_match_the_compiled_ones(tmp_path):
+    module = load(tmp_path, STATEMENTS)
+
+    Guards.cache_clear()
+    expected = {(v, s): outcome(v, s) for s in STATEMENTS for v in VALUES}
+
+    Guards.cache_clear()
+    Guards.load_compiled(module)
+
+    assert Guards.cache_info().currsize == len(STATEMENTS)
+    assert {(v, s): outcome(v, s) for s in STATEMENTS for v in VALUES} == expected
+    assert Guards.cache_info().misses == 0
+
+
+def test_statements_differing_by_arguments_share_a_factory(tmp_path):
+    module = load(tmp_path, STATEMENTS)
+
+    assert module.STATEMENTS[0][-1] is module.STATEMENTS[1][-1]
+
+
+def test_module_compiled_against_another_version_is_rejected(tmp_path, monkeypatch):
+    module = load(tmp_path, STATEMENTS)
+    monkeypatch.setattr(Between, 'version', Between.version + 1)
+
+    Guards.cache_clear()
+
+    with pytest.raises(CompiledModuleError):
+        Guards.load_compiled(module)
+
+    assert Guards.cache_info().currsize == 0
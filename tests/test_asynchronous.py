@@ -0,0 +1,96 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import asyncio
+
+import pytest
+
+from olympus.monads.guards import OK, EvaluationErrorResult, Guards, guarder
+from olympus.monads.guards.asynchronous import AsyncGuard, __plans__, guard_all_async, guard_async
+
+
+@guarder(name='taken_test')
+class Taken(AsyncGuard):
+    message = '{name} is already taken'
+
+    async def is_satisfied_by_async(self, argument):
+        await asyncio.sleep(0)
+        return self.fail(argument) if argument['value'] == 'joe' else OK
+
+
+@guarder(name='down_test')
+class Down(AsyncGuard):
+    async def is_satisfied_by_async(self, argument):
+        raise RuntimeError('db down')
+
+
+@guarder(name='slow_test')
+class Slow(AsyncGuard):
+    timeout = 0.01
+    timeout_message = '{name} timed out'
+
+    async def is_satisfied_by_async(self, argument):
+        await asyncio.sleep(1)
+        return OK
+
+
+@guarder(name='lazy_test')
+class Lazy(AsyncGuard):
+    pass
+
+
+@pytest.fixture
+def strict():
+    Guards.strict()
+    yield
+    Guards.strict(False)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_async_guards_run_after_the_sync_ones():
+    assert run(guard_async({'name': 'login', 'value': 'ann'}, 'required|taken_test'))
+    assert run(guard_async({'name': 'login', 'value': 'joe'}, 'required|taken_test')).message == \
+        'login is already taken'
+    assert run(guard_async({'name': 'login', 'value': None}, 'required|taken_test')).message == 'login is required'
+
+
+def test_raising_guard_fails_with_an_error_result():
+    r = run(guard_async({'name': 'email', 'value': 'a'}, 'down_test'))
+
+    assert isinstance(r, EvaluationErrorResult)
+    assert isinstance(r.error, RuntimeError)
+
+
+def test_raising_guard_does_not_abort_the_other_fields():
+    r = run(guard_all_async({'email': 'a', 'login': 'joe'}, {'email': 'down_test', 'login': 'taken_test'}))
+
+    assert isinstance(r, EvaluationErrorResult)
+    assert r.name == 'email'
+
+
+def test_raising_guard_raises_in_strict_mode(strict):
+    with pytest.raises(RuntimeError):
+        run(guard_async({'name': 'email', 'value': 'a'}, 'down_test'))
+
+
+def test_timeout_fails_with_the_timeout_message():
+    assert run(guard_async({'name': 'email', 'value': 'a'}, 'slow_test')).message == 'email timed out'
+
+
+def test_guard_without_implementation_raises(strict):
+    with pytest.raises(NotImplementedError):
+        run(guard_async({'name': 'email', 'value': 'a'}, 'lazy_test'))
+
+
+def test_plans_are_cleared_with_the_cache():
+    run(guard_async({'name': 'login', 'value': 'ann'}, 'taken_test'))
+
+    assert __plans__.get('taken_test') is not None
+
+    Guards.cache_clear()
+
+    assert __plans__.get('taken_test') is None
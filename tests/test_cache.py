@@ -0,0 +1,88 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import threading
+
+import pytest
+
+from olympus.monads.guards import Guards, StatementCache, check
+
+
+@pytest.fixture(autouse=True)
+def clear():
+    Guards.cache_clear()
+    yield
+    Guards.cache_clear()
+
+
+def test_cold_statements_count_misses():
+    for statement in ('required', 'ge[1]', 'le[10]'):
+        check(5, 'x', statement)
+
+    check(5, 'x', 'required')
+
+    info = Guards.cache_info()
+
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 3)
+
+
+def test_equivalent_statements_share_one_compiled_guard():
+    check(5, 'x', 'ge[1]|le[10]')
+    check(5, 'x', 'ge[1] | le[10]')
+
+    info = Guards.cache_info()
+
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_evicted_statements_count_one_miss():
+    Guards.cache_resize(1)
+
+    try:
+        check(5, 'x', 'ge[1]')
+        check(5, 'x', 'le[10]')
+        check(5, 'x', 'ge[1]')
+
+        info = Guards.cache_info()
+
+        assert (info.hits, info.misses, info.evictions) == (0, 3, 2)
+    finally:
+        Guards.cache_resize(1024)
+
+
+def test_get_or_create_runs_the_factory_once():
+    cache = StatementCache(8)
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def factory(statement):
+        calls.append(statement)
+        return statement.upper()
+
+    def worker():
+        barrier.wait()
+        cache.get_or_create('required', factory)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+
+    for t in threads:
+        t.start()
+
+    for t in threads:
+        t.join()
+
+    assert calls == ['required']
+    assert cache.info().misses == 1
+    assert cache.info().hits == 7
+
+
+def test_lru_eviction():
+    cache = StatementCache(2)
+    cache['a'] = 1
+    cache['b'] = 2
+    cache.get('a')
+    cache['c'] = 3
+
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.info().evictions == 1
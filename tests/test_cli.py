@@ -0,0 +1,73 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import io
+import json
+
+import pytest
+
+from olympus.monads.guards.cli import main
+
+SCHEMA = {'guards': {'name': 'required', 'age': 'ge[18]'}, 'messages': {'age': 'too young'}}
+
+
+@pytest.fixture
+def files(tmp_path):
+    def write(records, schema=SCHEMA):
+        data = tmp_path / 'data.jsonl'
+        data.write_text(''.join(json.dumps(record) + '\n' for record in records))
+
+        path = tmp_path / 'schema.json'
+        path.write_text(json.dumps(schema))
+
+        return ['validate', '--schema', str(path), str(data)]
+
+    return write
+
+
+def run(argv):
+    out = io.StringIO()
+    status = main(argv, out)
+
+    return status, out.getvalue()
+
+
+def test_valid_records_exit_with_0(files):
+    status, out = run(files([{'name': 'Joe', 'age': 20}, {'name': 'Ann', 'age': 30}]))
+
+    assert status == 0
+    assert 'validated 2 records' in out
+    assert 'failed records: 0' in out
+
+
+def test_failing_records_exit_with_1(files):
+    status, out = run(files([{'name': 'Joe', 'age': 20}, {'name': '', 'age': 17}]))
+
+    assert status == 1
+    assert 'failed records: 1' in out
+    assert '#1 age: too young' in out
+
+
+def test_invalid_schema_exits_with_2(files):
+    assert run(files([{'name': 'Joe'}], schema=['required']))[0] == 2
+    assert run(files([{'name': 'Joe'}], schema={'name': 1}))[0] == 2
+
+
+def test_invalid_statement_exits_with_2(files):
+    assert run(files([{'name': 'Joe'}], schema={'name': 'length['}))[0] == 2
+    assert run(files([{'name': 'Joe'}], schema={'name': 'undefined'}))[0] == 2
+
+
+def test_missing_file_exits_with_2(files, tmp_path):
+    argv = files([])
+    argv[-1] = str(tmp_path / 'missing.jsonl')
+
+    assert run(argv)[0] == 2
+
+
+def test_usage_errors_exit_with_2():
+    with pytest.raises(SystemExit) as e:
+        main(['validate'], io.StringIO())
+
+    assert e.value.code == 2
@@ -0,0 +1,92 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import pytest
+
+from olympus.monads.guards import EvaluationErrorResult, Guards, check, compile_field, compile_guards
+
+STATEMENTS = [
+    'required',
+    '!required',
+    'empty',
+    '!empty',
+    'length[3]',
+    '!length[3]',
+    'between[1, 10]',
+    '!between[1, 10]',
+    'regex[r"^[a-z]+$"]',
+    'in[a, b, 1]',
+    '!in[a, b, 1]',
+    'le[10]',
+    'lt[10]',
+    'ge[1]',
+    'gt[1]',
+    'odd',
+    'even',
+    'positive',
+    'negative',
+    'eq[1]',
+    '!eq[1]',
+    'required|length[3]|regex[r"^[a-z]+$"]',
+]
+
+VALUES = [None, '', 'a', 'abc', 'ABC', [], [1, 2, 3], {}, 0, 1, 2, -3, 5, 10, 11, 2.5, True, False]
+
+
+def interpreted(statement, value):
+    """
+    Evaluates the guards of a statement one by one, as the uncompiled
+    CompoundedGuard did.
+    """
+    for g in Guards.resolve(statement):
+        r = g.is_satisfied_by({'name': 'x', 'value': value})
+
+        if not r:
+            return r
+
+    return None
+
+
+def outcome(f, *args):
+    try:
+        r = f(*args)
+    except Exception as e:
+        return type(e)
+
+    if isinstance(r, EvaluationErrorResult):
+        return type(r.error)
+
+    return None if r is None or r else r.get_message()
+
+
+@pytest.mark.parametrize('statement', STATEMENTS)
+def test_compiled_statement_matches_the_interpreted_guards(statement):
+    guards = Guards.resolve(statement)
+    compiled = compile_guards(guards, statement)
+    field = compile_field(guards, 'x', None, statement)
+
+    for value in VALUES:
+        expected = outcome(interpreted, statement, value)
+
+        assert outcome(compiled, {'name': 'x', 'value': value}) == expected, value
+        assert outcome(compiled.check, value, 'x') == expected, value
+        assert outcome(field, value) == expected, value
+        assert outcome(check, value, 'x', statement) == expected, value
+
+
+def test_field_with_a_personalized_message_keeps_the_failing_guard():
+    field = compile_field(Guards.resolve('required|lt[18]'), 'age', 'too old')
+
+    r = field(20)
+
+    assert r.get_message() == 'too old'
+    assert r.guard.name == 'lt'
+    assert field(10)
+
+
+def test_compiled_function_keeps_its_statement_and_source():
+    compiled = compile_guards(Guards.resolve('required|lt[18]'), 'required|lt[18]')
+
+    assert compiled.statement == 'required|lt[18]'
+    assert 'def check(value, name):' in compiled.source
@@ -0,0 +1,50 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import pytest
+
+from olympus.monads.guards import OK, AbstractGuard, Guards, check, guarder
+
+
+@guarder(name='counter_test')
+class Counter(AbstractGuard):
+    """
+    Fails every other call: an impure guard.
+    """
+
+    message = '{name} failed on call {calls}'
+    calls = 0
+
+    def check(self, value, name):
+        Counter.calls += 1
+        return self.reject(name, calls=Counter.calls) if Counter.calls % 2 == 0 else OK
+
+
+@pytest.fixture(autouse=True)
+def memoize():
+    Guards.memoize(maxsize=4)
+    yield
+    Guards.memoize(False)
+
+
+def test_pure_statements_are_memoized():
+    for _ in range(3):
+        assert not check(3, 'age', 'required|ge[18]')
+
+    info = Guards.memo_info('required|ge[18]')
+
+    assert (info.hits, info.misses) == (2, 1)
+
+
+def test_unhashable_values_bypass_the_memo():
+    check([1], 'items', 'required')
+
+    assert Guards.memo_info('required').bypasses == 1
+
+
+def test_impure_statements_are_not_memoized():
+    results = [bool(check(1, 'x', 'required|counter_test')) for _ in range(4)]
+
+    assert results == [True, False, True, False]
+    assert Guards.memo_info('required|counter_test') is None
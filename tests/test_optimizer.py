@@ -0,0 +1,88 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+from typing import Any
+
+import pytest
+
+from olympus.monads.guards import OK, ContradictionError, Guards, GuardResult, Range, guard, guarder, optimize
+from olympus.monads.guards.builtins import Required
+
+STATEMENTS = [
+    'required|!empty',
+    'required|!empty|ge[1]|le[10]',
+    'ge[1]|gt[0]|le[10]|lt[11]',
+    'gt[-5]|lt[5]',
+    'required|length[3]',
+    '!empty|between[2, 5]',
+    'required|in[a, b, c]',
+    'ge[0]|required|le[100]',
+]
+
+VALUES = [None, '', 'a', 'abc', 'abcdef', 0, 1, 5, 10, 11, -5, 99, 100, 101, [], [1, 2, 3]]
+
+
+def unoptimized(value: Any, statement: str) -> GuardResult:
+    """
+    Evaluates the guards of a statement one by one, without the optimizer.
+    """
+    for raw in Guards.parse(statement):
+        r = Guards.get(raw[1]).new(*raw).check(value, 'x')
+
+        if not r:
+            return r
+
+    return OK
+
+
+def outcome(f, *args):
+    try:
+        r = f(*args)
+        return bool(r), r.get_message()
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize('statement', STATEMENTS)
+def test_optimized_statements_are_equivalent(statement):
+    for value in VALUES:
+        expected = outcome(unoptimized, value, statement)
+
+        if isinstance(expected, type):
+            # the optimized statement returns an error result instead
+            continue
+
+        assert outcome(guard, {'name': 'x', 'value': value}, statement) == expected, (statement, value)
+
+
+def test_redundant_guards_are_dropped_and_bounds_merged():
+    nodes = Guards.resolve('required|!empty|ge[1]|le[10]')
+
+    assert len(nodes) == 2
+    assert isinstance(nodes[0], Required)
+    assert isinstance(nodes[1], Range)
+
+
+@pytest.mark.parametrize('statement', ['gt[10]|lt[5]', 'required|!required'])
+def test_contradictions_are_reported(statement):
+    guards = [Guards.get(raw[1]).new(*raw) for raw in Guards.parse(statement)]
+
+    with pytest.raises(ContradictionError):
+        optimize(guards, statement)
+
+
+def test_subclass_overriding_check_is_not_deduplicated():
+    @guarder(name='nonblank_test')
+    class NonBlank(Required):
+        message = '{name} must not be blank'
+        pure = True
+
+        def check(self, value: Any, name: Any) -> GuardResult:
+            return self.reject(name) if not str(value).strip() else OK
+
+    r = guard({'name': 'x', 'value': '   '}, 'required|nonblank_test')
+
+    assert not r
+    assert r.message == 'x must not be blank'
+    assert len(Guards.resolve('required|nonblank_test')) == 2
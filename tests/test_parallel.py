@@ -0,0 +1,51 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import pytest
+
+from olympus.monads.guards import compile_schema, guard_many
+
+GUARDS = {'name': 'required', 'age': 'ge[18]'}
+
+MESSAGES = {'age': 'too young'}
+
+RECORDS = [
+    {'name': 'Joe', 'age': 20},
+    {'name': '', 'age': 17},
+    {'name': 'Ann', 'age': 17},
+    {'name': 'Bob'},
+] * 25
+
+
+def collected(fail_fast=False):
+    schema = compile_schema(GUARDS, MESSAGES)
+    failures = []
+
+    for i, record in enumerate(RECORDS):
+        for field, failure in schema.collect(record).items():
+            failures.append((i, field, failure.guard.name, failure.get_message()))
+
+            if fail_fast:
+                break
+
+    return failures
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_failures_are_reported_in_record_order(workers):
+    failures = list(guard_many(RECORDS, GUARDS, MESSAGES, workers=workers, chunksize=7))
+
+    assert failures == collected()
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_fail_fast_reports_the_first_failure_of_each_record(workers):
+    failures = list(guard_many(RECORDS, compile_schema(GUARDS, MESSAGES), workers=workers, fail_fast=True))
+
+    assert failures == collected(fail_fast=True)
+
+
+def test_chunksize_must_be_positive():
+    with pytest.raises(ValueError):
+        guard_many(RECORDS, GUARDS, chunksize=0)
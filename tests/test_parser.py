@@ -0,0 +1,81 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import pytest
+
+from olympus.monads.guards import Guards
+from olympus.monads.guards.parser import ExpectedPunctuatorError, InvalidPunctuatorError, StatementParser, canonical
+
+# The outputs of the original single-module StatementParser, quirks included,
+# which the rewritten parser must reproduce.
+PARSED = [
+    ('required', [(False, 'required', [])]),
+    ('!required', [(True, 'required', [])]),
+    ('required|length[3]', [(False, 'required', []), (False, 'length', [3])]),
+    ('between[1, 10]', [(False, 'between', [1, 10])]),
+    ('between[-1.5, 2e3]', [(False, 'between', ['-1.5', '2e3'])]),
+    ('in[a, b, c]', [(False, 'in', ['a', 'b', 'c'])]),
+    ('in[[a, b], c]', [(False, 'in', [['a', 'b'], 'c'])]),
+    ('in[(1, 2), 3]', [(False, 'in', [(1, 2), 3])]),
+    ("regex['^[a-z]+$']", [(False, 'regex', ["'^", ['a-z'], "+$'"])]),
+    ('regex[r"^[a-z]{3}$"]', [(False, 'regex', ['^[a-z]{3}$'])]),
+    ('eq[true]', [(False, 'eq', [True])]),
+    ('eq[false]', [(False, 'eq', [False])]),
+    ('eq[null]', [(False, 'eq', ['null'])]),
+    ('eq[None]', [(False, 'eq', [None])]),
+    ('eq[True]', [(False, 'eq', [True])]),
+    ('required | length[3]', [(False, 'required', []), (False, 'length', [3])]),
+    (' required ', [(False, 'required', [])]),
+    ('!empty|ge[1]|le[10]', [(True, 'empty', []), (False, 'ge', [1]), (False, 'le', [10])]),
+    ('length[ 3 ]', [(False, 'length', ['3 '])]),
+    ('in[]', [(False, 'in', [])]),
+    ('eq[1_000]', [(False, 'eq', ['1_000'])]),
+    ('eq[0x10]', [(False, 'eq', ['0x10'])]),
+    ('eq[.5]', [(False, 'eq', ['.5'])]),
+    ('eq[-0]', [(False, 'eq', ['-0'])]),
+    ('', []),
+    ('!!required', [(True, '!required', [])]),
+    ('eq[a b]', [(False, 'eq', ['a b'])]),
+    ('eq[,1]', [(False, 'eq', [1])]),
+]
+
+REJECTED = [
+    ('eq["a,b"]', InvalidPunctuatorError),
+    ("eq['x|y']", InvalidPunctuatorError),
+    ('in["a", \'b\']', InvalidPunctuatorError),
+    ('required||empty', InvalidPunctuatorError),
+    ('|', InvalidPunctuatorError),
+    ('required|', InvalidPunctuatorError),
+    ('length[', ExpectedPunctuatorError),
+    ('length]', InvalidPunctuatorError),
+    ('length[3', ExpectedPunctuatorError),
+    ('eq["abc]', InvalidPunctuatorError),
+    ('!', InvalidPunctuatorError),
+    ('in[[1, 2]', ExpectedPunctuatorError),
+    ('eq[1,]', InvalidPunctuatorError),
+]
+
+@pytest.mark.parametrize('statement, expected', PARSED)
+def test_parses_as_the_original_parser(statement, expected):
+    assert StatementParser(statement).parse() == expected
+
+
+@pytest.mark.parametrize('statement, error', REJECTED)
+def test_rejects_as_the_original_parser(statement, error):
+    with pytest.raises(error):
+        StatementParser(statement).parse()
+
+
+@pytest.mark.parametrize('statement, expected', PARSED)
+def test_cached_parse_matches_the_parser(statement, expected):
+    Guards.cache_clear()
+
+    assert Guards.parse(statement) == expected
+    assert Guards.parse(statement) == expected
+
+
+def test_equivalent_statements_share_a_canonical_key():
+    assert canonical(StatementParser('required | length[3]').parse()) \
+        == canonical(StatementParser('required|length[3]').parse())
+    assert canonical(StatementParser('length[3]').parse()) != canonical(StatementParser('length[4]').parse())
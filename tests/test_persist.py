@@ -0,0 +1,57 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import marshal
+
+import pytest
+
+from olympus.monads.guards import Guards
+
+
+@pytest.fixture
+def registry():
+    stored, maxsize = Guards.__stored__, Guards.__cache__.maxsize
+    yield Guards
+    Guards.__stored__ = stored
+    Guards.cache_resize(maxsize)
+    Guards.cache_clear()
+
+
+def persisted(path):
+    with open(path, 'rb') as f:
+        return list(marshal.load(f)['statements'])
+
+
+def test_persisted_statements_are_capped_to_the_cache_size(registry, tmp_path):
+    path = str(tmp_path / 'guards.cache')
+    registry.cache_resize(4)
+
+    for run in range(3):
+        registry.cache_clear()
+        registry.restore(path)
+
+        for i in range(4):
+            registry.parse(f'between[{run}, {i}]')
+
+        registry.persist(path)
+
+    assert persisted(path) == [f'between[2, {i}]' for i in range(4)]
+
+
+def test_restored_statements_fill_the_remaining_room(registry, tmp_path):
+    path = str(tmp_path / 'guards.cache')
+    registry.cache_resize(3)
+    registry.cache_clear()
+
+    registry.parse('required')
+    registry.parse('email')
+    registry.persist(path)
+
+    registry.cache_clear()
+    registry.restore(path)
+    registry.parse('integer')
+    registry.parse('email')
+    registry.persist(path)
+
+    assert persisted(path) == ['required', 'integer', 'email']
@@ -0,0 +1,72 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import pytest
+
+from olympus.monads.guards import EvaluationErrorResult, Guards, compile_schema, guard_all
+from olympus.monads.guards.base import AbstractGuard
+
+GUARDS = {
+    'name': 'required|regex[r"^[a-zA-Z ]+$"]',
+    'age': 'ge[18]',
+    'email': 'regex[r"^[a-z.]+@[a-z.]+$"]',
+}
+
+RECORDS = [
+    {'name': 'Joe', 'age': 20, 'email': 'joe@mail.com'},
+    {'name': 'Joe', 'age': 17},
+    {'name': '', 'age': 20},
+    {'name': 'J0e'},
+    {'email': 'joe'},
+    {},
+]
+
+
+class Broken(AbstractGuard):
+    message = '{name} is broken'
+
+    def check(self, value, name):
+        raise RuntimeError('broken')
+
+
+@pytest.fixture
+def broken():
+    Guards.register('broken', Broken)
+    yield
+    del Guards.__guards__['broken']
+    Guards.cache_clear()
+
+
+@pytest.mark.parametrize('record', RECORDS)
+def test_validate_matches_guard_all(record):
+    schema = compile_schema(GUARDS)
+
+    assert repr(schema.validate(record)) == repr(guard_all(record, GUARDS))
+
+
+def test_fields_are_checked_in_schema_order():
+    schema = compile_schema(GUARDS)
+    record = {'age': 17, 'name': ''}
+
+    assert schema.validate(record).get_message() == 'name is required'
+    assert list(schema.collect(record)) == ['name', 'age']
+
+
+def test_collect_returns_the_failures_by_field():
+    schema = compile_schema(GUARDS, {'age': 'too young'})
+
+    failures = schema.collect({'name': 'Joe', 'age': 17, 'email': 'joe'})
+
+    assert list(failures) == ['age', 'email']
+    assert failures['age'].get_message() == 'too young'
+    assert schema.collect(RECORDS[0]) == {}
+
+
+def test_field_whose_guard_raises_fails_with_an_error_result(broken):
+    schema = compile_schema({'name': 'required', 'code': 'broken'})
+
+    result = schema.validate({'name': 'Joe', 'code': 1})
+
+    assert isinstance(result, EvaluationErrorResult)
+    assert isinstance(schema.collect({'code': 1})['code'], EvaluationErrorResult)
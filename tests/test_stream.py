@@ -0,0 +1,57 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import json
+
+import pytest
+
+from olympus.monads.guards import guard_all, guard_file, guard_stream, read_records
+
+GUARDS = {'name': 'required', 'age': 'ge[18]'}
+
+RECORDS = [
+    {'name': 'Joe', 'age': 20},
+    {'name': '', 'age': 17},
+    {'name': 'Ann', 'age': 17},
+    {'name': 'Bob'},
+] * 25
+
+
+@pytest.fixture
+def jsonl(tmp_path):
+    path = tmp_path / 'records.jsonl'
+    path.write_text(''.join(json.dumps(record) + '\n\n' for record in RECORDS))
+
+    return str(path)
+
+
+def test_guard_stream_matches_guard_all():
+    results = [(i, repr(r)) for i, _, r in guard_stream(RECORDS, GUARDS)]
+
+    assert results == [(i, repr(guard_all(record, GUARDS))) for i, record in enumerate(RECORDS)]
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_jsonl_records_are_read_in_order(jsonl, use_mmap):
+    assert list(read_records(jsonl, chunksize=64, use_mmap=use_mmap)) == RECORDS
+
+
+def test_csv_columns_are_converted(tmp_path):
+    path = tmp_path / 'records.csv'
+    path.write_text('name,age\nJoe,20\nAnn,\n')
+
+    assert list(read_records(str(path), types={'age': int})) == [
+        {'name': 'Joe', 'age': 20},
+        {'name': 'Ann', 'age': None},
+    ]
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        list(read_records(str(tmp_path / 'records.txt')))
+
+
+def test_guard_file_matches_guard_stream(jsonl):
+    assert [repr(r) for _, _, r in guard_file(jsonl, GUARDS)] == [repr(r) for _, _, r in guard_stream(RECORDS, GUARDS)]
+
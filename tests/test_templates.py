@@ -0,0 +1,51 @@
+# -----------------------------------------------------------------------------
+# (C) 2023 Higor Grigorio (higorgrigorio@gmail.com)  (MIT License)
+# -----------------------------------------------------------------------------
+
+import pytest
+
+from olympus.monads.guards import Bound, Guards, check, guard
+
+
+def test_placeholders_are_bound_per_call():
+    statement = 'required|le[$limit]'
+
+    assert guard({'name': 'amount', 'value': 90}, statement, params={'limit': 100})
+    assert guard({'name': 'amount', 'value': 120}, statement, params={'limit': 100}).message == \
+        'amount must be less than or equal to 100'
+    assert guard({'name': 'amount', 'value': 120}, statement, params={'limit': 200})
+
+
+def test_missing_placeholder_raises():
+    with pytest.raises(KeyError):
+        check(1, 'amount', 'le[$limit]', params={})
+
+
+def test_container_changed_in_place_is_rebound():
+    allowed = ['a', 'b']
+
+    assert not check('z', 'code', 'in[$allowed]', params={'allowed': allowed})
+
+    allowed.append('z')
+
+    assert check('z', 'code', 'in[$allowed]', params={'allowed': allowed})
+
+
+def test_bound_guards_are_reused_and_evicted_least_recently_used():
+    template = Guards.template('in[$members]')
+    bound = next(g for g in template.guards if isinstance(g, Bound))
+    bound.bound.clear()
+
+    first = bound.bind({'members': ['a']})
+
+    assert bound.bind({'members': ['a']}) is first
+
+    for i in range(bound.maxsize - 1):
+        bound.bind({'members': [i]})
+
+    # a hit makes the first values the most recently used ones
+    bound.bind({'members': ['a']})
+    bound.bind({'members': ['new']})
+
+    assert bound.bind({'members': ['a']}) is first
+    assert len(bound.bound) == bound.maxsize